@@ -74,6 +74,9 @@ class IssueSerializer(BaseSerializer):
         except Exception:
             raise serializers.ValidationError("Invalid HTML passed")
 
+        return self.validate_relations(data)
+
+    def validate_relations(self, data):
         # Validate assignees are from project
         if data.get("assignees", []):
             data["assignees"] = ProjectMember.objects.filter(
@@ -252,6 +255,51 @@ class IssueSerializer(BaseSerializer):
         return data
 
 
+class IssueBulkSerializer(IssueSerializer):
+    """
+    Validates one issue of a bulk request. The project members, labels and
+    states are resolved once for the whole request and passed in the context.
+    """
+
+    assignees = serializers.ListField(
+        child=serializers.UUIDField(), write_only=True, required=False
+    )
+    labels = serializers.ListField(
+        child=serializers.UUIDField(), write_only=True, required=False
+    )
+
+    def validate_relations(self, data):
+        # Keep the assignees and labels of the project only
+        if data.get("assignees", []):
+            data["assignees"] = [
+                assignee_id
+                for assignee_id in data["assignees"]
+                if assignee_id in self.context["member_ids"]
+            ]
+
+        if data.get("labels", []):
+            data["labels"] = [
+                label_id
+                for label_id in data["labels"]
+                if label_id in self.context["label_ids"]
+            ]
+
+        if data.get("state") and data["state"].id not in self.context["state_ids"]:
+            raise serializers.ValidationError(
+                "State is not valid please pass a valid state_id"
+            )
+
+        if (
+            data.get("parent")
+            and data["parent"].workspace_id != self.context["workspace_id"]
+        ):
+            raise serializers.ValidationError(
+                "Parent is not valid issue_id please pass a valid issue_id"
+            )
+
+        return data
+
+
 class IssueLiteSerializer(BaseSerializer):
     class Meta:
         model = Issue
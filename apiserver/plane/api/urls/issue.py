@@ -2,6 +2,7 @@ from django.urls import path
 
 from plane.api.views import (
     IssueAPIEndpoint,
+    IssueBulkAPIEndpoint,
     LabelAPIEndpoint,
     IssueLinkAPIEndpoint,
     IssueCommentAPIEndpoint,
@@ -21,6 +22,11 @@ urlpatterns = [
         IssueAPIEndpoint.as_view(),
         name="issue",
     ),
+    path(
+        "workspaces/<str:slug>/projects/<uuid:project_id>/issues/bulk/",
+        IssueBulkAPIEndpoint.as_view(),
+        name="issue-bulk",
+    ),
     path(
         "workspaces/<str:slug>/projects/<uuid:project_id>/issues/<uuid:pk>/",
         IssueAPIEndpoint.as_view(),
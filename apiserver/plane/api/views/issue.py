@@ -1,10 +1,11 @@
 # Python imports
 import json
+from itertools import count
 
 from django.core.serializers.json import DjangoJSONEncoder
 
 # Django imports
-from django.db import IntegrityError
+from django.db import IntegrityError, transaction
 from django.db.models import (
     Case,
     CharField,
@@ -29,6 +30,7 @@ from rest_framework.parsers import MultiPartParser, FormParser
 from plane.api.serializers import (
     IssueAttachmentSerializer,
     IssueActivitySerializer,
+    IssueBulkSerializer,
     IssueCommentSerializer,
     IssueLinkSerializer,
     IssueSerializer,
@@ -39,21 +41,39 @@ from plane.app.permissions import (
     ProjectLitePermission,
     ProjectMemberPermission,
 )
-from plane.bgtasks.issue_activities_task import issue_activity
+from plane.bgtasks.issue_activities_task import bulk_issue_activity, issue_activity
+from plane.utils.issue_counters import (
+    refresh_issue_counters,
+    refresh_issue_counters_with_parents,
+)
 from plane.db.models import (
     Issue,
     IssueActivity,
+    IssueAssignee,
     FileAsset,
     IssueComment,
+    IssueLabel,
     IssueLink,
+    IssueSequence,
+    IssueType,
     Label,
     Project,
+    ProjectIssueSequence,
     ProjectMember,
     CycleIssue,
+    State,
 )
+from plane.utils.html_processor import strip_tags
+from plane.utils.issue_filters import filter_valid_uuids
 
 from .base import BaseAPIView
 
+# Most issues a bulk request can create or update
+ISSUE_BULK_LIMIT = 500
+
+# Owner of an external id claimed by an issue the request creates
+CLAIMED_BY_NEW_ISSUE = object()
+
 
 class WorkspaceIssueAPIEndpoint(BaseAPIView):
     """
@@ -300,6 +320,7 @@ class IssueAPIEndpoint(BaseAPIView):
                 )
 
             serializer.save()
+            refresh_issue_counters_with_parents([serializer.data["id"]])
             # Refetch the issue
             issue = Issue.objects.filter(
                 workspace__slug=slug, project_id=project_id, pk=serializer.data["id"]
@@ -349,6 +370,7 @@ class IssueAPIEndpoint(BaseAPIView):
                 # Get the requested data, encode it as django object and pass it
                 # to serializer to validation
                 requested_data = json.dumps(self.request.data, cls=DjangoJSONEncoder)
+                old_parent_id = issue.parent_id
                 serializer = IssueSerializer(
                     issue,
                     data=request.data,
@@ -362,6 +384,7 @@ class IssueAPIEndpoint(BaseAPIView):
                     # If the serializer is valid, save the issue and dispatch
                     # the update issue activity worker event.
                     serializer.save()
+                    refresh_issue_counters_with_parents([issue.id, old_parent_id])
                     issue_activity.delay(
                         type="issue.activity.updated",
                         requested_data=requested_data,
@@ -396,6 +419,7 @@ class IssueAPIEndpoint(BaseAPIView):
                 # issue activity worker event as created
                 if serializer.is_valid():
                     serializer.save()
+                    refresh_issue_counters_with_parents([serializer.data["id"]])
                     # Refetch the issue
                     issue = Issue.objects.filter(
                         workspace__slug=slug,
@@ -438,6 +462,7 @@ class IssueAPIEndpoint(BaseAPIView):
             IssueSerializer(issue).data, cls=DjangoJSONEncoder
         )
         requested_data = json.dumps(self.request.data, cls=DjangoJSONEncoder)
+        old_parent_id = issue.parent_id
         serializer = IssueSerializer(
             issue,
             data=request.data,
@@ -466,6 +491,7 @@ class IssueAPIEndpoint(BaseAPIView):
                 )
 
             serializer.save()
+            refresh_issue_counters_with_parents([pk, old_parent_id])
             issue_activity.delay(
                 type="issue.activity.updated",
                 requested_data=requested_data,
@@ -497,6 +523,7 @@ class IssueAPIEndpoint(BaseAPIView):
             IssueSerializer(issue).data, cls=DjangoJSONEncoder
         )
         issue.delete()
+        refresh_issue_counters([issue.parent_id])
         issue_activity.delay(
             type="issue.activity.deleted",
             requested_data=json.dumps({"issue_id": str(pk)}),
@@ -509,6 +536,396 @@ class IssueAPIEndpoint(BaseAPIView):
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
+class IssueBulkAPIEndpoint(BaseAPIView):
+    """
+    Create or update up to `ISSUE_BULK_LIMIT` issues of a project in one
+    request. Every issue gets its own result, the valid ones are written
+    together and tracked by a single activity job.
+    """
+
+    model = Issue
+    webhook_event = "issue"
+    permission_classes = [ProjectEntityPermission]
+
+    def get_issues(self, request):
+        issues = request.data.get("issues")
+        if not isinstance(issues, list) or not 0 < len(issues) <= ISSUE_BULK_LIMIT:
+            return None
+        return issues
+
+    def get_context(self, project):
+        # Resolved once so the issues are validated without further queries
+        return {
+            "project_id": project.id,
+            "workspace_id": project.workspace_id,
+            "default_assignee_id": project.default_assignee_id,
+            "member_ids": set(
+                ProjectMember.objects.filter(
+                    project_id=project.id, is_active=True
+                ).values_list("member_id", flat=True)
+            ),
+            "label_ids": set(
+                Label.objects.filter(project_id=project.id).values_list(
+                    "id", flat=True
+                )
+            ),
+            "state_ids": set(
+                State.objects.filter(project_id=project.id).values_list(
+                    "id", flat=True
+                )
+            ),
+        }
+
+    def get_external_ids(self, project_id, issues):
+        """The issues of the project already holding the requested external ids"""
+        keys = {
+            (item.get("external_source"), str(item.get("external_id")))
+            for item in issues
+            if isinstance(item, dict)
+            and item.get("external_id")
+            and item.get("external_source")
+        }
+        if not keys:
+            return {}
+        return {
+            (external_source, external_id): issue_id
+            for issue_id, external_source, external_id in Issue.objects.filter(
+                project_id=project_id,
+                external_source__in={key[0] for key in keys},
+                external_id__in={key[1] for key in keys},
+            ).values_list("id", "external_source", "external_id")
+        }
+
+    def external_conflict(self, item, external_ids, issue_id=None):
+        """Claim the external id of the item, return the conflict if it is taken"""
+        if not (item.get("external_id") and item.get("external_source")):
+            return None
+        key = (item.get("external_source"), str(item.get("external_id")))
+        owner = external_ids.get(key)
+        # Only the existing issue holding the external id may keep it
+        if owner is not None and (issue_id is None or owner != issue_id):
+            return {
+                "status": status.HTTP_409_CONFLICT,
+                "error": (
+                    "Issue with the same external id and external source "
+                    "already exists"
+                ),
+                "id": None if owner is CLAIMED_BY_NEW_ISSUE else str(owner),
+            }
+        # Later items of the request cannot reuse it
+        external_ids[key] = CLAIMED_BY_NEW_ISSUE if issue_id is None else issue_id
+        return None
+
+    def bulk_relations(self, issues, assignees, labels):
+        """Insert the assignees and labels of every issue at once"""
+        IssueAssignee.objects.bulk_create(
+            [
+                IssueAssignee(
+                    assignee_id=assignee_id,
+                    issue=issue,
+                    project_id=issue.project_id,
+                    workspace_id=issue.workspace_id,
+                    created_by_id=issue.created_by_id,
+                    updated_by_id=issue.updated_by_id,
+                )
+                for issue in issues
+                for assignee_id in assignees.get(issue.id, [])
+            ],
+            batch_size=1000,
+        )
+        IssueLabel.objects.bulk_create(
+            [
+                IssueLabel(
+                    label_id=label_id,
+                    issue=issue,
+                    project_id=issue.project_id,
+                    workspace_id=issue.workspace_id,
+                    created_by_id=issue.created_by_id,
+                    updated_by_id=issue.updated_by_id,
+                )
+                for issue in issues
+                for label_id in labels.get(issue.id, [])
+            ],
+            batch_size=1000,
+        )
+
+    def create_issues(self, request, project, context, valid):
+        default_type = IssueType.objects.filter(
+            project_issue_types__project_id=project.id, is_default=True
+        ).first()
+        default_state = (
+            State.objects.filter(~Q(is_triage=True), project_id=project.id)
+            .order_by("-default")
+            .first()
+        )
+
+        # One block of sequences and one sort order lookup per state
+        sequence_id = ProjectIssueSequence.reserve(project.id, len(valid))
+        sort_orders = {}
+
+        issues, created_at, assignees, labels = [], {}, {}, {}
+        for (_, _, data), sequence_id in zip(valid, count(sequence_id)):
+            data = dict(data)
+            issue_assignees = data.pop("assignees", None)
+            issue_labels = data.pop("labels", None)
+            issue_type = data.pop("type", None) or default_type
+            issue_created_at = data.pop("created_at", None)
+            created_by = data.pop("created_by", None)
+            # Assigned here like Issue.save does for a single issue
+            data.pop("sequence_id", None)
+
+            issue = Issue(
+                **data,
+                project_id=project.id,
+                workspace_id=project.workspace_id,
+                type=issue_type,
+                sequence_id=sequence_id,
+            )
+            if issue.state is None:
+                issue.state = default_state
+            elif issue.state.group == "completed":
+                issue.completed_at = timezone.now()
+
+            if issue.state_id not in sort_orders:
+                sort_orders[issue.state_id] = Issue.objects.filter(
+                    project_id=project.id, state_id=issue.state_id
+                ).aggregate(largest=Max("sort_order"))["largest"]
+            if sort_orders[issue.state_id] is not None:
+                issue.sort_order = sort_orders[issue.state_id] + 10000
+            sort_orders[issue.state_id] = issue.sort_order
+
+            issue.description_stripped = (
+                None
+                if not issue.description_html
+                else strip_tags(issue.description_html)
+            )
+            issue.created_by_id = created_by.id if created_by else request.user.id
+            issue.updated_by_id = request.user.id
+            issues.append(issue)
+
+            if issue_created_at:
+                created_at[issue.id] = issue_created_at
+            if issue_assignees:
+                assignees[issue.id] = issue_assignees
+            elif context["default_assignee_id"] is not None:
+                assignees[issue.id] = [context["default_assignee_id"]]
+            if issue_labels:
+                labels[issue.id] = issue_labels
+
+        Issue.objects.bulk_create(issues, batch_size=500)
+        IssueSequence.objects.bulk_create(
+            [
+                IssueSequence(
+                    issue=issue,
+                    sequence=issue.sequence_id,
+                    project_id=project.id,
+                    workspace_id=project.workspace_id,
+                )
+                for issue in issues
+            ],
+            batch_size=1000,
+        )
+        self.bulk_relations(issues, assignees, labels)
+
+        # The insert stamps the current time, keep the imported creation dates
+        backdated = [issue for issue in issues if issue.id in created_at]
+        for issue in backdated:
+            issue.created_at = created_at[issue.id]
+        Issue.objects.bulk_update(backdated, ["created_at"], batch_size=500)
+        return issues
+
+    def update_issues(self, valid):
+        issues, assignees, labels = [], {}, {}
+        for _, _, serializer in valid:
+            issue_assignees = serializer.validated_data.pop("assignees", None)
+            issue_labels = serializer.validated_data.pop("labels", None)
+            issue = serializer.save()
+            issues.append(issue)
+            if issue_assignees is not None:
+                assignees[issue.id] = issue_assignees
+            if issue_labels is not None:
+                labels[issue.id] = issue_labels
+
+        # Replace the assignees and labels sent with the issues
+        IssueAssignee.objects.filter(issue_id__in=assignees.keys()).delete()
+        IssueLabel.objects.filter(issue_id__in=labels.keys()).delete()
+        self.bulk_relations(issues, assignees, labels)
+        return issues
+
+    def post(self, request, slug, project_id):
+        issues = self.get_issues(request)
+        if issues is None:
+            return Response(
+                {"error": f"issues should be a list of 1 to {ISSUE_BULK_LIMIT} issues"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        project = Project.objects.get(pk=project_id, workspace__slug=slug)
+        context = self.get_context(project)
+        external_ids = self.get_external_ids(project_id, issues)
+
+        results = []
+        valid = []
+        for index, item in enumerate(issues):
+            serializer = IssueBulkSerializer(data=item, context=context)
+            if not serializer.is_valid():
+                results.append(
+                    {
+                        "index": index,
+                        "status": status.HTTP_400_BAD_REQUEST,
+                        "errors": serializer.errors,
+                    }
+                )
+                continue
+            conflict = self.external_conflict(item, external_ids)
+            if conflict:
+                results.append({"index": index, **conflict})
+                continue
+            valid.append((index, item, serializer.validated_data))
+
+        created = []
+        if valid:
+            with transaction.atomic():
+                created = self.create_issues(request, project, context, valid)
+            refresh_issue_counters_with_parents([issue.id for issue in created])
+
+            # Track all the issues with one activity job
+            bulk_issue_activity.delay(
+                type="issue.activity.created",
+                activities=[
+                    {
+                        "issue_id": str(issue.id),
+                        "requested_data": json.dumps(item, cls=DjangoJSONEncoder),
+                        "current_instance": None,
+                    }
+                    for (_, item, _), issue in zip(valid, created)
+                ],
+                actor_id=str(request.user.id),
+                project_id=str(project_id),
+                epoch=int(timezone.now().timestamp()),
+            )
+
+        for (index, _, _), issue in zip(valid, created):
+            results.append(
+                {
+                    "index": index,
+                    "status": status.HTTP_201_CREATED,
+                    "id": str(issue.id),
+                    "sequence_id": issue.sequence_id,
+                    "external_id": issue.external_id,
+                }
+            )
+
+        return Response(
+            {"results": sorted(results, key=lambda result: result["index"])},
+            status=(
+                status.HTTP_201_CREATED
+                if len(created) == len(issues)
+                else status.HTTP_207_MULTI_STATUS
+            ),
+        )
+
+    def patch(self, request, slug, project_id):
+        issues = self.get_issues(request)
+        if issues is None:
+            return Response(
+                {"error": f"issues should be a list of 1 to {ISSUE_BULK_LIMIT} issues"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        project = Project.objects.get(pk=project_id, workspace__slug=slug)
+        context = self.get_context(project)
+        external_ids = self.get_external_ids(project_id, issues)
+        instances = {
+            str(issue.id): issue
+            for issue in Issue.objects.filter(
+                project_id=project_id,
+                pk__in=filter_valid_uuids(
+                    [str(item.get("id")) for item in issues if isinstance(item, dict)]
+                ),
+            )
+            .select_related("state")
+            .prefetch_related("assignees", "labels")
+        }
+
+        results = []
+        valid = []
+        current_instances = {}
+        old_parent_ids = []
+        for index, item in enumerate(issues):
+            issue = (
+                instances.get(str(item.get("id"))) if isinstance(item, dict) else None
+            )
+            if issue is None:
+                results.append(
+                    {
+                        "index": index,
+                        "status": status.HTTP_404_NOT_FOUND,
+                        "error": "The requested resource does not exist.",
+                    }
+                )
+                continue
+            serializer = IssueBulkSerializer(
+                issue, data=item, context=context, partial=True
+            )
+            if not serializer.is_valid():
+                results.append(
+                    {
+                        "index": index,
+                        "status": status.HTTP_400_BAD_REQUEST,
+                        "errors": serializer.errors,
+                    }
+                )
+                continue
+            conflict = self.external_conflict(item, external_ids, issue.id)
+            if conflict:
+                results.append({"index": index, **conflict})
+                continue
+
+            current_instances[issue.id] = json.dumps(
+                IssueSerializer(issue).data, cls=DjangoJSONEncoder
+            )
+            old_parent_ids.append(issue.parent_id)
+            valid.append((index, item, serializer))
+
+        updated = []
+        if valid:
+            with transaction.atomic():
+                updated = self.update_issues(valid)
+            refresh_issue_counters_with_parents(
+                [*(issue.id for issue in updated), *old_parent_ids]
+            )
+
+            bulk_issue_activity.delay(
+                type="issue.activity.updated",
+                activities=[
+                    {
+                        "issue_id": str(issue.id),
+                        "requested_data": json.dumps(item, cls=DjangoJSONEncoder),
+                        "current_instance": current_instances[issue.id],
+                    }
+                    for (_, item, _), issue in zip(valid, updated)
+                ],
+                actor_id=str(request.user.id),
+                project_id=str(project_id),
+                epoch=int(timezone.now().timestamp()),
+            )
+
+        for (index, _, _), issue in zip(valid, updated):
+            results.append(
+                {"index": index, "status": status.HTTP_200_OK, "id": str(issue.id)}
+            )
+
+        return Response(
+            {"results": sorted(results, key=lambda result: result["index"])},
+            status=(
+                status.HTTP_200_OK
+                if len(updated) == len(issues)
+                else status.HTTP_207_MULTI_STATUS
+            ),
+        )
+
+
 class LabelAPIEndpoint(BaseAPIView):
     """
     This viewset automatically provides `list`, `create`, `retrieve`,
@@ -676,6 +1093,7 @@ class IssueLinkAPIEndpoint(BaseAPIView):
         serializer = IssueLinkSerializer(data=request.data)
         if serializer.is_valid():
             serializer.save(project_id=project_id, issue_id=issue_id)
+            refresh_issue_counters([issue_id])
 
             link = IssueLink.objects.get(pk=serializer.data["id"])
             link.created_by_id = request.data.get("created_by", request.user.id)
@@ -732,6 +1150,7 @@ class IssueLinkAPIEndpoint(BaseAPIView):
             epoch=int(timezone.now().timestamp()),
         )
         issue_link.delete()
+        refresh_issue_counters([issue_id])
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
@@ -971,6 +1390,7 @@ class IssueAttachmentEndpoint(BaseAPIView):
 
         if serializer.is_valid():
             serializer.save(project_id=project_id, issue_id=issue_id)
+            refresh_issue_counters([issue_id])
             issue_activity.delay(
                 type="attachment.activity.created",
                 requested_data=None,
@@ -989,6 +1409,7 @@ class IssueAttachmentEndpoint(BaseAPIView):
         issue_attachment = FileAsset.objects.get(pk=pk)
         issue_attachment.asset.delete(save=False)
         issue_attachment.delete()
+        refresh_issue_counters([issue_id])
         issue_activity.delay(
             type="attachment.activity.deleted",
             requested_data=None,
@@ -32,6 +32,7 @@ from plane.db.models import (
 )
 
 from .base import BaseAPIView
+from plane.utils.cache import bump_project_revision
 from plane.bgtasks.webhook_task import model_activity
 
 
@@ -284,6 +285,7 @@ class ModuleAPIEndpoint(BaseAPIView):
         module.delete()
         # Delete the module issues
         ModuleIssue.objects.filter(module=pk, project_id=project_id).delete()
+        bump_project_revision(project_id)
         # Delete the user favorite module
         UserFavorite.objects.filter(
             entity_type="module", entity_identifier=pk, project_id=project_id
@@ -2,7 +2,7 @@
 from rest_framework.permissions import SAFE_METHODS, BasePermission
 
 # Module import
-from plane.db.models import ProjectMember, WorkspaceMember
+from plane.utils.membership import is_project_member, project_role, workspace_role
 from .base import ROLE
 
 
@@ -13,27 +13,22 @@ class ProjectBasePermission(BasePermission):
 
         ## Safe Methods -> Handle the filtering logic in queryset
         if request.method in SAFE_METHODS:
-            return WorkspaceMember.objects.filter(
-                workspace__slug=view.workspace_slug, member=request.user, is_active=True
-            ).exists()
+            return workspace_role(request, view.workspace_slug) is not None
 
         ## Only workspace owners or admins can create the projects
         if request.method == "POST":
-            return WorkspaceMember.objects.filter(
-                workspace__slug=view.workspace_slug,
-                member=request.user,
-                role__in=[ROLE.ADMIN.value, ROLE.MEMBER.value, ROLE.VIEWER.value, ROLE.RESTRICTED.value],
-                is_active=True,
-            ).exists()
+            return workspace_role(request, view.workspace_slug) in [
+                ROLE.ADMIN.value,
+                ROLE.MEMBER.value,
+                ROLE.VIEWER.value,
+                ROLE.RESTRICTED.value,
+            ]
 
         ## Only Project Admins can update project attributes
-        return ProjectMember.objects.filter(
-            workspace__slug=view.workspace_slug,
-            member=request.user,
-            role=ROLE.ADMIN.value,
-            project_id=view.project_id,
-            is_active=True,
-        ).exists()
+        return (
+            project_role(request, view.workspace_slug, view.project_id)
+            == ROLE.ADMIN.value
+        )
 
 
 class ProjectMemberPermission(BasePermission):
@@ -43,26 +38,19 @@ class ProjectMemberPermission(BasePermission):
 
         ## Safe Methods -> Handle the filtering logic in queryset
         if request.method in SAFE_METHODS:
-            return ProjectMember.objects.filter(
-                workspace__slug=view.workspace_slug, member=request.user, is_active=True
-            ).exists()
+            return is_project_member(request, view.workspace_slug)
         ## Only workspace owners or admins can create the projects
         if request.method == "POST":
-            return WorkspaceMember.objects.filter(
-                workspace__slug=view.workspace_slug,
-                member=request.user,
-                role__in=[ROLE.ADMIN.value, ROLE.MEMBER.value],
-                is_active=True,
-            ).exists()
+            return workspace_role(request, view.workspace_slug) in [
+                ROLE.ADMIN.value,
+                ROLE.MEMBER.value,
+            ]
 
         ## Only Project Admins can update project attributes
-        return ProjectMember.objects.filter(
-            workspace__slug=view.workspace_slug,
-            member=request.user,
-            role__in=[ROLE.ADMIN.value, ROLE.MEMBER.value],
-            project_id=view.project_id,
-            is_active=True,
-        ).exists()
+        return project_role(request, view.workspace_slug, view.project_id) in [
+            ROLE.ADMIN.value,
+            ROLE.MEMBER.value,
+        ]
 
 
 class ProjectEntityPermission(BasePermission):
@@ -73,30 +61,26 @@ class ProjectEntityPermission(BasePermission):
         # Handle requests based on project__identifier
         if hasattr(view, "project__identifier") and view.project__identifier:
             if request.method in SAFE_METHODS:
-                return ProjectMember.objects.filter(
-                    workspace__slug=view.workspace_slug,
-                    member=request.user,
-                    project__identifier=view.project__identifier,
-                    is_active=True,
-                ).exists()
+                return (
+                    project_role(
+                        request,
+                        view.workspace_slug,
+                        identifier=view.project__identifier,
+                    )
+                    is not None
+                )
 
         ## Safe Methods -> Handle the filtering logic in queryset
         if request.method in SAFE_METHODS:
-            return ProjectMember.objects.filter(
-                workspace__slug=view.workspace_slug,
-                member=request.user,
-                project_id=view.project_id,
-                is_active=True,
-            ).exists()
+            return (
+                project_role(request, view.workspace_slug, view.project_id) is not None
+            )
 
         ## Only project members or admins can create and edit the project attributes
-        return ProjectMember.objects.filter(
-            workspace__slug=view.workspace_slug,
-            member=request.user,
-            role__in=[ROLE.ADMIN.value, ROLE.MEMBER.value],
-            project_id=view.project_id,
-            is_active=True,
-        ).exists()
+        return project_role(request, view.workspace_slug, view.project_id) in [
+            ROLE.ADMIN.value,
+            ROLE.MEMBER.value,
+        ]
 
 
 class ProjectLitePermission(BasePermission):
@@ -104,9 +88,4 @@ class ProjectLitePermission(BasePermission):
         if request.user.is_anonymous:
             return False
 
-        return ProjectMember.objects.filter(
-            workspace__slug=view.workspace_slug,
-            member=request.user,
-            project_id=view.project_id,
-            is_active=True,
-        ).exists()
+        return project_role(request, view.workspace_slug, view.project_id) is not None
@@ -2,7 +2,7 @@
 from rest_framework.permissions import BasePermission, SAFE_METHODS
 
 # Module imports
-from plane.db.models import WorkspaceMember
+from plane.utils.membership import workspace_role
 
 from .base import ROLE
 
@@ -23,21 +23,16 @@ class WorkSpaceBasePermission(BasePermission):
 
         # allow only admins and owners to update the workspace settings
         if request.method in ["PUT", "PATCH"]:
-            return WorkspaceMember.objects.filter(
-                member=request.user,
-                workspace__slug=view.workspace_slug,
-                role__in=[ROLE.ADMIN.value, ROLE.MEMBER.value, ROLE.VIEWER.value, ROLE.RESTRICTED.value],
-                is_active=True,
-            ).exists()
+            return workspace_role(request, view.workspace_slug) in [
+                ROLE.ADMIN.value,
+                ROLE.MEMBER.value,
+                ROLE.VIEWER.value,
+                ROLE.RESTRICTED.value,
+            ]
 
         # allow only owner to delete the workspace
         if request.method == "DELETE":
-            return WorkspaceMember.objects.filter(
-                member=request.user,
-                workspace__slug=view.workspace_slug,
-                role=ROLE.ADMIN.value,
-                is_active=True,
-            ).exists()
+            return workspace_role(request, view.workspace_slug) == ROLE.ADMIN.value
 
 
 class WorkspaceOwnerPermission(BasePermission):
@@ -45,9 +40,7 @@ class WorkspaceOwnerPermission(BasePermission):
         if request.user.is_anonymous:
             return False
 
-        return WorkspaceMember.objects.filter(
-            workspace__slug=view.workspace_slug, member=request.user, role=Admin
-        ).exists()
+        return workspace_role(request, view.workspace_slug) == ROLE.ADMIN.value
 
 
 class WorkSpaceAdminPermission(BasePermission):
@@ -55,12 +48,10 @@ class WorkSpaceAdminPermission(BasePermission):
         if request.user.is_anonymous:
             return False
 
-        return WorkspaceMember.objects.filter(
-            member=request.user,
-            workspace__slug=view.workspace_slug,
-            role__in=[ROLE.ADMIN.value, ROLE.MEMBER.value],
-            is_active=True,
-        ).exists()
+        return workspace_role(request, view.workspace_slug) in [
+            ROLE.ADMIN.value,
+            ROLE.MEMBER.value,
+        ]
 
 
 class WorkspaceEntityPermission(BasePermission):
@@ -70,16 +61,12 @@ class WorkspaceEntityPermission(BasePermission):
 
         ## Safe Methods -> Handle the filtering logic in queryset
         if request.method in SAFE_METHODS:
-            return WorkspaceMember.objects.filter(
-                workspace__slug=view.workspace_slug, member=request.user, is_active=True
-            ).exists()
+            return workspace_role(request, view.workspace_slug) is not None
 
-        return WorkspaceMember.objects.filter(
-            member=request.user,
-            workspace__slug=view.workspace_slug,
-            role__in=[ROLE.ADMIN.value, ROLE.MEMBER.value],
-            is_active=True,
-        ).exists()
+        return workspace_role(request, view.workspace_slug) in [
+            ROLE.ADMIN.value,
+            ROLE.MEMBER.value,
+        ]
 
 
 class WorkspaceViewerPermission(BasePermission):
@@ -87,9 +74,7 @@ class WorkspaceViewerPermission(BasePermission):
         if request.user.is_anonymous:
             return False
 
-        return WorkspaceMember.objects.filter(
-            member=request.user, workspace__slug=view.workspace_slug, is_active=True
-        ).exists()
+        return workspace_role(request, view.workspace_slug) is not None
 
 
 class WorkspaceUserPermission(BasePermission):
@@ -97,6 +82,4 @@ class WorkspaceUserPermission(BasePermission):
         if request.user.is_anonymous:
             return False
 
-        return WorkspaceMember.objects.filter(
-            member=request.user, workspace__slug=view.workspace_slug, is_active=True
-        ).exists()
+        return workspace_role(request, view.workspace_slug) is not None
@@ -21,6 +21,7 @@ from plane.app.views import (
     BulkArchiveIssuesEndpoint,
     DeletedIssuesListViewSet,
     IssuePaginatedViewSet,
+    IssueSyncEndpoint,
     IssueDetailEndpoint,
     IssueAttachmentV2Endpoint,
     IssueBulkUpdateDateEndpoint,
@@ -49,6 +50,11 @@ urlpatterns = [
         IssuePaginatedViewSet.as_view({"get": "list"}),
         name="project-issues-paginated",
     ),
+    path(
+        "workspaces/<str:slug>/projects/<uuid:project_id>/issues/sync/",
+        IssueSyncEndpoint.as_view(),
+        name="project-issues-sync",
+    ),
     path(
         "workspaces/<str:slug>/projects/<uuid:project_id>/issues/<uuid:pk>/",
         IssueViewSet.as_view(
@@ -4,7 +4,9 @@ from django.urls import path
 from plane.app.views import (
     NotificationViewSet,
     UnreadNotificationEndpoint,
+    UnreadNotificationStreamEndpoint,
     MarkAllReadNotificationViewSet,
+    BulkNotificationStateEndpoint,
     UserNotificationPreferenceEndpoint,
 )
 
@@ -37,11 +39,21 @@ urlpatterns = [
         UnreadNotificationEndpoint.as_view(),
         name="unread-notifications",
     ),
+    path(
+        "workspaces/<str:slug>/users/notifications/unread/stream/",
+        UnreadNotificationStreamEndpoint.as_view(),
+        name="unread-notifications-stream",
+    ),
     path(
         "workspaces/<str:slug>/users/notifications/mark-all-read/",
         MarkAllReadNotificationViewSet.as_view({"post": "create"}),
         name="mark-all-read-notifications",
     ),
+    path(
+        "workspaces/<str:slug>/users/notifications/bulk/",
+        BulkNotificationStateEndpoint.as_view(),
+        name="bulk-notifications",
+    ),
     path(
         "users/me/notification-preferences/",
         UserNotificationPreferenceEndpoint.as_view(),
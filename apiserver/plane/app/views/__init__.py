@@ -109,6 +109,7 @@ from .issue.base import (
     BulkDeleteIssuesEndpoint,
     DeletedIssuesListViewSet,
     IssuePaginatedViewSet,
+    IssueSyncEndpoint,
     IssueDetailEndpoint,
     IssueBulkUpdateDateEndpoint,
 )
@@ -187,6 +188,7 @@ from .analytic.base import (
 from .notification.base import (
     NotificationViewSet,
     UnreadNotificationEndpoint,
+    UnreadNotificationStreamEndpoint,
     UserNotificationPreferenceEndpoint,
 )
 
@@ -203,5 +205,8 @@ from .dashboard.base import DashboardEndpoint, WidgetsEndpoint
 
 from .error_404 import custom_404_view
 
-from .notification.base import MarkAllReadNotificationViewSet
+from .notification.base import (
+    BulkNotificationStateEndpoint,
+    MarkAllReadNotificationViewSet,
+)
 from .user.base import AccountEndpoint, ProfileEndpoint, UserSessionEndpoint
@@ -16,7 +16,8 @@ from plane.app.serializers import AnalyticViewSerializer
 from plane.app.views.base import BaseAPIView, BaseViewSet
 from plane.bgtasks.analytic_plot_export import analytic_export_task
 from plane.db.models import AnalyticView, Issue, Workspace
-from plane.utils.analytics_plot import build_graph_plot
+from plane.utils.analytics_plot import build_graph_plot, build_rollup_graph_plot
+from plane.utils.analytics_rollup import rollup_project_ids, rollup_total_issues
 from plane.utils.issue_filters import issue_filters
 from plane.app.permissions import allow_permission, ROLE
 
@@ -80,16 +81,27 @@ class AnalyticsEndpoint(BaseAPIView):
         # Additional filters that need to be applied
         filters = issue_filters(request.GET, "GET")
 
-        # Get the issues for the workspace with the additional filters applied
-        queryset = Issue.issue_objects.filter(workspace__slug=slug, **filters)
+        # Read the graph from the analytics rollup when it covers the request
+        distribution = None
+        project_ids = rollup_project_ids(slug, filters)
+        if project_ids is not None:
+            distribution = build_rollup_graph_plot(
+                project_ids=project_ids, x_axis=x_axis, y_axis=y_axis, segment=segment
+            )
 
-        # Get the total issue count
-        total_issues = queryset.count()
+        if distribution is not None:
+            total_issues = rollup_total_issues(project_ids)
+        else:
+            # Get the issues for the workspace with the additional filters applied
+            queryset = Issue.issue_objects.filter(workspace__slug=slug, **filters)
 
-        # Build the graph payload
-        distribution = build_graph_plot(
-            queryset=queryset, x_axis=x_axis, y_axis=y_axis, segment=segment
-        )
+            # Get the total issue count
+            total_issues = queryset.count()
+
+            # Build the graph payload
+            distribution = build_graph_plot(
+                queryset=queryset, x_axis=x_axis, y_axis=y_axis, segment=segment
+            )
 
         state_details = {}
         if x_axis in ["state_id"] or segment in ["state_id"]:
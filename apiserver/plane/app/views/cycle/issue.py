@@ -3,7 +3,7 @@ import json
 
 # Django imports
 from django.core import serializers
-from django.db.models import F, Func, OuterRef, Q, Subquery
+from django.db.models import F, Func, OuterRef, Q
 from django.utils import timezone
 from django.utils.decorators import method_decorator
 from django.views.decorators.gzip import gzip_page
@@ -17,13 +17,14 @@ from rest_framework.response import Response
 from .. import BaseViewSet
 from plane.app.serializers import CycleIssueSerializer
 from plane.bgtasks.issue_activities_task import issue_activity
-from plane.db.models import Cycle, CycleIssue, Issue, FileAsset, IssueLink
+from plane.db.models import Cycle, CycleIssue, Issue
 from plane.utils.grouper import (
     issue_group_values,
     issue_on_results,
     issue_queryset_grouper,
 )
 from plane.utils.issue_filters import issue_filters
+from plane.utils.issue_counters import issue_counter_annotations, refresh_issue_counters
 from plane.utils.order_queryset import order_issue_queryset
 from plane.utils.paginator import GroupedOffsetPaginator, SubGroupedOffsetPaginator
 from plane.app.permissions import allow_permission, ROLE
@@ -87,34 +88,7 @@ class CycleIssueViewSet(BaseViewSet):
                 "assignees", "labels", "issue_module__module", "issue_cycle__cycle"
             )
             .filter(**filters)
-            .annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(
-                        issue=OuterRef("id"), deleted_at__isnull=True
-                    ).values("cycle_id")[:1]
-                )
-            )
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            .annotate(**issue_counter_annotations())
         )
         filters = issue_filters(request.query_params, "GET")
 
@@ -280,6 +254,7 @@ class CycleIssueViewSet(BaseViewSet):
 
         # Update the cycle issues
         CycleIssue.objects.bulk_update(updated_records, ["cycle_id"], batch_size=100)
+        refresh_issue_counters(issues)
         # Capture Issue Activity
         issue_activity.delay(
             type="cycle.activity.created",
@@ -326,4 +301,5 @@ class CycleIssueViewSet(BaseViewSet):
             origin=request.META.get("HTTP_ORIGIN"),
         )
         cycle_issue.delete()
+        refresh_issue_counters([issue_id])
         return Response(status=status.HTTP_204_NO_CONTENT)
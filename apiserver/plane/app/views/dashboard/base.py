@@ -7,7 +7,6 @@ from django.db.models import (
     Count,
     Exists,
     F,
-    Func,
     IntegerField,
     JSONField,
     OuterRef,
@@ -36,15 +35,13 @@ from plane.db.models import (
     DashboardWidget,
     Issue,
     IssueActivity,
-    FileAsset,
-    IssueLink,
     IssueRelation,
     Project,
     Widget,
     WorkspaceMember,
-    CycleIssue,
 )
 from plane.utils.issue_filters import issue_filters
+from plane.utils.issue_counters import issue_counter_annotations
 
 # Module imports
 from .. import BaseAPIView
@@ -192,34 +189,7 @@ def dashboard_assigned_issues(self, request, slug):
                 ).select_related("issue"),
             )
         )
-        .annotate(
-            cycle_id=Subquery(
-                CycleIssue.objects.filter(
-                    issue=OuterRef("id"), deleted_at__isnull=True
-                ).values("cycle_id")[:1]
-            )
-        )
-        .annotate(
-            link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-            .order_by()
-            .annotate(count=Func(F("id"), function="Count"))
-            .values("count")
-        )
-        .annotate(
-            attachment_count=FileAsset.objects.filter(
-                issue_id=OuterRef("id"),
-                entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-            )
-            .order_by()
-            .annotate(count=Func(F("id"), function="Count"))
-            .values("count")
-        )
-        .annotate(
-            sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-            .order_by()
-            .annotate(count=Func(F("id"), function="Count"))
-            .values("count")
-        )
+        .annotate(**issue_counter_annotations())
         .annotate(
             label_ids=Coalesce(
                 ArrayAgg(
@@ -364,34 +334,7 @@ def dashboard_created_issues(self, request, slug):
         .filter(**filters)
         .select_related("workspace", "project", "state", "parent")
         .prefetch_related("assignees", "labels", "issue_module__module")
-        .annotate(
-            cycle_id=Subquery(
-                CycleIssue.objects.filter(
-                    issue=OuterRef("id"), deleted_at__isnull=True
-                ).values("cycle_id")[:1]
-            )
-        )
-        .annotate(
-            link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-            .order_by()
-            .annotate(count=Func(F("id"), function="Count"))
-            .values("count")
-        )
-        .annotate(
-            attachment_count=FileAsset.objects.filter(
-                issue_id=OuterRef("id"),
-                entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-            )
-            .order_by()
-            .annotate(count=Func(F("id"), function="Count"))
-            .values("count")
-        )
-        .annotate(
-            sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-            .order_by()
-            .annotate(count=Func(F("id"), function="Count"))
-            .values("count")
-        )
+        .annotate(**issue_counter_annotations())
         .annotate(
             label_ids=Coalesce(
                 ArrayAgg(
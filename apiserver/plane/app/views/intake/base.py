@@ -3,7 +3,7 @@ import json
 
 # Django import
 from django.utils import timezone
-from django.db.models import Q, Count, OuterRef, Func, F, Prefetch, Subquery
+from django.db.models import Q, Count, Prefetch
 from django.core.serializers.json import DjangoJSONEncoder
 from django.contrib.postgres.aggregates import ArrayAgg
 from django.contrib.postgres.fields import ArrayField
@@ -22,11 +22,8 @@ from plane.db.models import (
     IntakeIssue,
     Issue,
     State,
-    IssueLink,
-    FileAsset,
     Project,
     ProjectMember,
-    CycleIssue,
 )
 from plane.app.serializers import (
     IssueCreateSerializer,
@@ -36,6 +33,7 @@ from plane.app.serializers import (
     IntakeIssueDetailSerializer,
 )
 from plane.utils.issue_filters import issue_filters
+from plane.utils.issue_counters import issue_counter_annotations
 from plane.bgtasks.issue_activities_task import issue_activity
 
 
@@ -105,34 +103,7 @@ class IntakeIssueViewSet(BaseViewSet):
                     ),
                 )
             )
-            .annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(
-                        issue=OuterRef("id"), deleted_at__isnull=True
-                    ).values("cycle_id")[:1]
-                )
-            )
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            .annotate(**issue_counter_annotations())
             .annotate(
                 label_ids=Coalesce(
                     ArrayAgg(
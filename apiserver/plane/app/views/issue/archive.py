@@ -3,7 +3,7 @@ import json
 
 # Django imports
 from django.core.serializers.json import DjangoJSONEncoder
-from django.db.models import F, Func, OuterRef, Q, Prefetch, Exists, Subquery
+from django.db.models import F, Func, OuterRef, Q, Prefetch, Exists
 from django.utils import timezone
 from django.utils.decorators import method_decorator
 from django.views.decorators.gzip import gzip_page
@@ -21,11 +21,9 @@ from plane.app.serializers import (
 from plane.bgtasks.issue_activities_task import issue_activity
 from plane.db.models import (
     Issue,
-    FileAsset,
     IssueLink,
     IssueSubscriber,
     IssueReaction,
-    CycleIssue,
 )
 from plane.utils.grouper import (
     issue_group_values,
@@ -33,6 +31,8 @@ from plane.utils.grouper import (
     issue_queryset_grouper,
 )
 from plane.utils.issue_filters import issue_filters
+from plane.utils.issue_counters import issue_counter_annotations, refresh_issue_counters
+from plane.utils.cache import bump_project_revision
 from plane.utils.order_queryset import order_issue_queryset
 from plane.utils.paginator import GroupedOffsetPaginator, SubGroupedOffsetPaginator
 from plane.app.permissions import allow_permission, ROLE
@@ -60,34 +60,7 @@ class IssueArchiveViewSet(BaseViewSet):
             .filter(workspace__slug=self.kwargs.get("slug"))
             .select_related("workspace", "project", "state", "parent")
             .prefetch_related("assignees", "labels", "issue_module__module")
-            .annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(
-                        issue=OuterRef("id"), deleted_at__isnull=True
-                    ).values("cycle_id")[:1]
-                )
-            )
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            .annotate(**issue_counter_annotations())
         )
 
     @method_decorator(gzip_page)
@@ -275,6 +248,7 @@ class IssueArchiveViewSet(BaseViewSet):
         )
         issue.archived_at = timezone.now().date()
         issue.save()
+        refresh_issue_counters([issue.parent_id])
 
         return Response(
             {"archived_at": str(issue.archived_at)}, status=status.HTTP_200_OK
@@ -303,6 +277,7 @@ class IssueArchiveViewSet(BaseViewSet):
         )
         issue.archived_at = None
         issue.save()
+        refresh_issue_counters([issue.parent_id])
 
         return Response(status=status.HTTP_204_NO_CONTENT)
 
@@ -350,6 +325,8 @@ class BulkArchiveIssuesEndpoint(BaseAPIView):
             issue.archived_at = timezone.now().date()
             bulk_archive_issues.append(issue)
         Issue.objects.bulk_update(bulk_archive_issues, ["archived_at"])
+        refresh_issue_counters([issue.parent_id for issue in bulk_archive_issues])
+        bump_project_revision(project_id)
 
         return Response(
             {"archived_at": str(timezone.now().date())}, status=status.HTTP_200_OK
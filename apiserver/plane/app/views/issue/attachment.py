@@ -24,6 +24,7 @@ from plane.bgtasks.issue_activities_task import issue_activity
 from plane.app.permissions import allow_permission, ROLE
 from plane.settings.storage import S3Storage
 from plane.bgtasks.storage_metadata_task import get_asset_object_metadata
+from plane.utils.issue_counters import refresh_issue_counters
 
 
 class IssueAttachmentEndpoint(BaseAPIView):
@@ -177,6 +178,7 @@ class IssueAttachmentEndpoint(BaseAPIView):
                 workspace_id=workspace.id,
                 entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
             )
+            refresh_issue_counters([issue_id])
             issue_activity.delay(
                 type="attachment.activity.created",
                 requested_data=None,
@@ -196,6 +198,7 @@ class IssueAttachmentEndpoint(BaseAPIView):
         issue_attachment = FileAsset.objects.get(pk=pk)
         issue_attachment.asset.delete(save=False)
         issue_attachment.delete()
+        refresh_issue_counters([issue_id])
         issue_activity.delay(
             type="attachment.activity.deleted",
             requested_data=None,
@@ -400,6 +403,7 @@ class IssueAttachmentV2Endpoint(BaseAPIView):
             project_id=project_id,
             entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
         )
+        refresh_issue_counters([issue_id])
 
         # Get the presigned URL
         storage = S3Storage(request=request)
@@ -426,6 +430,7 @@ class IssueAttachmentV2Endpoint(BaseAPIView):
         issue_attachment.is_deleted = True
         issue_attachment.deleted_at = timezone.now()
         issue_attachment.save()
+        refresh_issue_counters([issue_id])
 
         issue_activity.delay(
             type="attachment.activity.deleted",
@@ -516,6 +521,7 @@ class IssueAttachmentV2Endpoint(BaseAPIView):
                         # 파일 삭제
                         storage.delete_object(issue_attachment.asset)
                         issue_attachment.delete()
+                        refresh_issue_counters([issue_id])
                         
                         return Response(
                             {
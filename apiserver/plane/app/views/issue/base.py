@@ -33,24 +33,35 @@ from plane.app.serializers import (
     IssueUserPropertySerializer,
     IssueSerializer,
 )
+from plane.bgtasks.analytics_rollup_task import schedule_analytics_rollup
 from plane.bgtasks.issue_activities_task import issue_activity
 from plane.db.models import (
     Issue,
     FileAsset,
+    IssueAssignee,
     IssueLink,
     IssueUserProperty,
     IssueReaction,
     IssueSubscriber,
     Project,
-    ProjectMember,
     CycleIssue,
+    IssueSyncVersion,
+    ProjectSyncVersion,
 )
 from plane.utils.grouper import (
     issue_group_values,
     issue_on_results,
     issue_queryset_grouper,
 )
+from plane.utils.cache import bump_project_revision
 from plane.utils.issue_filters import issue_filters
+from plane.utils.issue_counters import (
+    issue_counter_annotations,
+    refresh_issue_counters,
+    refresh_issue_counters_with_parents,
+)
+from plane.utils.issue_sync import record_issue_changes
+from plane.utils.membership import project_role
 from plane.utils.order_queryset import order_issue_queryset
 from plane.utils.paginator import GroupedOffsetPaginator, SubGroupedOffsetPaginator
 from .. import BaseAPIView, BaseViewSet
@@ -79,34 +90,7 @@ class IssueListEndpoint(BaseAPIView):
             .filter(workspace__slug=self.kwargs.get("slug"))
             .select_related("workspace", "project", "state", "parent")
             .prefetch_related("assignees", "labels", "issue_module__module")
-            .annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(
-                        issue=OuterRef("id"), deleted_at__isnull=True
-                    ).values("cycle_id")[:1]
-                )
-            )
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            .annotate(**issue_counter_annotations())
         ).distinct()
 
         filters = issue_filters(request.query_params, "GET")
@@ -196,34 +180,7 @@ class IssueViewSet(BaseViewSet):
             .filter(workspace__slug=self.kwargs.get("slug"))
             .select_related("workspace", "project", "state", "parent")
             .prefetch_related("assignees", "labels", "issue_module__module")
-            .annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(
-                        issue=OuterRef("id"), deleted_at__isnull=True
-                    ).values("cycle_id")[:1]
-                )
-            )
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            .annotate(**issue_counter_annotations())
         ).distinct()
 
     @method_decorator(gzip_page)
@@ -240,14 +197,9 @@ class IssueViewSet(BaseViewSet):
         # })
 
         # 사용자 역할 확인
-        user_role = ProjectMember.objects.filter(
-            workspace__slug=slug,
-            project_id=project_id,
-            member=request.user,
-            is_active=True,
-        ).first()
+        user_role = project_role(request, slug, project_id)
 
-        # print("User Role:", user_role.role if user_role else None)
+        # print("User Role:", user_role)
 
         extra_filters = {}
         if request.GET.get("updated_at__gt", None) is not None:
@@ -263,7 +215,7 @@ class IssueViewSet(BaseViewSet):
         issue_queryset = self.get_queryset()
         
         # RESTRICTED 사용자는 자신에게 할당된 이슈만 볼 수 있음
-        if user_role and user_role.role == ROLE.RESTRICTED.value:
+        if user_role == ROLE.RESTRICTED.value:
             issue_queryset = issue_queryset.filter(assignees__id=request.user.id)
             # print("Restricted User - Filtering by assignee:", request.user.id)
 
@@ -340,13 +292,7 @@ class IssueViewSet(BaseViewSet):
             user_id=request.user.id,
         )
         if (
-            ProjectMember.objects.filter(
-                workspace__slug=slug,
-                project_id=project_id,
-                member=request.user,
-                role=5,
-                is_active=True,
-            ).exists()
+            project_role(request, slug, project_id) == ROLE.GUEST.value
             and not project.guest_view_all_features
         ):
             issue_queryset = issue_queryset.filter(created_by=request.user)
@@ -443,6 +389,7 @@ class IssueViewSet(BaseViewSet):
 
         if serializer.is_valid():
             serializer.save()
+            refresh_issue_counters_with_parents([serializer.data.get("id", None)])
 
             # Track the issue
             issue_activity.delay(
@@ -524,12 +471,7 @@ class IssueViewSet(BaseViewSet):
         project = Project.objects.get(pk=project_id, workspace__slug=slug)
         
         # 사용자 역할 확인
-        user_role = ProjectMember.objects.filter(
-            workspace__slug=slug,
-            project_id=project_id,
-            member=request.user,
-            is_active=True,
-        ).first()
+        user_role = project_role(request, slug, project_id)
 
         issue = (
             Issue.objects.filter(project_id=self.kwargs.get("project_id"))
@@ -633,7 +575,7 @@ class IssueViewSet(BaseViewSet):
             )
 
         # RESTRICTED 사용자는 자신에게 할당된 이슈만 볼 수 있음
-        if user_role and user_role.role == ROLE.RESTRICTED.value:
+        if user_role == ROLE.RESTRICTED.value:
             if request.user.id not in issue.assignee_ids:
                 return Response(
                     {"error": "You can only view issues assigned to you"},
@@ -642,13 +584,7 @@ class IssueViewSet(BaseViewSet):
         
         # GUEST 권한 체크 (기존 로직 유지)
         if (
-            ProjectMember.objects.filter(
-                workspace__slug=slug,
-                project_id=project_id,
-                member=request.user,
-                role=5,
-                is_active=True,
-            ).exists()
+            project_role(request, slug, project_id) == ROLE.GUEST.value
             and not project.guest_view_all_features
             and not issue.created_by == request.user
         ):
@@ -723,14 +659,9 @@ class IssueViewSet(BaseViewSet):
             )
 
         # VIEWER와 RESTRICTED 역할 체크
-        user_role = ProjectMember.objects.filter(
-            workspace__slug=slug,
-            project_id=project_id,
-            member=request.user,
-            is_active=True,
-        ).first()
+        user_role = project_role(request, slug, project_id)
 
-        if user_role and user_role.role in [ROLE.VIEWER.value, ROLE.RESTRICTED.value]:
+        if user_role in [ROLE.VIEWER.value, ROLE.RESTRICTED.value]:
             # 자신에게 할당된 이슈인지 확인
             if request.user.id not in issue.assignee_ids:
                 return Response(
@@ -743,9 +674,12 @@ class IssueViewSet(BaseViewSet):
         )
 
         requested_data = json.dumps(self.request.data, cls=DjangoJSONEncoder)
+        # The previous parent loses the issue when it is re parented
+        old_parent_id = issue.parent_id
         serializer = IssueCreateSerializer(issue, data=request.data, partial=True)
         if serializer.is_valid():
             serializer.save()
+            refresh_issue_counters_with_parents([pk, old_parent_id])
             issue_activity.delay(
                 type="issue.activity.updated",
                 requested_data=requested_data,
@@ -774,6 +708,7 @@ class IssueViewSet(BaseViewSet):
         issue = Issue.objects.get(workspace__slug=slug, project_id=project_id, pk=pk)
 
         issue.delete()
+        refresh_issue_counters([issue.parent_id])
         issue_activity.delay(
             type="issue.activity.deleted",
             requested_data=json.dumps({"issue_id": str(pk)}),
@@ -837,8 +772,15 @@ class BulkDeleteIssuesEndpoint(BaseAPIView):
             workspace__slug=slug, project_id=project_id, pk__in=issue_ids
         )
 
-        total_issues = len(issues)
+        # The soft delete clears the result cache, read the issues before it
+        issue_ids = [issue.id for issue in issues]
+        parent_ids = [issue.parent_id for issue in issues]
+        total_issues = len(issue_ids)
         issues.delete()
+        refresh_issue_counters(parent_ids)
+        record_issue_changes(project_id, issue_ids)
+        bump_project_revision(project_id)
+        schedule_analytics_rollup(project_id, issue_ids)
 
         return Response(
             {"message": f"{total_issues} issues were deleted"},
@@ -874,34 +816,7 @@ class IssuePaginatedViewSet(BaseViewSet):
         return (
             issue_queryset.select_related("workspace", "project", "state", "parent")
             .prefetch_related("assignees", "labels", "issue_module__module")
-            .annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(
-                        issue=OuterRef("id"), deleted_at__isnull=True
-                    ).values("cycle_id")[:1]
-                )
-            )
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            .annotate(**issue_counter_annotations())
         ).distinct()
 
     def process_paginated_result(self, fields, results, timezone):
@@ -964,14 +879,10 @@ class IssuePaginatedViewSet(BaseViewSet):
 
         # validation for guest user
         project = Project.objects.get(pk=project_id, workspace__slug=slug)
-        project_member = ProjectMember.objects.filter(
-            workspace__slug=slug,
-            project_id=project_id,
-            member=request.user,
-            role=5,
-            is_active=True,
-        )
-        if project_member.exists() and not project.guest_view_all_features:
+        if (
+            project_role(request, slug, project_id) == ROLE.GUEST.value
+            and not project.guest_view_all_features
+        ):
             base_queryset = base_queryset.filter(created_by=request.user)
             queryset = queryset.filter(created_by=request.user)
 
@@ -1030,6 +941,165 @@ class IssuePaginatedViewSet(BaseViewSet):
         return Response(paginated_data, status=status.HTTP_200_OK)
 
 
+class IssueSyncEndpoint(BaseAPIView):
+    """
+    Delta sync of the issues of a project. The cursor is the last project
+    version the client has seen, every page returns the issues changed after
+    it and tombstones for the ones that were deleted, archived or hidden.
+    """
+
+    # required fields
+    sync_fields = [
+        "id",
+        "name",
+        "state_id",
+        "state__group",
+        "sort_order",
+        "completed_at",
+        "estimate_point",
+        "priority",
+        "start_date",
+        "target_date",
+        "sequence_id",
+        "project_id",
+        "parent_id",
+        "cycle_id",
+        "created_at",
+        "updated_at",
+        "created_by",
+        "updated_by",
+        "is_draft",
+        "archived_at",
+        "module_ids",
+        "label_ids",
+        "assignee_ids",
+        "link_count",
+        "attachment_count",
+        "sub_issues_count",
+    ]
+
+    @allow_permission(
+        [ROLE.ADMIN, ROLE.MEMBER, ROLE.VIEWER, ROLE.RESTRICTED, ROLE.GUEST]
+    )
+    def get(self, request, slug, project_id):
+        try:
+            since = int(request.GET.get("cursor", 0))
+            per_page = min(int(request.GET.get("per_page", 1000)), 1000)
+        except ValueError:
+            return Response(
+                {"error": "Invalid cursor"}, status=status.HTTP_400_BAD_REQUEST
+            )
+
+        # Version the project issues on its first sync
+        purged_version = (
+            ProjectSyncVersion.objects.filter(project_id=project_id)
+            .values_list("purged_version", flat=True)
+            .first()
+        )
+        if purged_version is None:
+            record_issue_changes(project_id, [])
+        elif 0 < since < purged_version:
+            # Tombstones the client has not seen were hard deleted
+            return Response(
+                {"error": "The cursor is too old, sync again from the start"},
+                status=status.HTTP_410_GONE,
+            )
+
+        changes = list(
+            IssueSyncVersion.objects.filter(project_id=project_id, version__gt=since)
+            .order_by("version")
+            .values_list("issue_id", "version")[: per_page + 1]
+        )
+        has_more = len(changes) > per_page
+        changes = changes[:per_page]
+        issue_ids = [issue_id for issue_id, _ in changes]
+
+        queryset = (
+            Issue.issue_objects.filter(project_id=project_id, pk__in=issue_ids)
+            .annotate(**issue_counter_annotations())
+            .annotate(
+                label_ids=Coalesce(
+                    ArrayAgg(
+                        "labels__id",
+                        distinct=True,
+                        filter=Q(
+                            ~Q(labels__id__isnull=True)
+                            & Q(label_issue__deleted_at__isnull=True)
+                        ),
+                    ),
+                    Value([], output_field=ArrayField(UUIDField())),
+                ),
+                assignee_ids=Coalesce(
+                    ArrayAgg(
+                        "assignees__id",
+                        distinct=True,
+                        filter=Q(
+                            ~Q(assignees__id__isnull=True)
+                            & Q(assignees__member_project__is_active=True)
+                            & Q(issue_assignee__deleted_at__isnull=True)
+                        ),
+                    ),
+                    Value([], output_field=ArrayField(UUIDField())),
+                ),
+                module_ids=Coalesce(
+                    ArrayAgg(
+                        "issue_module__module_id",
+                        distinct=True,
+                        filter=Q(
+                            ~Q(issue_module__module_id__isnull=True)
+                            & Q(issue_module__module__archived_at__isnull=True)
+                            & Q(issue_module__deleted_at__isnull=True)
+                        ),
+                    ),
+                    Value([], output_field=ArrayField(UUIDField())),
+                ),
+            )
+        )
+
+        # validation for guest user
+        tombstones = Issue.all_objects.filter(
+            project_id=project_id, pk__in=issue_ids
+        )
+        project = Project.objects.get(pk=project_id, workspace__slug=slug)
+        role = project_role(request, slug, project_id)
+        if role == ROLE.GUEST.value and not project.guest_view_all_features:
+            queryset = queryset.filter(created_by=request.user)
+            tombstones = tombstones.filter(created_by=request.user)
+        # Restricted members only see the issues assigned to them, the ones
+        # they were unassigned from are sent as deleted
+        elif role == ROLE.RESTRICTED.value:
+            queryset = queryset.filter(
+                pk__in=IssueAssignee.objects.filter(
+                    issue_id__in=issue_ids,
+                    assignee=request.user,
+                    deleted_at__isnull=True,
+                ).values("issue_id")
+            )
+
+        issues = user_timezone_converter(
+            queryset.values(*self.sync_fields),
+            ["created_at", "updated_at"],
+            request.user.user_timezone,
+        )
+        # Everything changed that is no longer listed has to be dropped
+        live_ids = {issue["id"] for issue in issues}
+        deleted = [
+            str(issue_id)
+            for issue_id in tombstones.values_list("id", flat=True)
+            if issue_id not in live_ids
+        ]
+
+        return Response(
+            {
+                "cursor": str(changes[-1][1] if changes else since),
+                "has_more": has_more,
+                "results": issues,
+                "deleted": deleted,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
 class IssueDetailEndpoint(BaseAPIView):
     @allow_permission([ROLE.ADMIN, ROLE.MEMBER, ROLE.GUEST])
     def get(self, request, slug, project_id):
@@ -1194,6 +1264,7 @@ class IssueBulkUpdateDateEndpoint(BaseAPIView):
 
         # Bulk update issues
         Issue.objects.bulk_update(issues_to_update, ["start_date", "target_date"])
+        bump_project_revision(project_id)
 
         return Response(
             {"message": "Issues updated successfully"}, status=status.HTTP_200_OK
@@ -15,6 +15,7 @@ from plane.app.serializers import IssueLinkSerializer
 from plane.app.permissions import ProjectEntityPermission
 from plane.db.models import IssueLink
 from plane.bgtasks.issue_activities_task import issue_activity
+from plane.utils.issue_counters import refresh_issue_counters
 
 
 class IssueLinkViewSet(BaseViewSet):
@@ -43,6 +44,7 @@ class IssueLinkViewSet(BaseViewSet):
         serializer = IssueLinkSerializer(data=request.data)
         if serializer.is_valid():
             serializer.save(project_id=project_id, issue_id=issue_id)
+            refresh_issue_counters([issue_id])
             issue_activity.delay(
                 type="link.activity.created",
                 requested_data=json.dumps(serializer.data, cls=DjangoJSONEncoder),
@@ -101,4 +103,5 @@ class IssueLinkViewSet(BaseViewSet):
             origin=request.META.get("HTTP_ORIGIN"),
         )
         issue_link.delete()
+        refresh_issue_counters([issue_id])
         return Response(status=status.HTTP_204_NO_CONTENT)
@@ -3,7 +3,7 @@ import json
 
 # Django imports
 from django.utils import timezone
-from django.db.models import OuterRef, Func, F, Q, Value, UUIDField, Subquery
+from django.db.models import F, Q, Value, UUIDField
 from django.utils.decorators import method_decorator
 from django.views.decorators.gzip import gzip_page
 from django.contrib.postgres.aggregates import ArrayAgg
@@ -18,9 +18,10 @@ from rest_framework import status
 from .. import BaseAPIView
 from plane.app.serializers import IssueSerializer
 from plane.app.permissions import ProjectEntityPermission
-from plane.db.models import Issue, IssueLink, FileAsset, CycleIssue
+from plane.db.models import Issue
 from plane.bgtasks.issue_activities_task import issue_activity
 from plane.utils.user_timezone_converter import user_timezone_converter
+from plane.utils.issue_counters import issue_counter_annotations, refresh_issue_counters
 from collections import defaultdict
 
 
@@ -33,34 +34,7 @@ class SubIssuesEndpoint(BaseAPIView):
             Issue.issue_objects.filter(parent_id=issue_id, workspace__slug=slug)
             .select_related("workspace", "project", "state", "parent")
             .prefetch_related("assignees", "labels", "issue_module__module")
-            .annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(
-                        issue=OuterRef("id"), deleted_at__isnull=True
-                    ).values("cycle_id")[:1]
-                )
-            )
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            .annotate(**issue_counter_annotations())
             .annotate(
                 label_ids=Coalesce(
                     ArrayAgg(
@@ -155,11 +129,14 @@ class SubIssuesEndpoint(BaseAPIView):
             )
 
         sub_issues = Issue.issue_objects.filter(id__in=sub_issue_ids)
+        # The previous parents lose the sub issues
+        old_parent_ids = [sub_issue.parent_id for sub_issue in sub_issues]
 
         for sub_issue in sub_issues:
             sub_issue.parent = parent_issue
 
         _ = Issue.objects.bulk_update(sub_issues, ["parent"], batch_size=10)
+        refresh_issue_counters([issue_id, *old_parent_ids])
 
         updated_sub_issues = Issue.issue_objects.filter(id__in=sub_issue_ids).annotate(
             state_group=F("state__group")
@@ -55,6 +55,7 @@ from plane.db.models import (
     ModuleUserProperties,
     Project,
 )
+from plane.utils.cache import bump_project_revision
 from plane.utils.analytics_plot import burndown_plot
 from plane.utils.user_timezone_converter import user_timezone_converter
 from plane.bgtasks.webhook_task import model_activity
@@ -801,6 +802,7 @@ class ModuleViewSet(BaseViewSet):
         module.delete()
         # Delete the module issues
         ModuleIssue.objects.filter(module=pk, project_id=project_id).delete()
+        bump_project_revision(project_id)
         # Delete the user favorite module
         UserFavorite.objects.filter(
             user=request.user,
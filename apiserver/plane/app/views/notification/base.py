@@ -1,6 +1,8 @@
 # Django imports
+from django.http import StreamingHttpResponse
 from django.db.models import Exists, OuterRef, Q, Case, When, BooleanField
 from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 
 # Third party imports
 from rest_framework import status
@@ -18,6 +20,18 @@ from plane.db.models import (
     UserNotificationPreference,
     WorkspaceMember,
 )
+from plane.utils.notification_counters import (
+    counter_field,
+    get_notification_counters,
+    invalidate_notification_counters,
+    notification_counter_events,
+    track_notification_change,
+    unread_notifications_response,
+)
+from plane.utils.notification_state import (
+    NOTIFICATION_ACTIONS,
+    transition_notifications,
+)
 from plane.utils.paginator import BasePaginator
 from plane.app.permissions import allow_permission, ROLE
 
@@ -165,6 +179,19 @@ class NotificationViewSet(BaseViewSet, BasePaginator):
         serializer = NotificationSerializer(notifications, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
+    def transition(self, request, slug, pk, action):
+        notification = Notification.objects.get(
+            receiver=request.user, workspace__slug=slug, pk=pk
+        )
+        previous = counter_field(notification)
+        if transition_notifications(
+            Notification.objects.filter(pk=notification.pk), action
+        ):
+            notification.refresh_from_db()
+            track_notification_change(notification, previous, slug)
+        serializer = NotificationSerializer(notification)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
     @allow_permission(
         allowed_roles=[ROLE.ADMIN, ROLE.MEMBER, ROLE.VIEWER, ROLE.RESTRICTED,ROLE.GUEST],
         level="WORKSPACE",
@@ -173,6 +200,7 @@ class NotificationViewSet(BaseViewSet, BasePaginator):
         notification = Notification.objects.get(
             workspace__slug=slug, pk=pk, receiver=request.user
         )
+        previous = counter_field(notification)
         # Only read_at and snoozed_till can be updated
         notification_data = {"snoozed_till": request.data.get("snoozed_till", None)}
         serializer = NotificationSerializer(
@@ -181,6 +209,7 @@ class NotificationViewSet(BaseViewSet, BasePaginator):
 
         if serializer.is_valid():
             serializer.save()
+            track_notification_change(notification, previous, slug)
             return Response(serializer.data, status=status.HTTP_200_OK)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
@@ -188,49 +217,25 @@ class NotificationViewSet(BaseViewSet, BasePaginator):
         allowed_roles=[ROLE.ADMIN, ROLE.MEMBER, ROLE.VIEWER, ROLE.RESTRICTED,ROLE.GUEST], level="WORKSPACE"
     )
     def mark_read(self, request, slug, pk):
-        notification = Notification.objects.get(
-            receiver=request.user, workspace__slug=slug, pk=pk
-        )
-        notification.read_at = timezone.now()
-        notification.save()
-        serializer = NotificationSerializer(notification)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return self.transition(request, slug, pk, "read")
 
     @allow_permission(
         allowed_roles=[ROLE.ADMIN, ROLE.MEMBER, ROLE.VIEWER, ROLE.RESTRICTED,ROLE.GUEST], level="WORKSPACE"
     )
     def mark_unread(self, request, slug, pk):
-        notification = Notification.objects.get(
-            receiver=request.user, workspace__slug=slug, pk=pk
-        )
-        notification.read_at = None
-        notification.save()
-        serializer = NotificationSerializer(notification)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return self.transition(request, slug, pk, "unread")
 
     @allow_permission(
         allowed_roles=[ROLE.ADMIN, ROLE.MEMBER, ROLE.VIEWER, ROLE.RESTRICTED,ROLE.GUEST], level="WORKSPACE"
     )
     def archive(self, request, slug, pk):
-        notification = Notification.objects.get(
-            receiver=request.user, workspace__slug=slug, pk=pk
-        )
-        notification.archived_at = timezone.now()
-        notification.save()
-        serializer = NotificationSerializer(notification)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return self.transition(request, slug, pk, "archive")
 
     @allow_permission(
         allowed_roles=[ROLE.ADMIN, ROLE.MEMBER, ROLE.VIEWER, ROLE.RESTRICTED,ROLE.GUEST], level="WORKSPACE"
     )
     def unarchive(self, request, slug, pk):
-        notification = Notification.objects.get(
-            receiver=request.user, workspace__slug=slug, pk=pk
-        )
-        notification.archived_at = None
-        notification.save()
-        serializer = NotificationSerializer(notification)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return self.transition(request, slug, pk, "unarchive")
 
 
 class UnreadNotificationEndpoint(BaseAPIView):
@@ -239,104 +244,145 @@ class UnreadNotificationEndpoint(BaseAPIView):
         level="WORKSPACE",
     )
     def get(self, request, slug):
-        # Watching Issues Count
-        unread_notifications_count = (
-            Notification.objects.filter(
-                workspace__slug=slug,
-                receiver_id=request.user.id,
-                read_at__isnull=True,
-                archived_at__isnull=True,
-                snoozed_till__isnull=True,
-            )
-            .exclude(sender__icontains="mentioned")
-            .count()
+        counters = get_notification_counters(request.user.id, slug)
+        return Response(
+            unread_notifications_response(counters), status=status.HTTP_200_OK
         )
 
-        mention_notifications_count = Notification.objects.filter(
-            workspace__slug=slug,
-            receiver_id=request.user.id,
-            read_at__isnull=True,
-            archived_at__isnull=True,
-            snoozed_till__isnull=True,
-            sender__icontains="mentioned",
-        ).count()
 
-        return Response(
-            {
-                "total_unread_notifications_count": int(unread_notifications_count),
-                "mention_unread_notifications_count": int(mention_notifications_count),
-            },
-            status=status.HTTP_200_OK,
+class UnreadNotificationStreamEndpoint(BaseAPIView):
+    @allow_permission(
+        allowed_roles=[
+            ROLE.ADMIN,
+            ROLE.MEMBER,
+            ROLE.VIEWER,
+            ROLE.RESTRICTED,
+            ROLE.GUEST,
+        ],
+        level="WORKSPACE",
+    )
+    def get(self, request, slug):
+        response = StreamingHttpResponse(
+            notification_counter_events(request.user.id, slug),
+            content_type="text/event-stream",
+        )
+        response["Cache-Control"] = "no-cache"
+        # Keep the proxy from buffering the events
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+
+def filter_notifications(request, slug, notifications):
+    """Narrow the notifications by the snoozed, archived and type filters"""
+    snoozed = request.data.get("snoozed", False)
+    archived = request.data.get("archived", False)
+    type = request.data.get("type", "all")
+
+    # Filter for snoozed notifications
+    if snoozed:
+        notifications = notifications.filter(
+            Q(snoozed_till__lt=timezone.now()) | Q(snoozed_till__isnull=False)
+        )
+    else:
+        notifications = notifications.filter(
+            Q(snoozed_till__gte=timezone.now()) | Q(snoozed_till__isnull=True)
         )
 
+    # Filter for archived or unarchive
+    if archived:
+        notifications = notifications.filter(archived_at__isnull=False)
+    else:
+        notifications = notifications.filter(archived_at__isnull=True)
+
+    # Subscribed issues
+    if type == "watching":
+        issue_ids = IssueSubscriber.objects.filter(
+            workspace__slug=slug, subscriber_id=request.user.id
+        ).values_list("issue_id", flat=True)
+        notifications = notifications.filter(entity_identifier__in=issue_ids)
+
+    # Assigned Issues
+    if type == "assigned":
+        issue_ids = IssueAssignee.objects.filter(
+            workspace__slug=slug, assignee_id=request.user.id
+        ).values_list("issue_id", flat=True)
+        notifications = notifications.filter(entity_identifier__in=issue_ids)
+
+    # Created issues
+    if type == "created":
+        if WorkspaceMember.objects.filter(
+            workspace__slug=slug, member=request.user, role__lt=15, is_active=True
+        ).exists():
+            notifications = Notification.objects.none()
+        else:
+            issue_ids = Issue.objects.filter(
+                workspace__slug=slug, created_by=request.user
+            ).values_list("pk", flat=True)
+            notifications = notifications.filter(entity_identifier__in=issue_ids)
+
+    return notifications
+
 
 class MarkAllReadNotificationViewSet(BaseViewSet):
     @allow_permission(
         allowed_roles=[ROLE.ADMIN, ROLE.MEMBER, ROLE.VIEWER, ROLE.RESTRICTED,ROLE.GUEST], level="WORKSPACE"
     )
     def create(self, request, slug):
-        snoozed = request.data.get("snoozed", False)
-        archived = request.data.get("archived", False)
-        type = request.data.get("type", "all")
-
-        notifications = (
+        notifications = filter_notifications(
+            request,
+            slug,
             Notification.objects.filter(
                 workspace__slug=slug, receiver_id=request.user.id, read_at__isnull=True
-            )
-            .select_related("workspace", "project", "triggered_by", "receiver")
-            .order_by("snoozed_till", "-created_at")
+            ),
         )
+        if transition_notifications(notifications, "read"):
+            invalidate_notification_counters(request.user.id, slug)
+        return Response({"message": "Successful"}, status=status.HTTP_200_OK)
 
-        # Filter for snoozed notifications
-        if snoozed:
-            notifications = notifications.filter(
-                Q(snoozed_till__lt=timezone.now()) | Q(snoozed_till__isnull=False)
-            )
-        else:
-            notifications = notifications.filter(
-                Q(snoozed_till__gte=timezone.now()) | Q(snoozed_till__isnull=True)
-            )
-
-        # Filter for archived or unarchive
-        if archived:
-            notifications = notifications.filter(archived_at__isnull=False)
-        else:
-            notifications = notifications.filter(archived_at__isnull=True)
 
-        # Subscribed issues
-        if type == "watching":
-            issue_ids = IssueSubscriber.objects.filter(
-                workspace__slug=slug, subscriber_id=request.user.id
-            ).values_list("issue_id", flat=True)
-            notifications = notifications.filter(entity_identifier__in=issue_ids)
+class BulkNotificationStateEndpoint(BaseAPIView):
+    @allow_permission(
+        allowed_roles=[
+            ROLE.ADMIN,
+            ROLE.MEMBER,
+            ROLE.VIEWER,
+            ROLE.RESTRICTED,
+            ROLE.GUEST,
+        ],
+        level="WORKSPACE",
+    )
+    def post(self, request, slug):
+        action = request.data.get("action")
+        if action not in NOTIFICATION_ACTIONS:
+            return Response(
+                {"error": f"Action must be one of {', '.join(NOTIFICATION_ACTIONS)}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
-        # Assigned Issues
-        if type == "assigned":
-            issue_ids = IssueAssignee.objects.filter(
-                workspace__slug=slug, assignee_id=request.user.id
-            ).values_list("issue_id", flat=True)
-            notifications = notifications.filter(entity_identifier__in=issue_ids)
+        snoozed_till = request.data.get("snoozed_till", None)
+        if action == "snooze" and snoozed_till is not None:
+            snoozed_till = parse_datetime(str(snoozed_till))
+            if snoozed_till is None:
+                return Response(
+                    {"error": "Invalid snoozed_till datetime"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            if timezone.is_naive(snoozed_till):
+                snoozed_till = timezone.make_aware(snoozed_till)
 
-        # Created issues
-        if type == "created":
-            if WorkspaceMember.objects.filter(
-                workspace__slug=slug, member=request.user, role__lt=15, is_active=True
-            ).exists():
-                notifications = Notification.objects.none()
-            else:
-                issue_ids = Issue.objects.filter(
-                    workspace__slug=slug, created_by=request.user
-                ).values_list("pk", flat=True)
-                notifications = notifications.filter(entity_identifier__in=issue_ids)
-
-        updated_notifications = []
-        for notification in notifications:
-            notification.read_at = timezone.now()
-            updated_notifications.append(notification)
-        Notification.objects.bulk_update(
-            updated_notifications, ["read_at"], batch_size=100
+        notifications = Notification.objects.filter(
+            workspace__slug=slug, receiver_id=request.user.id
         )
-        return Response({"message": "Successful"}, status=status.HTTP_200_OK)
+        notification_ids = request.data.get("notification_ids", None)
+        if notification_ids is not None:
+            notifications = notifications.filter(pk__in=notification_ids)
+        else:
+            notifications = filter_notifications(request, slug, notifications)
+
+        updated = transition_notifications(notifications, action, snoozed_till)
+        if updated:
+            invalidate_notification_counters(request.user.id, slug)
+        return Response({"updated": updated}, status=status.HTTP_200_OK)
 
 
 class UserNotificationPreferenceEndpoint(BaseAPIView):
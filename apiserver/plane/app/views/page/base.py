@@ -1,12 +1,10 @@
 # Python imports
-import json
 import base64
 from datetime import datetime
-from django.core.serializers.json import DjangoJSONEncoder
 
 # Django imports
 from django.db import connection
-from django.db.models import Exists, OuterRef, Q, Value, UUIDField
+from django.db.models import Exists, F, OuterRef, Q, Value, UUIDField
 from django.utils.decorators import method_decorator
 from django.views.decorators.gzip import gzip_page
 from django.http import StreamingHttpResponse
@@ -41,6 +39,14 @@ from plane.bgtasks.page_version_task import page_version
 from plane.bgtasks.recent_visited_task import recent_visited_task
 
 
+def bump_description_revision(page):
+    """Move the page to its next description revision and return it"""
+    page.description_revision = F("description_revision") + 1
+    page.save(update_fields=["description_revision", "updated_at", "updated_by"])
+    page.refresh_from_db(fields=["description_revision"])
+    return page.description_revision
+
+
 def unarchive_archive_page_and_descendants(page_id, archived_at):
     # Your SQL query
     sql = """
@@ -128,7 +134,7 @@ class PageViewSet(BaseViewSet):
         if serializer.is_valid():
             serializer.save()
             # capture the page transaction
-            page_transaction.delay(request.data, None, serializer.data["id"])
+            page_transaction.delay(page_id=serializer.data["id"], revision=0)
             page = self.get_queryset().get(pk=serializer.data["id"])
             serializer = PageDetailSerializer(page)
             return Response(serializer.data, status=status.HTTP_201_CREATED)
@@ -169,14 +175,14 @@ class PageViewSet(BaseViewSet):
             if serializer.is_valid():
                 serializer.save()
                 # capture the page transaction
-                if request.data.get("description_html"):
-                    page_transaction.delay(
-                        new_value=request.data,
-                        old_value=json.dumps(
-                            {"description_html": page_description},
-                            cls=DjangoJSONEncoder,
-                        ),
-                        page_id=pk,
+                if request.data.get(
+                    "description_html"
+                ) and page_description != request.data.get("description_html"):
+                    # Versioned too, the new revision makes pending versions skip
+                    revision = bump_description_revision(page)
+                    page_transaction.delay(page_id=pk, revision=revision)
+                    page_version.delay(
+                        page_id=page.id, revision=revision, user_id=request.user.id
                     )
 
                 return Response(serializer.data, status=status.HTTP_200_OK)
@@ -547,11 +553,6 @@ class PagesDescriptionViewSet(BaseViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # Serialize the existing instance
-        existing_instance = json.dumps(
-            {"description_html": page.description_html}, cls=DjangoJSONEncoder
-        )
-
         # Get the base64 data from the request
         base64_data = request.data.get("description_binary")
 
@@ -559,22 +560,44 @@ class PagesDescriptionViewSet(BaseViewSet):
         if base64_data:
             # Decode the base64 data to bytes
             new_binary_data = base64.b64decode(base64_data)
-            # capture the page transaction
-            if request.data.get("description_html"):
-                page_transaction.delay(
-                    new_value=request.data, old_value=existing_instance, page_id=pk
-                )
+            description_html = request.data.get("description_html")
+            html_changed = description_html != page.description_html
+            # Autosaves of an unchanged document write nothing
+            if not html_changed and new_binary_data == bytes(
+                page.description_binary or b""
+            ):
+                return Response({"message": "Updated successfully"})
+
             # Store the updated binary data
             page.description_binary = new_binary_data
-            page.description_html = request.data.get("description_html")
+            page.description_html = description_html
             page.description = request.data.get("description")
-            page.save()
-            # Return a success response
-            page_version.delay(
-                page_id=page.id,
-                existing_instance=existing_instance,
-                user_id=request.user.id,
-            )
+            update_fields = [
+                "description_binary",
+                "description_html",
+                "description_stripped",
+                "description",
+                "updated_at",
+                "updated_by",
+            ]
+            # The tasks skip the revisions a later save replaced, so only the
+            # saves that queue them move the page to a new revision
+            if html_changed:
+                page.description_revision = F("description_revision") + 1
+                update_fields.append("description_revision")
+            page.save(update_fields=update_fields)
+            if html_changed:
+                page.refresh_from_db(fields=["description_revision"])
+                # The tasks read the page, only its revision goes to the broker
+                if description_html:
+                    page_transaction.delay(
+                        page_id=pk, revision=page.description_revision
+                    )
+                page_version.delay(
+                    page_id=page.id,
+                    revision=page.description_revision,
+                    user_id=request.user.id,
+                )
             return Response({"message": "Updated successfully"})
         else:
             return Response({"error": "No binary data provided"})
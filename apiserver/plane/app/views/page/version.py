@@ -18,9 +18,10 @@ class PageVersionEndpoint(BaseAPIView):
         # Check if pk is provided
         if pk:
             # Return a single page version
-            page_version = PageVersion.objects.get(
+            page_version = PageVersion.objects.select_related("base").get(
                 workspace__slug=slug, page_id=page_id, pk=pk
             )
+            page_version.resolve_description_html()
             # Serialize the page version
             serializer = PageVersionDetailSerializer(page_version)
             return Response(serializer.data, status=status.HTTP_200_OK)
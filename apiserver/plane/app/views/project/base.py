@@ -1,5 +1,4 @@
 # Python imports
-import boto3
 from django.conf import settings
 from django.utils import timezone
 import json
@@ -38,6 +37,7 @@ from plane.db.models import (
     Workspace,
     WorkspaceMember,
 )
+from plane.settings.storage import get_s3_client
 from plane.utils.cache import cache_response
 from plane.bgtasks.webhook_task import model_activity
 from plane.bgtasks.recent_visited_task import recent_visited_task
@@ -622,15 +622,13 @@ class ProjectPublicCoverImagesEndpoint(BaseAPIView):
     def get(self, request):
         files = []
         if settings.USE_MINIO:
-            s3 = boto3.client(
-                "s3",
+            s3 = get_s3_client(
                 endpoint_url=settings.AWS_S3_ENDPOINT_URL,
                 aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
                 aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
             )
         else:
-            s3 = boto3.client(
-                "s3",
+            s3 = get_s3_client(
                 aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
                 aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
             )
@@ -27,6 +27,7 @@ from plane.db.models import (
     WorkspaceMember,
     IssueUserProperty,
 )
+from plane.utils.membership import invalidate_memberships
 
 
 class ProjectInvitationsViewset(BaseViewSet):
@@ -163,6 +164,7 @@ class UserProjectInvitationsViewset(BaseViewSet):
             ],
             ignore_conflicts=True,
         )
+        invalidate_memberships(request.user.id)
 
         IssueUserProperty.objects.bulk_create(
             [
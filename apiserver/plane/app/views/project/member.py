@@ -19,6 +19,7 @@ from plane.app.permissions import (
 from plane.db.models import Project, ProjectMember, IssueUserProperty, WorkspaceMember
 from plane.bgtasks.project_add_user_email_task import project_add_user_email
 from plane.utils.host import base_host
+from plane.utils.membership import invalidate_memberships
 from plane.app.permissions.base import allow_permission, ROLE
 
 
@@ -154,6 +155,9 @@ class ProjectMemberViewSet(BaseViewSet):
             bulk_issue_props, batch_size=10, ignore_conflicts=True
         )
 
+        # Bulk writes skip the model signals, drop the cached roles here
+        invalidate_memberships(*member_roles)
+
         project_members = ProjectMember.objects.filter(
             project_id=project_id,
             member_id__in=[member.get("member_id") for member in members],
@@ -1,6 +1,3 @@
-# Python imports
-import re
-
 # Django imports
 from django.db.models import Q, OuterRef, Subquery, Value, UUIDField, CharField
 from django.contrib.postgres.aggregates import ArrayAgg
@@ -23,6 +20,8 @@ from plane.db.models import (
     IssueView,
     ProjectPage,
 )
+from plane.utils.issue_search import issue_identifier_filter
+from plane.utils.search import search
 
 
 class GlobalSearchEndpoint(BaseAPIView):
@@ -41,37 +40,33 @@ class GlobalSearchEndpoint(BaseAPIView):
             .values("name", "id", "slug")
         )
 
+    def get_candidates(self, queryset, slug, project_id, workspace_search):
+        """Rows searched before the membership joins are applied"""
+        candidates = queryset.filter(workspace__slug=slug)
+        if workspace_search == "false" and project_id:
+            candidates = candidates.filter(project_id=project_id)
+        return candidates
+
     def filter_projects(self, query, slug, project_id, workspace_search):
-        fields = ["name", "identifier"]
-        q = Q()
-        for field in fields:
-            q |= Q(**{f"{field}__icontains": query})
+        projects = Project.objects.filter(
+            project_projectmember__member=self.request.user,
+            project_projectmember__is_active=True,
+            archived_at__isnull=True,
+            workspace__slug=slug,
+        )
         return (
-            Project.objects.filter(
-                q,
-                project_projectmember__member=self.request.user,
-                project_projectmember__is_active=True,
-                archived_at__isnull=True,
-                workspace__slug=slug,
+            search(
+                projects,
+                Project.objects.filter(workspace__slug=slug),
+                query,
+                extra=Q(identifier__icontains=query),
             )
             .distinct()
             .values("name", "id", "identifier", "workspace__slug")
         )
 
     def filter_issues(self, query, slug, project_id, workspace_search):
-        fields = ["name", "sequence_id", "project__identifier"]
-        q = Q()
-        for field in fields:
-            if field == "sequence_id":
-                # Match whole integers only (exclude decimal numbers)
-                sequences = re.findall(r"\b\d+\b", query)
-                for sequence_id in sequences:
-                    q |= Q(**{"sequence_id": sequence_id})
-            else:
-                q |= Q(**{f"{field}__icontains": query})
-
         issues = Issue.issue_objects.filter(
-            q,
             project__project_projectmember__member=self.request.user,
             project__project_projectmember__is_active=True,
             project__archived_at__isnull=True,
@@ -81,6 +76,15 @@ class GlobalSearchEndpoint(BaseAPIView):
         if workspace_search == "false" and project_id:
             issues = issues.filter(project_id=project_id)
 
+        issues = search(
+            issues,
+            self.get_candidates(
+                Issue.issue_objects.all(), slug, project_id, workspace_search
+            ),
+            query,
+            extra=issue_identifier_filter(query, slug),
+        )
+
         return issues.distinct().values(
             "name",
             "id",
@@ -91,13 +95,7 @@ class GlobalSearchEndpoint(BaseAPIView):
         )[:100]
 
     def filter_cycles(self, query, slug, project_id, workspace_search):
-        fields = ["name"]
-        q = Q()
-        for field in fields:
-            q |= Q(**{f"{field}__icontains": query})
-
         cycles = Cycle.objects.filter(
-            q,
             project__project_projectmember__member=self.request.user,
             project__project_projectmember__is_active=True,
             project__archived_at__isnull=True,
@@ -107,18 +105,20 @@ class GlobalSearchEndpoint(BaseAPIView):
         if workspace_search == "false" and project_id:
             cycles = cycles.filter(project_id=project_id)
 
+        cycles = search(
+            cycles,
+            self.get_candidates(
+                Cycle.objects.all(), slug, project_id, workspace_search
+            ),
+            query,
+        )
+
         return cycles.distinct().values(
             "name", "id", "project_id", "project__identifier", "workspace__slug"
         )
 
     def filter_modules(self, query, slug, project_id, workspace_search):
-        fields = ["name"]
-        q = Q()
-        for field in fields:
-            q |= Q(**{f"{field}__icontains": query})
-
         modules = Module.objects.filter(
-            q,
             project__project_projectmember__member=self.request.user,
             project__project_projectmember__is_active=True,
             project__archived_at__isnull=True,
@@ -128,19 +128,21 @@ class GlobalSearchEndpoint(BaseAPIView):
         if workspace_search == "false" and project_id:
             modules = modules.filter(project_id=project_id)
 
+        modules = search(
+            modules,
+            self.get_candidates(
+                Module.objects.all(), slug, project_id, workspace_search
+            ),
+            query,
+        )
+
         return modules.distinct().values(
             "name", "id", "project_id", "project__identifier", "workspace__slug"
         )
 
     def filter_pages(self, query, slug, project_id, workspace_search):
-        fields = ["name"]
-        q = Q()
-        for field in fields:
-            q |= Q(**{f"{field}__icontains": query})
-
         pages = (
             Page.objects.filter(
-                q,
                 projects__project_projectmember__member=self.request.user,
                 projects__project_projectmember__is_active=True,
                 projects__archived_at__isnull=True,
@@ -175,18 +177,14 @@ class GlobalSearchEndpoint(BaseAPIView):
                 project_id=project_id
             )
 
+        pages = search(pages, Page.objects.filter(workspace__slug=slug), query)
+
         return pages.distinct().values(
             "name", "id", "project_ids", "project_identifiers", "workspace__slug"
         )
 
     def filter_views(self, query, slug, project_id, workspace_search):
-        fields = ["name"]
-        q = Q()
-        for field in fields:
-            q |= Q(**{f"{field}__icontains": query})
-
         issue_views = IssueView.objects.filter(
-            q,
             project__project_projectmember__member=self.request.user,
             project__project_projectmember__is_active=True,
             project__archived_at__isnull=True,
@@ -196,6 +194,14 @@ class GlobalSearchEndpoint(BaseAPIView):
         if workspace_search == "false" and project_id:
             issue_views = issue_views.filter(project_id=project_id)
 
+        issue_views = search(
+            issue_views,
+            self.get_candidates(
+                IssueView.objects.all(), slug, project_id, workspace_search
+            ),
+            query,
+        )
+
         return issue_views.distinct().values(
             "name", "id", "project_id", "project__identifier", "workspace__slug"
         )
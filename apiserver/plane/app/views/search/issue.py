@@ -37,7 +37,7 @@ class IssueSearchEndpoint(BaseAPIView):
             issues = issues.filter(project_id=project_id)
 
         if query:
-            issues = search_issues(query, issues)
+            issues = search_issues(query, issues, workspace_slug=slug)
 
         if parent == "true" and issue_id:
             issue = Issue.issue_objects.filter(pk=issue_id).first()
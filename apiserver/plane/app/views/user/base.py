@@ -36,6 +36,7 @@ from plane.utils.paginator import BasePaginator
 from plane.authentication.utils.host import user_ip
 from plane.bgtasks.user_deactivation_email_task import user_deactivation_email
 from plane.utils.host import base_host
+from plane.utils.membership import invalidate_memberships
 from django.utils.decorators import method_decorator
 from django.views.decorators.cache import cache_control
 from django.views.decorators.vary import vary_on_cookie
@@ -143,6 +144,7 @@ class UserEndpoint(BaseViewSet):
         WorkspaceMember.objects.bulk_update(
             workspaces_to_deactivate, ["is_active"], batch_size=100
         )
+        invalidate_memberships(request.user.id)
 
         # Delete all workspace invites
         WorkspaceMemberInvite.objects.filter(email=user.email).delete()
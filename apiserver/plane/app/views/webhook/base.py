@@ -11,6 +11,7 @@ from plane.db.models.webhook import generate_token
 from ..base import BaseAPIView
 from plane.app.permissions import allow_permission, ROLE
 from plane.app.serializers import WebhookSerializer, WebhookLogSerializer
+from plane.bgtasks.webhook_task import invalidate_workspace_webhooks
 
 
 class WebhookEndpoint(BaseAPIView):
@@ -23,6 +24,7 @@ class WebhookEndpoint(BaseAPIView):
             )
             if serializer.is_valid():
                 serializer.save(workspace_id=workspace.id)
+                invalidate_workspace_webhooks(slug)
                 return Response(serializer.data, status=status.HTTP_201_CREATED)
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
         except IntegrityError as e:
@@ -96,6 +98,7 @@ class WebhookEndpoint(BaseAPIView):
         )
         if serializer.is_valid():
             serializer.save()
+            invalidate_workspace_webhooks(slug)
             return Response(serializer.data, status=status.HTTP_200_OK)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
@@ -103,6 +106,7 @@ class WebhookEndpoint(BaseAPIView):
     def delete(self, request, slug, pk):
         webhook = Webhook.objects.get(pk=pk, workspace__slug=slug)
         webhook.delete()
+        invalidate_workspace_webhooks(slug)
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
@@ -36,6 +36,7 @@ from plane.db.models import (
 from .. import BaseViewSet
 from plane.bgtasks.issue_activities_task import issue_activity
 from plane.utils.issue_filters import issue_filters
+from plane.utils.issue_counters import refresh_issue_counters_with_parents
 
 
 class WorkspaceDraftIssueViewSet(BaseViewSet):
@@ -313,6 +314,8 @@ class WorkspaceDraftIssueViewSet(BaseViewSet):
                 draft_issue_id=None,
             )
 
+            refresh_issue_counters_with_parents([serializer.data.get("id", None)])
+
             # delete the draft issue
             draft_issue.delete()
 
@@ -26,6 +26,7 @@ from plane.bgtasks.event_tracking_task import workspace_invite_event
 from plane.bgtasks.workspace_invitation_task import workspace_invitation
 from plane.db.models import User, Workspace, WorkspaceMember, WorkspaceMemberInvite
 from plane.utils.cache import invalidate_cache, invalidate_cache_directly
+from plane.utils.membership import invalidate_memberships
 
 from .. import BaseViewSet
 
@@ -289,6 +290,7 @@ class UserWorkspaceInvitationsViewSet(BaseViewSet):
             ],
             ignore_conflicts=True,
         )
+        invalidate_memberships(request.user.id)
 
         # Delete joined workspace invites
         workspace_invitations.delete()
@@ -8,13 +8,10 @@ from django.db.models import (
     Case,
     Count,
     F,
-    Func,
     IntegerField,
-    OuterRef,
     Q,
     Value,
     When,
-    Subquery,
 )
 from django.db.models.fields import DateField
 from django.db.models.functions import Cast, ExtractWeek
@@ -38,8 +35,6 @@ from plane.db.models import (
     CycleIssue,
     Issue,
     IssueActivity,
-    FileAsset,
-    IssueLink,
     IssueSubscriber,
     Project,
     ProjectMember,
@@ -54,6 +49,7 @@ from plane.utils.grouper import (
     issue_queryset_grouper,
 )
 from plane.utils.issue_filters import issue_filters
+from plane.utils.issue_counters import issue_counter_annotations
 from plane.utils.order_queryset import order_issue_queryset
 from plane.utils.paginator import GroupedOffsetPaginator, SubGroupedOffsetPaginator
 
@@ -107,34 +103,7 @@ class WorkspaceUserProfileIssuesEndpoint(BaseAPIView):
             .filter(**filters)
             .select_related("workspace", "project", "state", "parent")
             .prefetch_related("assignees", "labels", "issue_module__module")
-            .annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(
-                        issue=OuterRef("id"), deleted_at__isnull=True
-                    ).values("cycle_id")[:1]
-                )
-            )
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            .annotate(**issue_counter_annotations())
             .order_by("created_at")
         ).distinct()
 
@@ -5,6 +5,7 @@ from plane.db.models import (
     WorkspaceMemberInvite,
 )
 from plane.utils.cache import invalidate_cache_directly
+from plane.utils.membership import invalidate_memberships
 
 
 def process_workspace_project_invitations(user):
@@ -78,6 +79,8 @@ def process_workspace_project_invitations(user):
         ignore_conflicts=True,
     )
 
+    invalidate_memberships(user.id)
+
     # Delete all the invites
     workspace_member_invites.delete()
     project_member_invites.delete()
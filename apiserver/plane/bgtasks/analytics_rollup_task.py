@@ -0,0 +1,51 @@
+# Third party imports
+from celery import shared_task
+
+# Module imports
+from plane.db.models import ProjectAnalyticsRollup
+from plane.utils.analytics_rollup import (
+    apply_analytics_rollup_deltas,
+    refresh_analytics_rollup,
+)
+from plane.utils.exception_logger import log_exception
+
+
+def schedule_analytics_rollup(project_id, issue_ids):
+    """Queue the rollup deltas of issues changed outside the activity pipeline"""
+    analytics_rollup_deltas.delay(
+        str(project_id), [str(issue_id) for issue_id in issue_ids]
+    )
+
+
+@shared_task
+def analytics_rollup_deltas(project_id, issue_ids):
+    try:
+        apply_analytics_rollup_deltas(project_id, issue_ids)
+        return
+    except Exception as e:
+        log_exception(e)
+        return
+
+
+@shared_task
+def analytics_rollup_refresh(project_id):
+    try:
+        refresh_analytics_rollup(project_id)
+        return
+    except Exception as e:
+        log_exception(e)
+        return
+
+
+@shared_task
+def reconcile_analytics_rollups():
+    """Rebuild the rollup of every rolled up project to repair drifted deltas"""
+    try:
+        for project_id in ProjectAnalyticsRollup.objects.values_list(
+            "project_id", flat=True
+        ):
+            analytics_rollup_refresh.delay(str(project_id))
+        return
+    except Exception as e:
+        log_exception(e)
+        return
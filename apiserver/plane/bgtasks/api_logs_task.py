@@ -1,15 +1,28 @@
+from django.conf import settings
 from django.utils import timezone
 from datetime import timedelta
 from plane.db.models import APIActivityLog
 from celery import shared_task
 
+# Logs removed per delete statement
+API_LOG_DELETE_BATCH_SIZE = 5000
+
 
 @shared_task
 def delete_api_logs():
-    # Get the logs older than 30 days to delete
-    logs_to_delete = APIActivityLog.objects.filter(
-        created_at__lte=timezone.now() - timedelta(days=30)
-    )
+    # Get the logs older than the retention period to delete
+    cutoff = timezone.now() - timedelta(days=settings.API_LOG_RETENTION_DAYS)
+
+    # Delete in short batches over the created_at index so the table is never
+    # held by one long running delete
+    while True:
+        log_ids = list(
+            APIActivityLog.objects.filter(created_at__lte=cutoff).values_list(
+                "id", flat=True
+            )[:API_LOG_DELETE_BATCH_SIZE]
+        )
+        if not log_ids:
+            break
 
-    # Delete the logs
-    logs_to_delete._raw_delete(logs_to_delete.db)
+        logs_to_delete = APIActivityLog.objects.filter(id__in=log_ids)
+        logs_to_delete._raw_delete(logs_to_delete.db)
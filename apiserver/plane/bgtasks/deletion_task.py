@@ -1,15 +1,168 @@
+# Python imports
+import logging
+from collections import defaultdict
+from functools import lru_cache
+
 # Django imports
 from django.utils import timezone
 from django.apps import apps
 from django.conf import settings
-from django.db import models
-from django.db.models.fields.related import OneToOneRel
 
 
 # Third party imports
 from celery import shared_task
 
 
+# Models whose soft deletion changes the counters of an issue
+ISSUE_COUNTER_MODELS = ["issuelink", "cycleissue", "fileasset"]
+
+# Models shown on published boards, their deletion refreshes the board caches
+PUBLIC_BOARD_MODELS = [
+    "issue",
+    "issueassignee",
+    "issuelabel",
+    "issuelink",
+    "issuecomment",
+    "issuereaction",
+    "issuevote",
+    "cycleissue",
+    "moduleissue",
+    "fileasset",
+]
+
+# Models whose soft deletion changes the roles of their member
+MEMBERSHIP_MODELS = ["projectmember", "workspacemember"]
+
+# Rows read or written per statement of the cascade
+SOFT_DELETE_CHUNK_SIZE = 1000
+
+CASCADE = "cascade"
+SET_NULL = "set_null"
+
+
+def refresh_counters_of(instance):
+    """Refresh the issue counters the soft deleted instance contributed to"""
+    from plane.utils.issue_counters import refresh_issue_counters
+
+    model_name = instance._meta.model_name
+    if model_name == "issue":
+        refresh_issue_counters([instance.parent_id])
+    elif model_name in ISSUE_COUNTER_MODELS:
+        refresh_issue_counters([getattr(instance, "issue_id", None)])
+
+
+def chunked(values, size=SOFT_DELETE_CHUNK_SIZE):
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
+
+
+@lru_cache(maxsize=None)
+def cascade_plan(model):
+    """
+    The reverse relations of the model the soft deletion follows, as
+    (action, related model, field name) computed once per model.
+    """
+    plan = []
+    for relation in model._meta.get_fields():
+        if not (
+            (relation.one_to_many or relation.one_to_one)
+            and relation.auto_created
+            and not relation.concrete
+        ):
+            continue
+
+        # Get the on_delete behavior name
+        on_delete_name = getattr(relation.on_delete, "__name__", "")
+        if on_delete_name == "DO_NOTHING":
+            continue
+        elif on_delete_name == "SET_NULL":
+            plan.append((SET_NULL, relation.related_model, relation.field.name))
+        elif hasattr(relation.related_model, "deleted_at"):
+            # CASCADE and the other behaviors soft delete the related rows
+            plan.append((CASCADE, relation.related_model, relation.field.name))
+    return tuple(plan)
+
+
+def soft_delete_rows(model, ids, deleted_at):
+    """Soft delete the rows of the model with one UPDATE per chunk"""
+    values = {"deleted_at": deleted_at}
+    if any(field.name == "updated_at" for field in model._meta.concrete_fields):
+        values["updated_at"] = deleted_at
+    for chunk in chunked(ids):
+        model._default_manager.filter(pk__in=chunk).update(**values)
+
+
+def refresh_cascade_side_effects(model, ids):
+    """Counters, cached roles and board revisions the soft deleted rows touched"""
+    from plane.utils.cache import bump_project_revision
+    from plane.utils.issue_counters import refresh_issue_counters
+    from plane.utils.membership import invalidate_memberships
+
+    model_name = model._meta.model_name
+    for chunk in chunked(ids):
+        rows = model.all_objects.filter(pk__in=chunk)
+        if model_name in PUBLIC_BOARD_MODELS:
+            for project_id in set(rows.values_list("project_id", flat=True)):
+                if project_id is not None:
+                    bump_project_revision(project_id)
+        if model_name == "issue":
+            refresh_issue_counters(list(rows.values_list("parent_id", flat=True)))
+        elif model_name in ISSUE_COUNTER_MODELS:
+            refresh_issue_counters(list(rows.values_list("issue_id", flat=True)))
+        elif model_name in MEMBERSHIP_MODELS:
+            invalidate_memberships(*rows.values_list("member_id", flat=True))
+
+
+def soft_delete_cascade(model_class, instance_pk):
+    """
+    Soft delete everything below the instance breadth first. Every level of
+    the relation graph is handled with set based statements over the ids of
+    the level before it, in chunks, and the rows deleted per model returned.
+    """
+    deleted_at = timezone.now()
+    logger = logging.getLogger("plane")
+    deleted = defaultdict(int)
+
+    level = {model_class: [instance_pk]}
+    depth = 0
+    while level:
+        next_level = defaultdict(list)
+        for model, ids in level.items():
+            for action, related_model, field_name in cascade_plan(model):
+                for chunk in chunked(ids):
+                    related = related_model._default_manager.filter(
+                        **{f"{field_name}__in": chunk}
+                    )
+                    if action == SET_NULL:
+                        related.update(**{field_name: None})
+                        continue
+
+                    # Only rows still alive, so cycles in the graph terminate
+                    child_ids = list(
+                        related.filter(deleted_at__isnull=True).values_list(
+                            "pk", flat=True
+                        )
+                    )
+                    if child_ids:
+                        soft_delete_rows(related_model, child_ids, deleted_at)
+                        refresh_cascade_side_effects(related_model, child_ids)
+                        next_level[related_model].extend(child_ids)
+                        deleted[related_model._meta.label] += len(child_ids)
+
+        depth += 1
+        if next_level:
+            logger.info(
+                f"Soft delete of {model_class._meta.label} {instance_pk} level "
+                f"{depth}: "
+                + ", ".join(
+                    f"{len(ids)} {model._meta.label}"
+                    for model, ids in next_level.items()
+                )
+            )
+        level = next_level
+    return dict(deleted)
+
+
 @shared_task
 def soft_delete_related_objects(app_label, model_name, instance_pk, using=None):
     """
@@ -24,87 +177,16 @@ def soft_delete_related_objects(app_label, model_name, instance_pk, using=None):
     except model_class.DoesNotExist:
         return
 
-    # Get all related fields that are reverse relationships
-    all_related = [
-        f
-        for f in instance._meta.get_fields()
-        if (f.one_to_many or f.one_to_one) and f.auto_created and not f.concrete
-    ]
-
-    # Handle each related field
-    for relation in all_related:
-        related_name = relation.get_accessor_name()
-
-        # Skip if the relation doesn't exist
-        if not hasattr(instance, related_name):
-            continue
-
-        # Get the on_delete behavior name
-        on_delete_name = (
-            relation.on_delete.__name__
-            if hasattr(relation.on_delete, "__name__")
-            else ""
-        )
-
-        if on_delete_name == "DO_NOTHING":
-            continue
-
-        elif on_delete_name == "SET_NULL":
-            # Handle SET_NULL relationships
-            if isinstance(relation, OneToOneRel):
-                # For OneToOne relationships
-                related_obj = getattr(instance, related_name, None)
-                if related_obj and isinstance(related_obj, models.Model):
-                    setattr(related_obj, relation.remote_field.name, None)
-                    related_obj.save(update_fields=[relation.remote_field.name])
-            else:
-                # For other relationships
-                related_queryset = getattr(instance, related_name).all()
-                related_queryset.update(**{relation.remote_field.name: None})
-
-        else:
-            # Handle CASCADE and other delete behaviors
-            try:
-                if relation.one_to_one:
-                    # Handle OneToOne relationships
-                    related_obj = getattr(instance, related_name, None)
-                    if related_obj:
-                        if hasattr(related_obj, "deleted_at"):
-                            if not related_obj.deleted_at:
-                                related_obj.deleted_at = timezone.now()
-                                related_obj.save()
-                                # Recursively handle related objects
-                                soft_delete_related_objects(
-                                    related_obj._meta.app_label,
-                                    related_obj._meta.model_name,
-                                    related_obj.pk,
-                                    using,
-                                )
-                else:
-                    # Handle other relationships
-                    related_queryset = getattr(instance, related_name).all()
-                    for related_obj in related_queryset:
-                        if hasattr(related_obj, "deleted_at"):
-                            if not related_obj.deleted_at:
-                                related_obj.deleted_at = timezone.now()
-                                related_obj.save()
-                                # Recursively handle related objects
-                                soft_delete_related_objects(
-                                    related_obj._meta.app_label,
-                                    related_obj._meta.model_name,
-                                    related_obj.pk,
-                                    using,
-                                )
-            except Exception as e:
-                # Log the error or handle as needed
-                print(f"Error handling relation {related_name}: {str(e)}")
-                continue
+    deleted = soft_delete_cascade(model_class, instance.pk)
 
     # Finally, soft delete the instance itself if it hasn't been deleted yet
     if hasattr(instance, "deleted_at") and not instance.deleted_at:
         instance.deleted_at = timezone.now()
         instance.save()
 
+    refresh_counters_of(instance)
+    return deleted
+
 
 # @shared_task
 def restore_related_objects(app_label, model_name, instance_pk, using=None):
@@ -133,6 +215,7 @@ def hard_delete():
         Estimate,
         EstimatePoint,
     )
+    from plane.utils.issue_sync import record_purged_issues
 
     days = settings.HARD_DELETE_AFTER_DAYS
     # check delete workspace
@@ -156,9 +239,11 @@ def hard_delete():
     ).delete()
 
     # check delete issue
-    _ = Issue.all_objects.filter(
+    issues = Issue.all_objects.filter(
         deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
+    )
+    record_purged_issues(issues)
+    _ = issues.delete()
 
     # check delete page
     _ = Page.all_objects.filter(
@@ -22,6 +22,7 @@ from plane.db.models import (
     Module,
     Issue,
     IssueSequence,
+    ProjectIssueSequence,
     IssueAssignee,
     IssueLabel,
     IssueActivity,
@@ -288,12 +289,8 @@ def create_issues(workspace, project, user_id, issue_count):
 
     issues = []
 
-    # Get the maximum sequence_id
-    last_id = IssueSequence.objects.filter(project=project).aggregate(
-        largest=Max("sequence")
-    )["largest"]
-
-    last_id = 1 if last_id is None else last_id + 1
+    # Reserve a block of sequence ids for the issues
+    last_id = ProjectIssueSequence.reserve(project.id, issue_count)
 
     # Get the maximum sort order
     largest_sort_order = Issue.objects.filter(
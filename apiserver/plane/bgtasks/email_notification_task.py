@@ -10,13 +10,14 @@ from django.core.mail import EmailMultiAlternatives, get_connection
 from django.template.loader import render_to_string
 
 # Django imports
+from django.db import transaction
 from django.utils import timezone
 from django.utils.html import strip_tags
 
 # Module imports
 from plane.db.models import EmailNotificationLog, Issue, User
 from plane.license.utils.instance_value import get_email_configuration
-from plane.settings.redis import redis_instance
+from plane.settings.redis import redis_get_many, redis_instance
 from plane.utils.exception_logger import log_exception
 
 
@@ -39,62 +40,77 @@ def release_lock(lock_id):
     redis_client.delete(lock_id)
 
 
+# Emails rendered and sent over one SMTP connection by a delivery job
+EMAIL_DIGEST_BATCH_SIZE = 50
+
+
+def stream_digests(notifications):
+    """
+    Group the notifications ordered by receiver into one digest per receiver
+    and issue in a single pass, yielding the digests of a receiver as soon as
+    its last notification is read.
+    """
+    receiver_id = None
+    digests = {}
+    for notification in notifications:
+        if str(notification["receiver_id"]) != receiver_id:
+            yield from digests.values()
+            receiver_id = str(notification["receiver_id"])
+            digests = {}
+
+        issue_id = str(notification["entity_identifier"])
+        digest = digests.setdefault(
+            issue_id,
+            {
+                "issue_id": issue_id,
+                "receiver_id": receiver_id,
+                "notification_data": {},
+                "email_notification_ids": [],
+            },
+        )
+        digest["notification_data"].setdefault(
+            str(notification["triggered_by_id"]), []
+        ).append(notification["data"])
+        digest["email_notification_ids"].append(str(notification["id"]))
+    yield from digests.values()
+
+
+def queue_email_digests(digests):
+    """Claim the notifications of the digests and queue their delivery"""
+    EmailNotificationLog.objects.filter(
+        pk__in=[
+            notification_id
+            for digest in digests
+            for notification_id in digest["email_notification_ids"]
+        ]
+    ).update(processed_at=timezone.now())
+    # Deliver only once the claim is committed
+    transaction.on_commit(lambda: send_email_digests.delay(digests=digests))
+
+
 @shared_task
 def stack_email_notification():
-    # get all email notifications
-    email_notifications = (
-        EmailNotificationLog.objects.filter(processed_at__isnull=True)
-        .order_by("receiver")
-        .values()
-    )
-
     # Create the below format for each of the issues
     # {"issue_id" : { "actor_id1": [ { data }, { data } ], "actor_id2": [ { data }, { data } ] }}
-
-    # Convert to unique receivers list
-    receivers = list(
-        set(
-            [
-                str(notification.get("receiver_id"))
-                for notification in email_notifications
-            ]
-        )
-    )
-    processed_notifications = []
-    # Loop through all the issues to create the emails
-    for receiver_id in receivers:
-        # Notification triggered for the receiver
-        receiver_notifications = [
-            notification
-            for notification in email_notifications
-            if str(notification.get("receiver_id")) == receiver_id
-        ]
-        # create payload for all issues
-        payload = {}
-        email_notification_ids = []
-        for receiver_notification in receiver_notifications:
-            payload.setdefault(
-                receiver_notification.get("entity_identifier"), {}
-            ).setdefault(str(receiver_notification.get("triggered_by_id")), []).append(
-                receiver_notification.get("data")
-            )
-            # append processed notifications
-            processed_notifications.append(receiver_notification.get("id"))
-            email_notification_ids.append(receiver_notification.get("id"))
-
-        # Create emails for all the issues
-        for issue_id, notification_data in payload.items():
-            send_email_notification.delay(
-                issue_id=issue_id,
-                notification_data=notification_data,
-                receiver_id=receiver_id,
-                email_notification_ids=email_notification_ids,
+    with transaction.atomic():
+        # Rows claimed by an overlapping run stay locked and are skipped
+        email_notifications = (
+            EmailNotificationLog.objects.filter(processed_at__isnull=True)
+            .select_for_update(skip_locked=True)
+            .order_by("receiver_id", "created_at")
+            .values(
+                "id", "receiver_id", "entity_identifier", "triggered_by_id", "data"
             )
+        )
 
-    # Update the email notification log
-    EmailNotificationLog.objects.filter(pk__in=processed_notifications).update(
-        processed_at=timezone.now()
-    )
+        batch = []
+        for digest in stream_digests(email_notifications.iterator(chunk_size=2000)):
+            batch.append(digest)
+            if len(batch) == EMAIL_DIGEST_BATCH_SIZE:
+                queue_email_digests(batch)
+                batch = []
+        if batch:
+            queue_email_digests(batch)
 
 
 def create_payload(notification_data):
@@ -168,6 +184,205 @@ def process_html_content(content):
     return processed_content_list
 
 
+def email_connection():
+    """SMTP connection and sender address of the instance"""
+    (
+        EMAIL_HOST,
+        EMAIL_HOST_USER,
+        EMAIL_HOST_PASSWORD,
+        EMAIL_PORT,
+        EMAIL_USE_TLS,
+        EMAIL_USE_SSL,
+        EMAIL_FROM,
+    ) = get_email_configuration()
+
+    connection = get_connection(
+        host=EMAIL_HOST,
+        port=int(EMAIL_PORT),
+        username=EMAIL_HOST_USER,
+        password=EMAIL_HOST_PASSWORD,
+        use_tls=EMAIL_USE_TLS == "1",
+        use_ssl=EMAIL_USE_SSL == "1",
+    )
+    return connection, EMAIL_FROM
+
+
+def issue_update_email(
+    issue, receiver, actors, notification_data, base_api, email_from, connection
+):
+    """Render the issue updates digest of a receiver into an email"""
+    data = create_payload(notification_data=notification_data)
+
+    template_data = []
+    total_changes = 0
+    comments = []
+    actors_involved = []
+    for actor_id, changes in data.items():
+        actor = actors[actor_id]
+        total_changes = total_changes + len(changes)
+        comment = changes.pop("comment", False)
+        mention = changes.pop("mention", False)
+        actors_involved.append(actor_id)
+        if comment:
+            comments.append(
+                {
+                    "actor_comments": comment,
+                    "actor_detail": {
+                        "avatar_url": f"{base_api}{actor.avatar_url}",
+                        "first_name": actor.first_name,
+                        "last_name": actor.last_name,
+                    },
+                }
+            )
+        if mention:
+            mention["new_value"] = process_html_content(mention.get("new_value"))
+            mention["old_value"] = process_html_content(mention.get("old_value"))
+            comments.append(
+                {
+                    "actor_comments": mention,
+                    "actor_detail": {
+                        "avatar_url": f"{base_api}{actor.avatar_url}",
+                        "first_name": actor.first_name,
+                        "last_name": actor.last_name,
+                    },
+                }
+            )
+        activity_time = changes.pop("activity_time")
+        # Parse the input string into a datetime object
+        formatted_time = datetime.strptime(
+            activity_time, "%Y-%m-%d %H:%M:%S"
+        ).strftime("%H:%M %p")
+
+        if changes:
+            template_data.append(
+                {
+                    "actor_detail": {
+                        "avatar_url": f"{base_api}{actor.avatar_url}",
+                        "first_name": actor.first_name,
+                        "last_name": actor.last_name,
+                    },
+                    "changes": changes,
+                    "issue_details": {
+                        "name": issue.name,
+                        "identifier": (
+                            f"{issue.project.identifier}-{issue.sequence_id}"
+                        ),
+                    },
+                    "activity_time": str(formatted_time),
+                }
+            )
+
+    summary = "Updates were made to the issue by"
+
+    # Send the mail
+    issue_identifier = f"{issue.project.identifier}-{issue.sequence_id}"
+    subject = f"{issue_identifier} {remove_unwanted_characters(issue.name)}"
+    project_url = (
+        f"{base_api}/{issue.project.workspace.slug}/projects/{issue.project.id}/issues/"
+    )
+    issue_url = f"{project_url}{issue.id}"
+    context = {
+        "data": template_data,
+        "summary": summary,
+        "actors_involved": len(set(actors_involved)),
+        "issue": {
+            "issue_identifier": issue_identifier,
+            "name": issue.name,
+            "issue_url": issue_url,
+        },
+        "receiver": {"email": receiver.email},
+        "issue_url": issue_url,
+        "project_url": project_url,
+        "workspace": str(issue.project.workspace.slug),
+        "project": str(issue.project.name),
+        "user_preference": f"{base_api}/profile/preferences/email",
+        "comments": comments,
+    }
+    html_content = render_to_string(
+        "emails/notifications/issue-updates.html", context
+    )
+    text_content = strip_tags(html_content)
+
+    msg = EmailMultiAlternatives(
+        subject=subject,
+        body=text_content,
+        from_email=email_from,
+        to=[receiver.email],
+        connection=connection,
+    )
+    msg.attach_alternative(html_content, "text/html")
+    return msg
+
+
+@shared_task
+def send_email_digests(digests):
+    """
+    Deliver a batch of issue digests with the issues, users and request
+    origins loaded in bulk and every email sent over one SMTP connection.
+    """
+    try:
+        issue_ids = list({digest["issue_id"] for digest in digests})
+        origins = redis_get_many(issue_ids)
+        issues = {
+            str(issue.id): issue
+            for issue in Issue.objects.filter(
+                pk__in=[issue_id for issue_id in issue_ids if issue_id != "None"]
+            ).select_related("project", "project__workspace")
+        }
+        users = {
+            str(user.id): user
+            for user in User.objects.filter(
+                pk__in={
+                    user_id
+                    for digest in digests
+                    for user_id in [
+                        digest["receiver_id"],
+                        *digest["notification_data"].keys(),
+                    ]
+                }
+            )
+        }
+
+        connection, email_from = email_connection()
+        sent_notification_ids = []
+        # The connection is opened once and closed after the last email
+        with connection:
+            for digest in digests:
+                base_api = origins.get(digest["issue_id"])
+                issue = issues.get(digest["issue_id"])
+                receiver = users.get(digest["receiver_id"])
+                # Skip if base api is not present
+                if not base_api or issue is None or receiver is None:
+                    continue
+
+                try:
+                    msg = issue_update_email(
+                        issue=issue,
+                        receiver=receiver,
+                        actors=users,
+                        notification_data=digest["notification_data"],
+                        base_api=base_api.decode(),
+                        email_from=email_from,
+                        connection=connection,
+                    )
+                    msg.send()
+                    sent_notification_ids.extend(digest["email_notification_ids"])
+                except Exception as e:
+                    log_exception(e)
+
+        logging.getLogger("plane").info(
+            f"Sent {len(sent_notification_ids)} email notifications"
+        )
+        # Update the logs
+        EmailNotificationLog.objects.filter(pk__in=sent_notification_ids).update(
+            sent_at=timezone.now()
+        )
+        return
+    except Exception as e:
+        log_exception(e)
+        return
+
+
 @shared_task
 def send_email_notification(
     issue_id, notification_data, receiver_id, email_notification_ids
@@ -182,132 +397,28 @@ def send_email_notification(
         if acquire_lock(lock_id=lock_id):
             # get the redis instance
             ri = redis_instance()
-            base_api = ri.get(str(issue_id)).decode() if ri.get(str(issue_id)) else None
+            base_api = ri.get(str(issue_id))
+            base_api = base_api.decode() if base_api else None
 
             # Skip if base api is not present
             if not base_api:
                 return
 
-            data = create_payload(notification_data=notification_data)
-
-            # Get email configurations
-            (
-                EMAIL_HOST,
-                EMAIL_HOST_USER,
-                EMAIL_HOST_PASSWORD,
-                EMAIL_PORT,
-                EMAIL_USE_TLS,
-                EMAIL_USE_SSL,
-                EMAIL_FROM,
-            ) = get_email_configuration()
-
             receiver = User.objects.get(pk=receiver_id)
             issue = Issue.objects.get(pk=issue_id)
-            template_data = []
-            total_changes = 0
-            comments = []
-            actors_involved = []
-            for actor_id, changes in data.items():
-                actor = User.objects.get(pk=actor_id)
-                total_changes = total_changes + len(changes)
-                comment = changes.pop("comment", False)
-                mention = changes.pop("mention", False)
-                actors_involved.append(actor_id)
-                if comment:
-                    comments.append(
-                        {
-                            "actor_comments": comment,
-                            "actor_detail": {
-                                "avatar_url": f"{base_api}{actor.avatar_url}",
-                                "first_name": actor.first_name,
-                                "last_name": actor.last_name,
-                            },
-                        }
-                    )
-                if mention:
-                    mention["new_value"] = process_html_content(
-                        mention.get("new_value")
-                    )
-                    mention["old_value"] = process_html_content(
-                        mention.get("old_value")
-                    )
-                    comments.append(
-                        {
-                            "actor_comments": mention,
-                            "actor_detail": {
-                                "avatar_url": f"{base_api}{actor.avatar_url}",
-                                "first_name": actor.first_name,
-                                "last_name": actor.last_name,
-                            },
-                        }
-                    )
-                activity_time = changes.pop("activity_time")
-                # Parse the input string into a datetime object
-                formatted_time = datetime.strptime(
-                    activity_time, "%Y-%m-%d %H:%M:%S"
-                ).strftime("%H:%M %p")
-
-                if changes:
-                    template_data.append(
-                        {
-                            "actor_detail": {
-                                "avatar_url": f"{base_api}{actor.avatar_url}",
-                                "first_name": actor.first_name,
-                                "last_name": actor.last_name,
-                            },
-                            "changes": changes,
-                            "issue_details": {
-                                "name": issue.name,
-                                "identifier": f"{issue.project.identifier}-{issue.sequence_id}",
-                            },
-                            "activity_time": str(formatted_time),
-                        }
-                    )
-
-            summary = "Updates were made to the issue by"
-
-            # Send the mail
-            subject = f"{issue.project.identifier}-{issue.sequence_id} {remove_unwanted_characters(issue.name)}"
-            context = {
-                "data": template_data,
-                "summary": summary,
-                "actors_involved": len(set(actors_involved)),
-                "issue": {
-                    "issue_identifier": f"{str(issue.project.identifier)}-{str(issue.sequence_id)}",
-                    "name": issue.name,
-                    "issue_url": f"{base_api}/{str(issue.project.workspace.slug)}/projects/{str(issue.project.id)}/issues/{str(issue.id)}",
-                },
-                "receiver": {"email": receiver.email},
-                "issue_url": f"{base_api}/{str(issue.project.workspace.slug)}/projects/{str(issue.project.id)}/issues/{str(issue.id)}",
-                "project_url": f"{base_api}/{str(issue.project.workspace.slug)}/projects/{str(issue.project.id)}/issues/",
-                "workspace": str(issue.project.workspace.slug),
-                "project": str(issue.project.name),
-                "user_preference": f"{base_api}/profile/preferences/email",
-                "comments": comments,
-            }
-            html_content = render_to_string(
-                "emails/notifications/issue-updates.html", context
-            )
-            text_content = strip_tags(html_content)
+            actors = User.objects.in_bulk(list(notification_data.keys()))
 
             try:
-                connection = get_connection(
-                    host=EMAIL_HOST,
-                    port=int(EMAIL_PORT),
-                    username=EMAIL_HOST_USER,
-                    password=EMAIL_HOST_PASSWORD,
-                    use_tls=EMAIL_USE_TLS == "1",
-                    use_ssl=EMAIL_USE_SSL == "1",
-                )
-
-                msg = EmailMultiAlternatives(
-                    subject=subject,
-                    body=text_content,
-                    from_email=EMAIL_FROM,
-                    to=[receiver.email],
+                connection, email_from = email_connection()
+                msg = issue_update_email(
+                    issue=issue,
+                    receiver=receiver,
+                    actors={str(pk): actor for pk, actor in actors.items()},
+                    notification_data=notification_data,
+                    base_api=base_api,
+                    email_from=email_from,
                     connection=connection,
                 )
-                msg.attach_alternative(html_content, "text/html")
                 msg.send()
                 logging.getLogger("plane").info("Email Sent Successfully")
 
@@ -327,9 +438,6 @@ def send_email_notification(
         else:
             logging.getLogger("plane").info("Duplicate email received skipping")
             return
-    except (Issue.DoesNotExist, User.DoesNotExist):
-        release_lock(lock_id=lock_id)
-        return
     except Exception as e:
         log_exception(e)
         release_lock(lock_id=lock_id)
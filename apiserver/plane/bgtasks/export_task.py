@@ -2,10 +2,11 @@
 import csv
 import io
 import json
+import shutil
+import tempfile
 import zipfile
 
-import boto3
-from botocore.client import Config
+from boto3.s3.transfer import TransferConfig
 
 # Third party imports
 from celery import shared_task
@@ -17,9 +18,22 @@ from openpyxl import Workbook
 
 # Module imports
 from plane.db.models import ExporterHistory, Issue
+from plane.settings.storage import get_s3_client
 from plane.utils.exception_logger import log_exception
 
 
+# Number of rows fetched per round trip from the server side cursor
+EXPORT_CHUNK_SIZE = 2000
+
+# Archives bigger than this are spooled to disk instead of memory
+SPOOL_MAX_SIZE = 16 * 1024 * 1024
+
+# Archives bigger than the threshold are sent with a multipart upload
+UPLOAD_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024, multipart_chunksize=8 * 1024 * 1024
+)
+
+
 def dateTimeConverter(time):
     if time:
         return time.strftime("%a, %d %b %Y %I:%M:%S %Z%z")
@@ -30,42 +44,42 @@ def dateConverter(time):
         return time.strftime("%a, %d %b %Y")
 
 
-def create_csv_file(data):
-    csv_buffer = io.StringIO()
-    csv_writer = csv.writer(csv_buffer, delimiter=",", quoting=csv.QUOTE_ALL)
+def write_csv(stream, header, rows):
+    """Write the rows as CSV into the binary stream"""
+    text_stream = io.TextIOWrapper(stream, encoding="utf-8", newline="")
+    csv_writer = csv.writer(text_stream, delimiter=",", quoting=csv.QUOTE_ALL)
 
-    for row in data:
+    csv_writer.writerow(header)
+    for row in rows:
         csv_writer.writerow(row)
 
-    csv_buffer.seek(0)
-    return csv_buffer.getvalue()
+    text_stream.flush()
+    text_stream.detach()
 
 
-def create_json_file(data):
-    return json.dumps(data)
+def write_json(stream, header, rows):
+    """Write the rows as a JSON array into the binary stream, one row at a time"""
+    stream.write(b"[")
+    for index, row in enumerate(rows):
+        if index:
+            stream.write(b", ")
+        stream.write(json.dumps(dict(zip(header, row))).encode("utf-8"))
+    stream.write(b"]")
 
 
-def create_xlsx_file(data):
-    workbook = Workbook()
-    sheet = workbook.active
+def write_xlsx(stream, header, rows):
+    """Write the rows with a write only workbook, which keeps them out of memory"""
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
 
-    for row in data:
+    sheet.append(header)
+    for row in rows:
         sheet.append(row)
 
-    xlsx_buffer = io.BytesIO()
-    workbook.save(xlsx_buffer)
-    xlsx_buffer.seek(0)
-    return xlsx_buffer.getvalue()
-
-
-def create_zip_file(files):
-    zip_buffer = io.BytesIO()
-    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zipf:
-        for filename, file_content in files:
-            zipf.writestr(filename, file_content)
-
-    zip_buffer.seek(0)
-    return zip_buffer
+    with tempfile.TemporaryFile() as xlsx_file:
+        workbook.save(xlsx_file)
+        xlsx_file.seek(0)
+        shutil.copyfileobj(xlsx_file, stream)
 
 
 def upload_to_s3(zip_file, workspace_id, token_id, slug):
@@ -75,27 +89,24 @@ def upload_to_s3(zip_file, workspace_id, token_id, slug):
     expires_in = 7 * 24 * 60 * 60
 
     if settings.USE_MINIO:
-        upload_s3 = boto3.client(
-            "s3",
+        upload_s3 = get_s3_client(
             endpoint_url=settings.AWS_S3_ENDPOINT_URL,
             aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
             aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-            config=Config(signature_version="s3v4"),
         )
         upload_s3.upload_fileobj(
             zip_file,
             settings.AWS_STORAGE_BUCKET_NAME,
             file_name,
             ExtraArgs={"ACL": "public-read", "ContentType": "application/zip"},
+            Config=UPLOAD_TRANSFER_CONFIG,
         )
 
         # Generate presigned url for the uploaded file with different base
-        presign_s3 = boto3.client(
-            "s3",
+        presign_s3 = get_s3_client(
             endpoint_url=f"{settings.AWS_S3_URL_PROTOCOL}//{str(settings.AWS_S3_CUSTOM_DOMAIN).replace('/uploads', '')}/",
             aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
             aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-            config=Config(signature_version="s3v4"),
         )
 
         presigned_url = presign_s3.generate_presigned_url(
@@ -106,20 +117,16 @@ def upload_to_s3(zip_file, workspace_id, token_id, slug):
     else:
         # If endpoint url is present, use it
         if settings.AWS_S3_ENDPOINT_URL:
-            s3 = boto3.client(
-                "s3",
+            s3 = get_s3_client(
                 endpoint_url=settings.AWS_S3_ENDPOINT_URL,
                 aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
                 aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-                config=Config(signature_version="s3v4"),
             )
         else:
-            s3 = boto3.client(
-                "s3",
+            s3 = get_s3_client(
                 region_name=settings.AWS_REGION,
                 aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
                 aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-                config=Config(signature_version="s3v4"),
             )
 
         # Upload the file to S3
@@ -128,6 +135,7 @@ def upload_to_s3(zip_file, workspace_id, token_id, slug):
             settings.AWS_STORAGE_BUCKET_NAME,
             file_name,
             ExtraArgs={"ContentType": "application/zip"},
+            Config=UPLOAD_TRANSFER_CONFIG,
         )
 
         # Generate presigned url for the uploaded file
@@ -150,6 +158,35 @@ def upload_to_s3(zip_file, workspace_id, token_id, slug):
     exporter_instance.save(update_fields=["status", "url", "key"])
 
 
+def merge_issue_rows(issues):
+    """
+    Merge the assignee and label fan out rows of every issue into one issue.
+    The rows of an issue are adjacent as the queryset is ordered by issue, so
+    this is linear and only holds the current issue in memory.
+    """
+    current = None
+    for issue in issues:
+        assignee = (
+            f"{issue['assignees__first_name']} {issue['assignees__last_name']}"
+            if issue["assignees__first_name"] and issue["assignees__last_name"]
+            else None
+        )
+        label = issue["labels__name"]
+
+        if current is None or current["id"] != issue["id"]:
+            if current is not None:
+                yield current
+            current = {**issue, "assignees": [], "labels": []}
+
+        if assignee and assignee not in current["assignees"]:
+            current["assignees"].append(assignee)
+        if label and label not in current["labels"]:
+            current["labels"].append(label)
+
+    if current is not None:
+        yield current
+
+
 def generate_table_row(issue):
     return [
         f"""{issue["project__identifier"]}-{issue["sequence_id"]}""",
@@ -165,12 +202,8 @@ def generate_table_row(issue):
             if issue["created_by__first_name"] and issue["created_by__last_name"]
             else ""
         ),
-        (
-            f"{issue['assignees__first_name']} {issue['assignees__last_name']}"
-            if issue["assignees__first_name"] and issue["assignees__last_name"]
-            else ""
-        ),
-        issue["labels__name"] if issue["labels__name"] else "",
+        ", ".join(issue["assignees"]),
+        ", ".join(issue["labels"]),
         issue["issue_cycle__cycle__name"],
         dateConverter(issue["issue_cycle__cycle__start_date"]),
         dateConverter(issue["issue_cycle__cycle__end_date"]),
@@ -184,119 +217,10 @@ def generate_table_row(issue):
     ]
 
 
-def generate_json_row(issue):
-    return {
-        "ID": f"""{issue["project__identifier"]}-{issue["sequence_id"]}""",
-        "Project": issue["project__name"],
-        "Name": issue["name"],
-        "Description": issue["description_stripped"],
-        "State": issue["state__name"],
-        "Start Date": dateConverter(issue["start_date"]),
-        "Target Date": dateConverter(issue["target_date"]),
-        "Priority": issue["priority"],
-        "Created By": (
-            f"{issue['created_by__first_name']} {issue['created_by__last_name']}"
-            if issue["created_by__first_name"] and issue["created_by__last_name"]
-            else ""
-        ),
-        "Assignee": (
-            f"{issue['assignees__first_name']} {issue['assignees__last_name']}"
-            if issue["assignees__first_name"] and issue["assignees__last_name"]
-            else ""
-        ),
-        "Labels": issue["labels__name"] if issue["labels__name"] else "",
-        "Cycle Name": issue["issue_cycle__cycle__name"],
-        "Cycle Start Date": dateConverter(issue["issue_cycle__cycle__start_date"]),
-        "Cycle End Date": dateConverter(issue["issue_cycle__cycle__end_date"]),
-        "Module Name": issue["issue_module__module__name"],
-        "Module Start Date": dateConverter(issue["issue_module__module__start_date"]),
-        "Module Target Date": dateConverter(issue["issue_module__module__target_date"]),
-        "Created At": dateTimeConverter(issue["created_at"]),
-        "Updated At": dateTimeConverter(issue["updated_at"]),
-        "Completed At": dateTimeConverter(issue["completed_at"]),
-        "Archived At": dateTimeConverter(issue["archived_at"]),
-    }
-
-
-def update_json_row(rows, row):
-    matched_index = next(
-        (
-            index
-            for index, existing_row in enumerate(rows)
-            if existing_row["ID"] == row["ID"]
-        ),
-        None,
-    )
-
-    if matched_index is not None:
-        existing_assignees, existing_labels = (
-            rows[matched_index]["Assignee"],
-            rows[matched_index]["Labels"],
-        )
-        assignee, label = row["Assignee"], row["Labels"]
-
-        if assignee is not None and (
-            existing_assignees is None or label not in existing_assignees
-        ):
-            rows[matched_index]["Assignee"] += f", {assignee}"
-        if label is not None and (
-            existing_labels is None or label not in existing_labels
-        ):
-            rows[matched_index]["Labels"] += f", {label}"
-    else:
-        rows.append(row)
-
-
-def update_table_row(rows, row):
-    matched_index = next(
-        (index for index, existing_row in enumerate(rows) if existing_row[0] == row[0]),
-        None,
-    )
-
-    if matched_index is not None:
-        existing_assignees, existing_labels = rows[matched_index][7:9]
-        assignee, label = row[7:9]
-
-        if assignee is not None and (
-            existing_assignees is None or label not in existing_assignees
-        ):
-            rows[matched_index][8] += f", {assignee}"
-        if label is not None and (
-            existing_labels is None or label not in existing_labels
-        ):
-            rows[matched_index][8] += f", {label}"
-    else:
-        rows.append(row)
-
-
-def generate_csv(header, project_id, issues, files):
-    """
-    Generate CSV export for all the passed issues.
-    """
-    rows = [header]
-    for issue in issues:
-        row = generate_table_row(issue)
-        update_table_row(rows, row)
-    csv_file = create_csv_file(rows)
-    files.append((f"{project_id}.csv", csv_file))
-
-
-def generate_json(header, project_id, issues, files):
-    rows = []
-    for issue in issues:
-        row = generate_json_row(issue)
-        update_json_row(rows, row)
-    json_file = create_json_file(rows)
-    files.append((f"{project_id}.json", json_file))
-
-
-def generate_xlsx(header, project_id, issues, files):
-    rows = [header]
-    for issue in issues:
-        row = generate_table_row(issue)
-        update_table_row(rows, row)
-    xlsx_file = create_xlsx_file(rows)
-    files.append((f"{project_id}.xlsx", xlsx_file))
+def generate_rows(issues):
+    """Stream the issues with a server side cursor and yield one row per issue"""
+    for issue in merge_issue_rows(issues.iterator(chunk_size=EXPORT_CHUNK_SIZE)):
+        yield generate_table_row(issue)
 
 
 @shared_task
@@ -315,10 +239,6 @@ def issue_export_task(provider, workspace_id, project_ids, token_id, multiple, s
                     project__project_projectmember__is_active=True,
                     project__archived_at__isnull=True,
                 )
-                .select_related("project", "workspace", "state", "parent", "created_by")
-                .prefetch_related(
-                    "assignees", "labels", "issue_cycle__cycle", "issue_module__module"
-                )
                 .values(
                     "id",
                     "project__identifier",
@@ -348,7 +268,7 @@ def issue_export_task(provider, workspace_id, project_ids, token_id, multiple, s
                     "labels__name",
                 )
             )
-            .order_by("project__identifier", "sequence_id")
+            .order_by("project__identifier", "sequence_id", "id")
             .distinct()
         )
         # CSV header
@@ -376,27 +296,29 @@ def issue_export_task(provider, workspace_id, project_ids, token_id, multiple, s
             "Archived At",
         ]
 
-        EXPORTER_MAPPER = {
-            "csv": generate_csv,
-            "json": generate_json,
-            "xlsx": generate_xlsx,
-        }
+        EXPORTER_MAPPER = {"csv": write_csv, "json": write_json, "xlsx": write_xlsx}
 
-        files = []
         if multiple:
-            for project_id in project_ids:
-                issues = workspace_issues.filter(project__id=project_id)
-                exporter = EXPORTER_MAPPER.get(provider)
-                if exporter is not None:
-                    exporter(header, project_id, issues, files)
-
+            exports = [
+                (project_id, workspace_issues.filter(project__id=project_id))
+                for project_id in project_ids
+            ]
         else:
-            exporter = EXPORTER_MAPPER.get(provider)
-            if exporter is not None:
-                exporter(header, workspace_id, workspace_issues, files)
-
-        zip_buffer = create_zip_file(files)
-        upload_to_s3(zip_buffer, workspace_id, token_id, slug)
+            exports = [(workspace_id, workspace_issues)]
+
+        # Stream every file into a zip that is spooled to disk once it grows
+        with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as zip_file:
+            with zipfile.ZipFile(zip_file, "w", zipfile.ZIP_DEFLATED) as zipf:
+                writer = EXPORTER_MAPPER.get(provider)
+                if writer is not None:
+                    for name, issues in exports:
+                        with zipf.open(
+                            f"{name}.{provider}", "w", force_zip64=True
+                        ) as stream:
+                            writer(stream, header, generate_rows(issues))
+
+            zip_file.seek(0)
+            upload_to_s3(zip_file, workspace_id, token_id, slug)
 
     except Exception as e:
         exporter_instance = ExporterHistory.objects.get(token=token_id)
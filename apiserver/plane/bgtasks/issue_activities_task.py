@@ -28,10 +28,14 @@ from plane.db.models import (
     User,
     EstimatePoint,
 )
-from plane.settings.redis import redis_instance
+from plane.settings.redis import redis_instance, redis_set_many
+from plane.utils.analytics_rollup import apply_analytics_rollup_deltas
+from plane.utils.activity_resolver import ActivityResolver
+from plane.utils.cache import bump_project_revision
 from plane.utils.exception_logger import log_exception
-from plane.bgtasks.webhook_task import webhook_activity
+from plane.bgtasks.webhook_task import webhook_activity_batch
 from plane.utils.issue_relation_mapper import get_inverse_relation
+from plane.utils.issue_sync import record_issue_changes
 
 
 # Track Changes in name
@@ -44,6 +48,7 @@ def track_name(
     actor_id,
     issue_activities,
     epoch,
+    resolver=None,
 ):
     if current_instance.get("name") != requested_data.get("name"):
         issue_activities.append(
@@ -72,6 +77,7 @@ def track_description(
     actor_id,
     issue_activities,
     epoch,
+    resolver=None,
 ):
     if current_instance.get("description_html") != requested_data.get(
         "description_html"
@@ -115,18 +121,12 @@ def track_parent(
     actor_id,
     issue_activities,
     epoch,
+    resolver=None,
 ):
     if current_instance.get("parent_id") != requested_data.get("parent_id"):
-        old_parent = (
-            Issue.objects.filter(pk=current_instance.get("parent_id")).first()
-            if current_instance.get("parent_id") is not None
-            else None
-        )
-        new_parent = (
-            Issue.objects.filter(pk=requested_data.get("parent_id")).first()
-            if requested_data.get("parent_id") is not None
-            else None
-        )
+        resolver = resolver or ActivityResolver()
+        old_parent = resolver.first(Issue, current_instance.get("parent_id"))
+        new_parent = resolver.first(Issue, requested_data.get("parent_id"))
 
         issue_activities.append(
             IssueActivity(
@@ -164,6 +164,7 @@ def track_priority(
     actor_id,
     issue_activities,
     epoch,
+    resolver=None,
 ):
     if current_instance.get("priority") != requested_data.get("priority"):
         issue_activities.append(
@@ -192,10 +193,12 @@ def track_state(
     actor_id,
     issue_activities,
     epoch,
+    resolver=None,
 ):
     if current_instance.get("state_id") != requested_data.get("state_id"):
-        new_state = State.objects.get(pk=requested_data.get("state_id", None))
-        old_state = State.objects.get(pk=current_instance.get("state_id", None))
+        resolver = resolver or ActivityResolver()
+        new_state = resolver.get(State, requested_data.get("state_id", None))
+        old_state = resolver.get(State, current_instance.get("state_id", None))
 
         issue_activities.append(
             IssueActivity(
@@ -225,6 +228,7 @@ def track_target_date(
     actor_id,
     issue_activities,
     epoch,
+    resolver=None,
 ):
     if current_instance.get("target_date") != requested_data.get("target_date"):
         issue_activities.append(
@@ -261,6 +265,7 @@ def track_start_date(
     actor_id,
     issue_activities,
     epoch,
+    resolver=None,
 ):
     if current_instance.get("start_date") != requested_data.get("start_date"):
         issue_activities.append(
@@ -297,6 +302,7 @@ def track_labels(
     actor_id,
     issue_activities,
     epoch,
+    resolver=None,
 ):
     requested_labels = set([str(lab) for lab in requested_data.get("label_ids", [])])
     current_labels = set([str(lab) for lab in current_instance.get("label_ids", [])])
@@ -304,9 +310,14 @@ def track_labels(
     added_labels = requested_labels - current_labels
     dropped_labels = current_labels - requested_labels
 
+    # Load every added and dropped label in one query
+    resolver = (resolver or ActivityResolver()).add(
+        Label, *added_labels, *dropped_labels
+    )
+
     # Set of newly added labels
     for added_label in added_labels:
-        label = Label.objects.get(pk=added_label)
+        label = resolver.get(Label, added_label)
         issue_activities.append(
             IssueActivity(
                 issue_id=issue_id,
@@ -326,7 +337,7 @@ def track_labels(
 
     # Set of dropped labels
     for dropped_label in dropped_labels:
-        label = Label.objects.get(pk=dropped_label)
+        label = resolver.get(Label, dropped_label)
         issue_activities.append(
             IssueActivity(
                 issue_id=issue_id,
@@ -355,6 +366,7 @@ def track_assignees(
     actor_id,
     issue_activities,
     epoch,
+    resolver=None,
 ):
     requested_assignees = (
         set([str(asg) for asg in requested_data.get("assignee_ids", [])])
@@ -370,9 +382,14 @@ def track_assignees(
     added_assignees = requested_assignees - current_assignees
     dropped_assginees = current_assignees - requested_assignees
 
+    # Load every added and dropped assignee in one query
+    resolver = (resolver or ActivityResolver()).add(
+        User, *added_assignees, *dropped_assginees
+    )
+
     bulk_subscribers = []
     for added_asignee in added_assignees:
-        assignee = User.objects.get(pk=added_asignee)
+        assignee = resolver.get(User, added_asignee)
         issue_activities.append(
             IssueActivity(
                 issue_id=issue_id,
@@ -405,7 +422,7 @@ def track_assignees(
     )
 
     for dropped_assignee in dropped_assginees:
-        assignee = User.objects.get(pk=dropped_assignee)
+        assignee = resolver.get(User, dropped_assignee)
         issue_activities.append(
             IssueActivity(
                 issue_id=issue_id,
@@ -432,21 +449,19 @@ def track_estimate_points(
     actor_id,
     issue_activities,
     epoch,
+    resolver=None,
 ):
     if current_instance.get("estimate_point") != requested_data.get("estimate_point"):
-        old_estimate = (
-            EstimatePoint.objects.filter(
-                pk=current_instance.get("estimate_point")
-            ).first()
-            if current_instance.get("estimate_point") is not None
-            else None
+        resolver = (resolver or ActivityResolver()).add(
+            EstimatePoint,
+            current_instance.get("estimate_point"),
+            requested_data.get("estimate_point"),
+        )
+        old_estimate = resolver.first(
+            EstimatePoint, current_instance.get("estimate_point")
         )
-        new_estimate = (
-            EstimatePoint.objects.filter(
-                pk=requested_data.get("estimate_point")
-            ).first()
-            if requested_data.get("estimate_point") is not None
-            else None
+        new_estimate = resolver.first(
+            EstimatePoint, requested_data.get("estimate_point")
         )
         issue_activities.append(
             IssueActivity(
@@ -483,6 +498,7 @@ def track_archive_at(
     actor_id,
     issue_activities,
     epoch,
+    resolver=None,
 ):
     if current_instance.get("archived_at") != requested_data.get("archived_at"):
         if requested_data.get("archived_at") is None:
@@ -532,11 +548,14 @@ def track_closed_to(
     actor_id,
     issue_activities,
     epoch,
+    resolver=None,
 ):
     if requested_data.get("closed_to") is not None:
-        updated_state = State.objects.get(
-            pk=requested_data.get("closed_to"), project_id=project_id
+        updated_state = (resolver or ActivityResolver()).get(
+            State, requested_data.get("closed_to")
         )
+        if str(updated_state.project_id) != str(project_id):
+            raise State.DoesNotExist("State matching query does not exist.")
         issue_activities.append(
             IssueActivity(
                 issue_id=issue_id,
@@ -564,8 +583,10 @@ def create_issue_activity(
     actor_id,
     issue_activities,
     epoch,
+    resolver=None,
 ):
-    issue = Issue.objects.get(pk=issue_id)
+    resolver = resolver or ActivityResolver()
+    issue = resolver.get(Issue, issue_id)
     issue_activity = IssueActivity.objects.create(
         issue_id=issue_id,
         project_id=project_id,
@@ -589,6 +610,7 @@ def create_issue_activity(
             actor_id,
             issue_activities,
             epoch,
+            resolver=resolver,
         )
 
 
@@ -601,6 +623,7 @@ def update_issue_activity(
     actor_id,
     issue_activities,
     epoch,
+    resolver=None,
 ):
     ISSUE_ACTIVITY_MAPPER = {
         "name": track_name,
@@ -621,6 +644,10 @@ def update_issue_activity(
     current_instance = (
         json.loads(current_instance) if current_instance is not None else None
     )
+    # Every tracker resolves its references from the same batch
+    resolver = (resolver or ActivityResolver()).collect(
+        requested_data, current_instance
+    )
 
     for key in requested_data:
         func = ISSUE_ACTIVITY_MAPPER.get(key)
@@ -634,6 +661,7 @@ def update_issue_activity(
                 actor_id=actor_id,
                 issue_activities=issue_activities,
                 epoch=epoch,
+                resolver=resolver,
             )
 
 
@@ -646,6 +674,7 @@ def delete_issue_activity(
     actor_id,
     issue_activities,
     epoch,
+    resolver=None,
 ):
     issue_activities.append(
         IssueActivity(
@@ -670,6 +699,7 @@ def create_comment_activity(
     actor_id,
     issue_activities,
     epoch,
+    resolver=None,
 ):
     requested_data = json.loads(requested_data) if requested_data is not None else None
     current_instance = (
@@ -702,6 +732,7 @@ def update_comment_activity(
     actor_id,
     issue_activities,
     epoch,
+    resolver=None,
 ):
     requested_data = json.loads(requested_data) if requested_data is not None else None
     current_instance = (
@@ -737,6 +768,7 @@ def delete_comment_activity(
     actor_id,
     issue_activities,
     epoch,
+    resolver=None,
 ):
     issue_activities.append(
         IssueActivity(
@@ -761,6 +793,7 @@ def create_cycle_issue_activity(
     actor_id,
     issue_activities,
     epoch,
+    resolver=None,
 ):
     requested_data = json.loads(requested_data) if requested_data is not None else None
     current_instance = (
@@ -770,18 +803,17 @@ def create_cycle_issue_activity(
     # Updated Records:
     updated_records = current_instance.get("updated_cycle_issues", [])
     created_records = json.loads(current_instance.get("created_cycle_issues", []))
+    resolver = (resolver or ActivityResolver()).collect(current_instance)
+
+    # Touch all the moved and added issues with a single update
+    Issue.objects.filter(
+        pk__in=[record.get("issue_id") for record in updated_records]
+        + [record.get("fields").get("issue") for record in created_records]
+    ).update(updated_at=timezone.now())
 
     for updated_record in updated_records:
-        old_cycle = Cycle.objects.filter(
-            pk=updated_record.get("old_cycle_id", None)
-        ).first()
-        new_cycle = Cycle.objects.filter(
-            pk=updated_record.get("new_cycle_id", None)
-        ).first()
-        issue = Issue.objects.filter(pk=updated_record.get("issue_id")).first()
-        if issue:
-            issue.updated_at = timezone.now()
-            issue.save(update_fields=["updated_at"])
+        old_cycle = resolver.first(Cycle, updated_record.get("old_cycle_id", None))
+        new_cycle = resolver.first(Cycle, updated_record.get("new_cycle_id", None))
 
         issue_activities.append(
             IssueActivity(
@@ -801,15 +833,7 @@ def create_cycle_issue_activity(
         )
 
     for created_record in created_records:
-        cycle = Cycle.objects.filter(
-            pk=created_record.get("fields").get("cycle")
-        ).first()
-        issue = Issue.objects.filter(
-            pk=created_record.get("fields").get("issue")
-        ).first()
-        if issue:
-            issue.updated_at = timezone.now()
-            issue.save(update_fields=["updated_at"])
+        cycle = resolver.first(Cycle, created_record.get("fields").get("cycle"))
 
         issue_activities.append(
             IssueActivity(
@@ -837,6 +861,7 @@ def delete_cycle_issue_activity(
     actor_id,
     issue_activities,
     epoch,
+    resolver=None,
 ):
     requested_data = json.loads(requested_data) if requested_data is not None else None
     current_instance = (
@@ -845,13 +870,11 @@ def delete_cycle_issue_activity(
 
     cycle_id = requested_data.get("cycle_id", "")
     cycle_name = requested_data.get("cycle_name", "")
-    cycle = Cycle.objects.filter(pk=cycle_id).first()
+    cycle = (resolver or ActivityResolver()).first(Cycle, cycle_id)
     issues = requested_data.get("issues")
+    # Touch all the removed issues with a single update
+    Issue.objects.filter(pk__in=issues).update(updated_at=timezone.now())
     for issue in issues:
-        current_issue = Issue.objects.filter(pk=issue).first()
-        if issue:
-            current_issue.updated_at = timezone.now()
-            current_issue.save(update_fields=["updated_at"])
         issue_activities.append(
             IssueActivity(
                 issue_id=issue,
@@ -878,13 +901,13 @@ def create_module_issue_activity(
     actor_id,
     issue_activities,
     epoch,
+    resolver=None,
 ):
     requested_data = json.loads(requested_data) if requested_data is not None else None
-    module = Module.objects.filter(pk=requested_data.get("module_id")).first()
-    issue = Issue.objects.filter(pk=issue_id).first()
-    if issue:
-        issue.updated_at = timezone.now()
-        issue.save(update_fields=["updated_at"])
+    # The issue itself is already touched by `issue_activity`
+    module = (resolver or ActivityResolver()).first(
+        Module, requested_data.get("module_id")
+    )
     issue_activities.append(
         IssueActivity(
             issue_id=issue_id,
@@ -911,16 +934,14 @@ def delete_module_issue_activity(
     actor_id,
     issue_activities,
     epoch,
+    resolver=None,
 ):
     requested_data = json.loads(requested_data) if requested_data is not None else None
     current_instance = (
         json.loads(current_instance) if current_instance is not None else None
     )
+    # The issue itself is already touched by `issue_activity`
     module_name = current_instance.get("module_name")
-    current_issue = Issue.objects.filter(pk=issue_id).first()
-    if current_issue:
-        current_issue.updated_at = timezone.now()
-        current_issue.save(update_fields=["updated_at"])
     issue_activities.append(
         IssueActivity(
             issue_id=issue_id,
@@ -951,6 +972,7 @@ def create_link_activity(
     workspace_id,
     issue_activities,
     epoch,
+    resolver=None,
 ):
     requested_data = json.loads(requested_data) if requested_data is not None else None
     current_instance = (
@@ -982,6 +1004,7 @@ def update_link_activity(
     actor_id,
     issue_activities,
     epoch,
+    resolver=None,
 ):
     requested_data = json.loads(requested_data) if requested_data is not None else None
     current_instance = (
@@ -1016,6 +1039,7 @@ def delete_link_activity(
     actor_id,
     issue_activities,
     epoch,
+    resolver=None,
 ):
     current_instance = (
         json.loads(current_instance) if current_instance is not None else None
@@ -1046,6 +1070,7 @@ def create_attachment_activity(
     workspace_id,
     issue_activities,
     epoch,
+    resolver=None,
 ):
     requested_data = json.loads(requested_data) if requested_data is not None else None
     current_instance = (
@@ -1077,6 +1102,7 @@ def delete_attachment_activity(
     actor_id,
     issue_activities,
     epoch,
+    resolver=None,
 ):
     issue_activities.append(
         IssueActivity(
@@ -1101,6 +1127,7 @@ def create_issue_reaction_activity(
     actor_id,
     issue_activities,
     epoch,
+    resolver=None,
 ):
     requested_data = json.loads(requested_data) if requested_data is not None else None
     if requested_data and requested_data.get("reaction") is not None:
@@ -1141,6 +1168,7 @@ def delete_issue_reaction_activity(
     actor_id,
     issue_activities,
     epoch,
+    resolver=None,
 ):
     current_instance = (
         json.loads(current_instance) if current_instance is not None else None
@@ -1173,6 +1201,7 @@ def create_comment_reaction_activity(
     actor_id,
     issue_activities,
     epoch,
+    resolver=None,
 ):
     requested_data = json.loads(requested_data) if requested_data is not None else None
     if requested_data and requested_data.get("reaction") is not None:
@@ -1218,6 +1247,7 @@ def delete_comment_reaction_activity(
     actor_id,
     issue_activities,
     epoch,
+    resolver=None,
 ):
     current_instance = (
         json.loads(current_instance) if current_instance is not None else None
@@ -1258,6 +1288,7 @@ def create_issue_vote_activity(
     actor_id,
     issue_activities,
     epoch,
+    resolver=None,
 ):
     requested_data = json.loads(requested_data) if requested_data is not None else None
     if requested_data and requested_data.get("vote") is not None:
@@ -1288,6 +1319,7 @@ def delete_issue_vote_activity(
     actor_id,
     issue_activities,
     epoch,
+    resolver=None,
 ):
     current_instance = (
         json.loads(current_instance) if current_instance is not None else None
@@ -1320,14 +1352,18 @@ def create_issue_relation_activity(
     actor_id,
     issue_activities,
     epoch,
+    resolver=None,
 ):
     requested_data = json.loads(requested_data) if requested_data is not None else None
     current_instance = (
         json.loads(current_instance) if current_instance is not None else None
     )
     if current_instance is None and requested_data.get("issues") is not None:
+        resolver = (resolver or ActivityResolver()).add(
+            Issue, issue_id, *requested_data.get("issues")
+        )
         for related_issue in requested_data.get("issues"):
-            issue = Issue.objects.get(pk=related_issue)
+            issue = resolver.get(Issue, related_issue)
             issue_activities.append(
                 IssueActivity(
                     issue_id=issue_id,
@@ -1344,7 +1380,7 @@ def create_issue_relation_activity(
                 )
             )
             inverse_relation = get_inverse_relation(requested_data.get("relation_type"))
-            issue = Issue.objects.get(pk=issue_id)
+            issue = resolver.get(Issue, issue_id)
             issue_activities.append(
                 IssueActivity(
                     issue_id=related_issue,
@@ -1371,12 +1407,16 @@ def delete_issue_relation_activity(
     actor_id,
     issue_activities,
     epoch,
+    resolver=None,
 ):
     requested_data = json.loads(requested_data) if requested_data is not None else None
     current_instance = (
         json.loads(current_instance) if current_instance is not None else None
     )
-    issue = Issue.objects.get(pk=requested_data.get("related_issue"))
+    resolver = (resolver or ActivityResolver()).add(
+        Issue, issue_id, requested_data.get("related_issue")
+    )
+    issue = resolver.get(Issue, requested_data.get("related_issue"))
     issue_activities.append(
         IssueActivity(
             issue_id=issue_id,
@@ -1392,7 +1432,7 @@ def delete_issue_relation_activity(
             epoch=epoch,
         )
     )
-    issue = Issue.objects.get(pk=issue_id)
+    issue = resolver.get(Issue, issue_id)
     issue_activities.append(
         IssueActivity(
             issue_id=requested_data.get("related_issue"),
@@ -1427,6 +1467,7 @@ def create_draft_issue_activity(
     actor_id,
     issue_activities,
     epoch,
+    resolver=None,
 ):
     issue_activities.append(
         IssueActivity(
@@ -1451,6 +1492,7 @@ def update_draft_issue_activity(
     actor_id,
     issue_activities,
     epoch,
+    resolver=None,
 ):
     requested_data = json.loads(requested_data) if requested_data is not None else None
     current_instance = (
@@ -1495,6 +1537,7 @@ def delete_draft_issue_activity(
     actor_id,
     issue_activities,
     epoch,
+    resolver=None,
 ):
     issue_activities.append(
         IssueActivity(
@@ -1518,6 +1561,7 @@ def create_intake_activity(
     actor_id,
     issue_activities,
     epoch,
+    resolver=None,
 ):
     requested_data = json.loads(requested_data) if requested_data is not None else None
     current_instance = (
@@ -1547,6 +1591,69 @@ def create_intake_activity(
         )
 
 
+ACTIVITY_MAPPER = {
+    "issue.activity.created": create_issue_activity,
+    "issue.activity.updated": update_issue_activity,
+    "issue.activity.deleted": delete_issue_activity,
+    "comment.activity.created": create_comment_activity,
+    "comment.activity.updated": update_comment_activity,
+    "comment.activity.deleted": delete_comment_activity,
+    "cycle.activity.created": create_cycle_issue_activity,
+    "cycle.activity.deleted": delete_cycle_issue_activity,
+    "module.activity.created": create_module_issue_activity,
+    "module.activity.deleted": delete_module_issue_activity,
+    "link.activity.created": create_link_activity,
+    "link.activity.updated": update_link_activity,
+    "link.activity.deleted": delete_link_activity,
+    "attachment.activity.created": create_attachment_activity,
+    "attachment.activity.deleted": delete_attachment_activity,
+    "issue_relation.activity.created": create_issue_relation_activity,
+    "issue_relation.activity.deleted": delete_issue_relation_activity,
+    "issue_reaction.activity.created": create_issue_reaction_activity,
+    "issue_reaction.activity.deleted": delete_issue_reaction_activity,
+    "comment_reaction.activity.created": create_comment_reaction_activity,
+    "comment_reaction.activity.deleted": delete_comment_reaction_activity,
+    "issue_vote.activity.created": create_issue_vote_activity,
+    "issue_vote.activity.deleted": delete_issue_vote_activity,
+    "issue_draft.activity.created": create_draft_issue_activity,
+    "issue_draft.activity.updated": update_draft_issue_activity,
+    "issue_draft.activity.deleted": delete_draft_issue_activity,
+    "intake.activity.created": create_intake_activity,
+}
+
+
+def webhook_activities(issue_activities_created, intake=None):
+    """The webhook payloads of the created activities"""
+    return [
+        {
+            "event": (
+                "issue_comment"
+                if activity.field == "comment"
+                else "intake_issue"
+                if intake
+                else "issue"
+            ),
+            "event_id": str(
+                activity.issue_comment_id
+                if activity.field == "comment"
+                else intake
+                if intake
+                else activity.issue_id
+            ),
+            "verb": activity.verb,
+            "field": (
+                "description" if activity.field == "comment" else activity.field
+            ),
+            "old_value": activity.old_value if activity.old_value != "" else None,
+            "new_value": activity.new_value if activity.new_value != "" else None,
+            "actor_id": str(activity.actor_id),
+            "old_identifier": activity.old_identifier,
+            "new_identifier": activity.new_identifier,
+        }
+        for activity in issue_activities_created
+    ]
+
+
 # Receive message from room group
 @shared_task
 def issue_activity(
@@ -1565,15 +1672,18 @@ def issue_activity(
     try:
         issue_activities = []
 
-        project = Project.objects.get(pk=project_id)
+        project = Project.objects.select_related("workspace").get(pk=project_id)
         workspace_id = project.workspace_id
 
+        # Prefetch everything the activity references, one query per model
+        resolver = ActivityResolver().collect(requested_data, current_instance)
+
         if issue_id is not None:
             if origin:
                 ri = redis_instance()
                 # set the request origin in redis
                 ri.set(str(issue_id), origin, ex=600)
-            issue = Issue.objects.filter(pk=issue_id).first()
+            issue = resolver.first(Issue, issue_id)
             if issue:
                 try:
                     issue.updated_at = timezone.now()
@@ -1581,36 +1691,6 @@ def issue_activity(
                 except Exception:
                     pass
 
-        ACTIVITY_MAPPER = {
-            "issue.activity.created": create_issue_activity,
-            "issue.activity.updated": update_issue_activity,
-            "issue.activity.deleted": delete_issue_activity,
-            "comment.activity.created": create_comment_activity,
-            "comment.activity.updated": update_comment_activity,
-            "comment.activity.deleted": delete_comment_activity,
-            "cycle.activity.created": create_cycle_issue_activity,
-            "cycle.activity.deleted": delete_cycle_issue_activity,
-            "module.activity.created": create_module_issue_activity,
-            "module.activity.deleted": delete_module_issue_activity,
-            "link.activity.created": create_link_activity,
-            "link.activity.updated": update_link_activity,
-            "link.activity.deleted": delete_link_activity,
-            "attachment.activity.created": create_attachment_activity,
-            "attachment.activity.deleted": delete_attachment_activity,
-            "issue_relation.activity.created": create_issue_relation_activity,
-            "issue_relation.activity.deleted": delete_issue_relation_activity,
-            "issue_reaction.activity.created": create_issue_reaction_activity,
-            "issue_reaction.activity.deleted": delete_issue_reaction_activity,
-            "comment_reaction.activity.created": create_comment_reaction_activity,
-            "comment_reaction.activity.deleted": delete_comment_reaction_activity,
-            "issue_vote.activity.created": create_issue_vote_activity,
-            "issue_vote.activity.deleted": delete_issue_vote_activity,
-            "issue_draft.activity.created": create_draft_issue_activity,
-            "issue_draft.activity.updated": update_draft_issue_activity,
-            "issue_draft.activity.deleted": delete_draft_issue_activity,
-            "intake.activity.created": create_intake_activity,
-        }
-
         func = ACTIVITY_MAPPER.get(type)
         if func is not None:
             func(
@@ -1622,44 +1702,18 @@ def issue_activity(
                 actor_id=actor_id,
                 issue_activities=issue_activities,
                 epoch=epoch,
+                resolver=resolver,
             )
 
         # Save all the values to database
         issue_activities_created = IssueActivity.objects.bulk_create(issue_activities)
         # Post the updates to segway for integrations and webhooks
         if len(issue_activities_created):
-            for activity in issue_activities_created:
-                webhook_activity.delay(
-                    event=(
-                        "issue_comment"
-                        if activity.field == "comment"
-                        else "intake_issue"
-                        if intake
-                        else "issue"
-                    ),
-                    event_id=(
-                        activity.issue_comment_id
-                        if activity.field == "comment"
-                        else intake
-                        if intake
-                        else activity.issue_id
-                    ),
-                    verb=activity.verb,
-                    field=(
-                        "description" if activity.field == "comment" else activity.field
-                    ),
-                    old_value=(
-                        activity.old_value if activity.old_value != "" else None
-                    ),
-                    new_value=(
-                        activity.new_value if activity.new_value != "" else None
-                    ),
-                    actor_id=activity.actor_id,
-                    current_site=origin,
-                    slug=activity.workspace.slug,
-                    old_identifier=activity.old_identifier,
-                    new_identifier=activity.new_identifier,
-                )
+            webhook_activity_batch.delay(
+                slug=project.workspace.slug,
+                current_site=origin,
+                activities=webhook_activities(issue_activities_created, intake),
+            )
 
         if notification:
             notifications.delay(
@@ -1676,6 +1730,114 @@ def issue_activity(
                 current_instance=current_instance,
             )
 
+        changed_issue_ids = [
+            issue_id,
+            *(activity.issue_id for activity in issue_activities_created),
+        ]
+        # Hand the changed issues to the delta sync
+        record_issue_changes(project_id, changed_issue_ids)
+        # The change may have skipped the model signals of the published boards
+        bump_project_revision(project_id)
+        # Move the changed issues to their new analytics rollup buckets
+        apply_analytics_rollup_deltas(project_id, changed_issue_ids)
+        return
+    except Exception as e:
+        log_exception(e)
+        return
+
+
+@shared_task
+def bulk_issue_activity(
+    type,
+    activities,
+    actor_id,
+    project_id,
+    epoch,
+    origin=None,
+    notification=False,
+    subscriber=False,
+):
+    """
+    Track the same kind of activity for many issues of a project in one job.
+    Every entry of `activities` carries the issue_id, requested_data and
+    current_instance the single issue tracker receives. With `notification`
+    the notifications of every issue are created within the same job.
+    """
+    try:
+        issue_activities = []
+
+        project = Project.objects.select_related("workspace").get(pk=project_id)
+
+        if origin:
+            # set the request origin of every issue in one round trip
+            redis_set_many(
+                {str(activity["issue_id"]): origin for activity in activities},
+                ex=600,
+            )
+
+        # One resolver for the whole batch, every model is loaded once
+        resolver = ActivityResolver().collect(
+            *(activity["requested_data"] for activity in activities),
+            *(activity["current_instance"] for activity in activities),
+        )
+
+        func = ACTIVITY_MAPPER.get(type)
+        if func is not None:
+            for activity in activities:
+                func(
+                    requested_data=activity["requested_data"],
+                    current_instance=activity["current_instance"],
+                    issue_id=activity["issue_id"],
+                    project_id=project_id,
+                    workspace_id=project.workspace_id,
+                    actor_id=actor_id,
+                    issue_activities=issue_activities,
+                    epoch=epoch,
+                    resolver=resolver,
+                )
+
+        issue_activities_created = IssueActivity.objects.bulk_create(
+            issue_activities, batch_size=1000
+        )
+        if len(issue_activities_created):
+            webhook_activity_batch.delay(
+                slug=project.workspace.slug,
+                current_site=origin,
+                activities=webhook_activities(issue_activities_created),
+            )
+
+        if notification:
+            created_by_issue = {}
+            for issue_activity_created in issue_activities_created:
+                created_by_issue.setdefault(
+                    str(issue_activity_created.issue_id), []
+                ).append(issue_activity_created)
+            for activity in activities:
+                notifications(
+                    type=type,
+                    issue_id=str(activity["issue_id"]),
+                    actor_id=actor_id,
+                    project_id=project_id,
+                    subscriber=subscriber,
+                    issue_activities_created=json.dumps(
+                        IssueActivitySerializer(
+                            created_by_issue.get(str(activity["issue_id"]), []),
+                            many=True,
+                        ).data,
+                        cls=DjangoJSONEncoder,
+                    ),
+                    requested_data=activity["requested_data"],
+                    current_instance=activity["current_instance"],
+                )
+
+        changed_issue_ids = [
+            *(activity["issue_id"] for activity in activities),
+            *(activity.issue_id for activity in issue_activities_created),
+        ]
+        record_issue_changes(project_id, changed_issue_ids)
+        # Bulk updates skip the issue save signals that refresh public boards
+        bump_project_revision(project_id)
+        apply_analytics_rollup_deltas(project_id, changed_issue_ids)
         return
     except Exception as e:
         log_exception(e)
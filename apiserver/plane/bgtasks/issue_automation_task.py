@@ -4,95 +4,130 @@ from datetime import timedelta
 
 # Third party imports
 from celery import shared_task
+from django.db import connection
 from django.db.models import Q
 
 # Django imports
 from django.utils import timezone
 
 # Module imports
-from plane.bgtasks.issue_activities_task import issue_activity
+from plane.bgtasks.issue_activities_task import bulk_issue_activity
 from plane.db.models import Issue, Project, State
 from plane.utils.exception_logger import log_exception
+from plane.utils.issue_counters import refresh_issue_counters
+
+# Issues tracked per activity job of a project
+AUTOMATION_ACTIVITY_BATCH_SIZE = 1000
+
+
+def automation_issues(project_id, days, state_groups):
+    """The issues of the project untouched for `days` in the state groups"""
+    now = timezone.now()
+    return Issue.issue_objects.filter(
+        Q(
+            project=project_id,
+            archived_at__isnull=True,
+            updated_at__lte=(now - timedelta(days=days)),
+            state__group__in=state_groups,
+        ),
+        Q(issue_cycle__isnull=True)
+        | (Q(issue_cycle__cycle__end_date__lt=now) & Q(issue_cycle__isnull=False)),
+        Q(issue_module__isnull=True)
+        | (
+            Q(issue_module__module__target_date__lt=now)
+            & Q(issue_module__isnull=False)
+        ),
+    ).filter(
+        Q(issue_intake__status=1)
+        | Q(issue_intake__status=-1)
+        | Q(issue_intake__status=2)
+        | Q(issue_intake__isnull=True)
+    )
+
+
+def update_returning(issues, column, value):
+    """
+    Set the column of the matching issues in one UPDATE and return the ids
+    and parents of the rows it changed.
+    """
+    sql, params = issues.order_by().values("id").query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'UPDATE "{Issue._meta.db_table}" SET "{column}" = %s, '
+            f'"updated_at" = %s WHERE "id" IN ({sql}) RETURNING "id", "parent_id"',
+            [value, timezone.now(), *params],
+        )
+        return cursor.fetchall()
+
+
+def track_automation(project, rows, requested_data, current_instance):
+    """Log the activity of the automated issues with a job per batch"""
+    epoch = int(timezone.now().timestamp())
+    for start in range(0, len(rows), AUTOMATION_ACTIVITY_BATCH_SIZE):
+        bulk_issue_activity.delay(
+            type="issue.activity.updated",
+            activities=[
+                {
+                    "issue_id": str(issue_id),
+                    "requested_data": requested_data,
+                    "current_instance": current_instance,
+                }
+                for issue_id, _ in rows[start : start + AUTOMATION_ACTIVITY_BATCH_SIZE]
+            ],
+            actor_id=str(project.created_by_id),
+            project_id=str(project.id),
+            epoch=epoch,
+            notification=True,
+        )
+    # Sub issue counts of the parents change with the archived issues
+    refresh_issue_counters([parent_id for _, parent_id in rows if parent_id])
 
 
 @shared_task
-def archive_and_close_old_issues():
-    archive_old_issues()
-    close_old_issues()
+def archive_and_close_old_issues(dry_run=False):
+    archived = archive_old_issues(dry_run=dry_run)
+    closed = close_old_issues(dry_run=dry_run)
+    return {"archived": archived, "closed": closed}
 
 
-def archive_old_issues():
+def archive_old_issues(dry_run=False):
+    """Archive the stale issues, returning the count per project"""
+    counts = {}
     try:
         # Get all the projects whose archive_in is greater than 0
         projects = Project.objects.filter(archive_in__gt=0)
 
         for project in projects:
-            project_id = project.id
-            archive_in = project.archive_in
-
             # Get all the issues whose updated_at in less that the archive_in month
-            issues = Issue.issue_objects.filter(
-                Q(
-                    project=project_id,
-                    archived_at__isnull=True,
-                    updated_at__lte=(timezone.now() - timedelta(days=archive_in * 30)),
-                    state__group__in=["completed", "cancelled"],
-                ),
-                Q(issue_cycle__isnull=True)
-                | (
-                    Q(issue_cycle__cycle__end_date__lt=timezone.now())
-                    & Q(issue_cycle__isnull=False)
-                ),
-                Q(issue_module__isnull=True)
-                | (
-                    Q(issue_module__module__target_date__lt=timezone.now())
-                    & Q(issue_module__isnull=False)
-                ),
-            ).filter(
-                Q(issue_intake__status=1)
-                | Q(issue_intake__status=-1)
-                | Q(issue_intake__status=2)
-                | Q(issue_intake__isnull=True)
+            issues = automation_issues(
+                project.id, project.archive_in * 30, ["completed", "cancelled"]
             )
-
-            # Check if Issues
-            if issues:
-                # Set the archive time to current time
-                archive_at = timezone.now().date()
-
-                issues_to_update = []
-                for issue in issues:
-                    issue.archived_at = archive_at
-                    issues_to_update.append(issue)
-
-                # Bulk Update the issues and log the activity
-                if issues_to_update:
-                    Issue.objects.bulk_update(
-                        issues_to_update, ["archived_at"], batch_size=100
-                    )
-                    _ = [
-                        issue_activity.delay(
-                            type="issue.activity.updated",
-                            requested_data=json.dumps(
-                                {"archived_at": str(archive_at), "automation": True}
-                            ),
-                            actor_id=str(project.created_by_id),
-                            issue_id=issue.id,
-                            project_id=project_id,
-                            current_instance=json.dumps({"archived_at": None}),
-                            subscriber=False,
-                            epoch=int(timezone.now().timestamp()),
-                            notification=True,
-                        )
-                        for issue in issues_to_update
-                    ]
-        return
+            if dry_run:
+                counts[str(project.id)] = issues.values("id").distinct().count()
+                continue
+
+            # Set the archive time to current time
+            archive_at = timezone.now().date()
+            rows = update_returning(issues, "archived_at", archive_at)
+            counts[str(project.id)] = len(rows)
+            if rows:
+                track_automation(
+                    project,
+                    rows,
+                    requested_data=json.dumps(
+                        {"archived_at": str(archive_at), "automation": True}
+                    ),
+                    current_instance=json.dumps({"archived_at": None}),
+                )
+        return counts
     except Exception as e:
         log_exception(e)
-        return
+        return counts
 
 
-def close_old_issues():
+def close_old_issues(dry_run=False):
+    """Close the stale issues, returning the count per project"""
+    counts = {}
     try:
         # Get all the projects whose close_in is greater than 0
         projects = Project.objects.filter(close_in__gt=0).select_related(
@@ -100,68 +135,33 @@ def close_old_issues():
         )
 
         for project in projects:
-            project_id = project.id
-            close_in = project.close_in
-
             # Get all the issues whose updated_at in less that the close_in month
-            issues = Issue.issue_objects.filter(
-                Q(
-                    project=project_id,
-                    archived_at__isnull=True,
-                    updated_at__lte=(timezone.now() - timedelta(days=close_in * 30)),
-                    state__group__in=["backlog", "unstarted", "started"],
-                ),
-                Q(issue_cycle__isnull=True)
-                | (
-                    Q(issue_cycle__cycle__end_date__lt=timezone.now())
-                    & Q(issue_cycle__isnull=False)
-                ),
-                Q(issue_module__isnull=True)
-                | (
-                    Q(issue_module__module__target_date__lt=timezone.now())
-                    & Q(issue_module__isnull=False)
-                ),
-            ).filter(
-                Q(issue_intake__status=1)
-                | Q(issue_intake__status=-1)
-                | Q(issue_intake__status=2)
-                | Q(issue_intake__isnull=True)
+            issues = automation_issues(
+                project.id, project.close_in * 30, ["backlog", "unstarted", "started"]
             )
-
-            # Check if Issues
-            if issues:
-                if project.default_state is None:
-                    close_state = State.objects.filter(group="cancelled").first()
-                else:
-                    close_state = project.default_state
-
-                issues_to_update = []
-                for issue in issues:
-                    issue.state = close_state
-                    issues_to_update.append(issue)
-
-                # Bulk Update the issues and log the activity
-                if issues_to_update:
-                    Issue.objects.bulk_update(
-                        issues_to_update, ["state"], batch_size=100
-                    )
-                    [
-                        issue_activity.delay(
-                            type="issue.activity.updated",
-                            requested_data=json.dumps(
-                                {"closed_to": str(issue.state_id)}
-                            ),
-                            actor_id=str(project.created_by_id),
-                            issue_id=issue.id,
-                            project_id=project_id,
-                            current_instance=None,
-                            subscriber=False,
-                            epoch=int(timezone.now().timestamp()),
-                            notification=True,
-                        )
-                        for issue in issues_to_update
-                    ]
-        return
+            if dry_run:
+                counts[str(project.id)] = issues.values("id").distinct().count()
+                continue
+
+            if project.default_state is None:
+                close_state = State.objects.filter(
+                    project_id=project.id, group="cancelled"
+                ).first()
+            else:
+                close_state = project.default_state
+            if close_state is None:
+                continue
+
+            rows = update_returning(issues, "state_id", close_state.id)
+            counts[str(project.id)] = len(rows)
+            if rows:
+                track_automation(
+                    project,
+                    rows,
+                    requested_data=json.dumps({"closed_to": str(close_state.id)}),
+                    current_instance=None,
+                )
+        return counts
     except Exception as e:
         log_exception(e)
-        return
+        return counts
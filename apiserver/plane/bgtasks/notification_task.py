@@ -20,6 +20,7 @@ from plane.db.models import (
     UserNotificationPreference,
     ProjectMember,
 )
+from plane.utils.notification_counters import track_created_notifications
 from django.db.models import Subquery
 
 # Third Party imports
@@ -772,6 +773,7 @@ def notifications(
             )
             # Bulk create notifications
             Notification.objects.bulk_create(bulk_notifications, batch_size=100)
+            track_created_notifications(bulk_notifications, project.workspace.slug)
             EmailNotificationLog.objects.bulk_create(
                 bulk_email_logs, batch_size=100, ignore_conflicts=True
             )
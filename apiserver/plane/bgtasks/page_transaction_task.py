@@ -1,6 +1,3 @@
-# Python imports
-import json
-
 # Django imports
 from django.utils import timezone
 
@@ -12,6 +9,10 @@ from plane.db.models import Page, PageLog
 from celery import shared_task
 from plane.utils.exception_logger import log_exception
 
+# Log types of the mention components, the logs of the other types are
+# managed by the page log endpoints
+MENTION_ENTITY_NAMES = ["page_mention", "user_mention"]
+
 
 def extract_components(value, tag):
     try:
@@ -34,25 +35,31 @@ def extract_components(value, tag):
 
 
 @shared_task
-def page_transaction(new_value, old_value, page_id):
+def page_transaction(page_id, revision):
     try:
-        page = Page.objects.get(pk=page_id)
-        new_page_mention = PageLog.objects.filter(page_id=page_id).exists()
-
-        old_value = json.loads(old_value) if old_value else {}
+        page = Page.objects.only(
+            "workspace_id", "description_html", "description_revision"
+        ).get(pk=page_id)
+        # A later save diffs the mentions, the intermediate revisions are skipped
+        if page.description_revision > revision:
+            return
+
+        value = {"description_html": page.description_html}
+        logged_mentions = set(
+            PageLog.objects.filter(
+                page_id=page_id, entity_name__in=MENTION_ENTITY_NAMES
+            ).values_list("transaction", flat=True)
+        )
+        logged_mention_ids = {str(transaction) for transaction in logged_mentions}
 
         new_transactions = []
-        deleted_transaction_ids = set()
+        new_mention_ids = set()
 
         # TODO - Add "issue-embed-component", "img", "todo" components
         components = ["mention-component"]
         for component in components:
-            old_mentions = extract_components(old_value, component)
-            new_mentions = extract_components(new_value, component)
-
-            new_mentions_ids = {mention["id"] for mention in new_mentions}
-            old_mention_ids = {mention["id"] for mention in old_mentions}
-            deleted_transaction_ids.update(old_mention_ids - new_mentions_ids)
+            new_mentions = extract_components(value, component)
+            new_mention_ids.update(mention["id"] for mention in new_mentions)
 
             new_transactions.extend(
                 PageLog(
@@ -65,7 +72,7 @@ def page_transaction(new_value, old_value, page_id):
                     updated_at=timezone.now(),
                 )
                 for mention in new_mentions
-                if mention["id"] not in old_mention_ids or not new_page_mention
+                if mention["id"] not in logged_mention_ids
             )
 
         # Create new PageLog objects for new transactions
@@ -73,8 +80,15 @@ def page_transaction(new_value, old_value, page_id):
             new_transactions, batch_size=10, ignore_conflicts=True
         )
 
-        # Delete the removed transactions
-        PageLog.objects.filter(transaction__in=deleted_transaction_ids).delete()
+        # Delete the transactions of the removed mentions
+        PageLog.objects.filter(
+            page_id=page_id,
+            transaction__in=[
+                transaction
+                for transaction in logged_mentions
+                if str(transaction) not in new_mention_ids
+            ],
+        ).delete()
     except Page.DoesNotExist:
         return
     except Exception as e:
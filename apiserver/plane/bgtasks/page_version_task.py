@@ -7,22 +7,67 @@ from celery import shared_task
 # Module imports
 from plane.db.models import Page, PageVersion
 from plane.utils.exception_logger import log_exception
+from plane.utils.html_delta import html_delta
+
+# Versions kept per page, and versions per snapshot including the snapshot
+PAGE_VERSION_LIMIT = 20
+PAGE_VERSION_SNAPSHOT_INTERVAL = 10
+
+
+def version_delta(snapshot, html):
+    """The delta of the html against the snapshot, None when a new one is due"""
+    if snapshot is None:
+        return None
+    if snapshot.deltas.count() >= PAGE_VERSION_SNAPSHOT_INTERVAL - 1:
+        return None
+    delta = html_delta(snapshot.description_html, html)
+    # Heavily rewritten pages are cheaper to store whole
+    if len(json.dumps(delta)) > len(html or "") // 2:
+        return None
+    return delta
+
+
+def prune_page_versions(page_id):
+    """
+    Drop the oldest snapshots together with their deltas while the remaining
+    versions still reach the limit.
+    """
+    count = PageVersion.objects.filter(page_id=page_id).count()
+    while count > PAGE_VERSION_LIMIT:
+        oldest = (
+            PageVersion.objects.filter(page_id=page_id, base__isnull=True)
+            .order_by("last_saved_at")
+            .first()
+        )
+        if oldest is None:
+            return
+        size = 1 + oldest.deltas.count()
+        if count - size < PAGE_VERSION_LIMIT:
+            return
+        oldest.delete()
+        count -= size
 
 
 @shared_task
-def page_version(page_id, existing_instance, user_id):
+def page_version(page_id, revision, user_id):
     try:
-        # Get the page
-        page = Page.objects.get(id=page_id)
-
-        # Get the current instance
-        current_instance = (
-            json.loads(existing_instance) if existing_instance is not None else {}
+        # Get the page, the binary is only read for a new snapshot
+        page = Page.objects.defer("description_binary", "description").get(
+            id=page_id
         )
 
-        # Create a version if description_html is updated
-        if current_instance.get("description_html") != page.description_html:
-            # Create a new page version
+        # A later save versions the page, the intermediate revisions are skipped
+        if page.description_revision > revision:
+            return
+
+        snapshot = (
+            PageVersion.objects.filter(page_id=page_id, base__isnull=True)
+            .defer("description_binary")
+            .order_by("-last_saved_at")
+            .first()
+        )
+        delta = version_delta(snapshot, page.description_html)
+        if delta is None:
             PageVersion.objects.create(
                 page_id=page_id,
                 workspace_id=page.workspace_id,
@@ -31,14 +76,18 @@ def page_version(page_id, existing_instance, user_id):
                 owned_by_id=user_id,
                 last_saved_at=page.updated_at,
             )
+        else:
+            PageVersion.objects.create(
+                page_id=page_id,
+                workspace_id=page.workspace_id,
+                base=snapshot,
+                description_html="",
+                description_delta=delta,
+                owned_by_id=user_id,
+                last_saved_at=page.updated_at,
+            )
 
-            # If page versions are greater than 20 delete the oldest one
-            if PageVersion.objects.filter(page_id=page_id).count() > 20:
-                # Delete the old page version
-                PageVersion.objects.filter(page_id=page_id).order_by(
-                    "last_saved_at"
-                ).first().delete()
-
+        prune_page_versions(page_id)
         return
     except Page.DoesNotExist:
         return
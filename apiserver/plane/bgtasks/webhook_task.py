@@ -3,14 +3,17 @@ import hmac
 import json
 import logging
 import uuid
+from collections import defaultdict
 
 import requests
+from requests.adapters import HTTPAdapter
 
 # Third party imports
 from celery import shared_task
 
 # Django imports
 from django.conf import settings
+from django.core.cache import cache
 from django.core.mail import EmailMultiAlternatives, get_connection
 from django.core.serializers.json import DjangoJSONEncoder
 from django.template.loader import render_to_string
@@ -70,6 +73,58 @@ MODEL_MAPPER = {
 }
 
 
+# Webhook flag that has to be set for each event, events not listed go to every webhook
+EVENT_WEBHOOK_FLAG = {
+    "project": "project",
+    "issue": "issue",
+    "module": "module",
+    "module_issue": "module",
+    "cycle": "cycle",
+    "cycle_issue": "cycle",
+    "issue_comment": "issue_comment",
+}
+
+WEBHOOK_CACHE_TIMEOUT = 60 * 5
+
+# Seconds before the undelivered events of a batch are sent again, and the
+# number of times they are, same as the single event task
+WEBHOOK_RETRY_COUNTDOWN = 600
+WEBHOOK_MAX_RETRIES = 5
+
+_webhook_session = None
+
+
+def get_webhook_session():
+    """Return the process wide session so deliveries reuse pooled connections"""
+    global _webhook_session
+    if _webhook_session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=20)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _webhook_session = session
+    return _webhook_session
+
+
+def get_workspace_webhooks(slug):
+    """Return the active webhooks of a workspace and their event flags, cached"""
+    key = f"workspace_webhooks:{slug}"
+    webhooks = cache.get(key)
+    if webhooks is None:
+        webhooks = [
+            {**webhook, "id": str(webhook["id"])}
+            for webhook in Webhook.objects.filter(
+                workspace__slug=slug, is_active=True
+            ).values("id", *set(EVENT_WEBHOOK_FLAG.values()))
+        ]
+        cache.set(key, webhooks, WEBHOOK_CACHE_TIMEOUT)
+    return webhooks
+
+
+def invalidate_workspace_webhooks(slug):
+    cache.delete(f"workspace_webhooks:{slug}")
+
+
 def get_model_data(event, event_id, many=False):
     model = MODEL_MAPPER.get(event)
     if many:
@@ -131,7 +186,9 @@ def webhook_task(self, webhook, slug, event, event_data, action, current_site):
             headers["X-Plane-Signature"] = signature
 
         # Send the webhook event
-        response = requests.post(webhook.url, headers=headers, json=payload, timeout=30)
+        response = get_webhook_session().post(
+            webhook.url, headers=headers, json=payload, timeout=30
+        )
 
         # Log the webhook request
         WebhookLog.objects.create(
@@ -166,6 +223,7 @@ def webhook_task(self, webhook, slug, event, event_data, action, current_site):
         # Retry logic
         if self.request.retries >= self.max_retries:
             Webhook.objects.filter(pk=webhook.id).update(is_active=False)
+            invalidate_workspace_webhooks(slug)
             if webhook:
                 # send email for the deactivation of the webhook
                 send_webhook_deactivation_email(
@@ -239,82 +297,59 @@ def send_webhook_deactivation_email(webhook_id, receiver_id, current_site, reaso
         return
 
 
-@shared_task(
-    bind=True,
-    autoretry_for=(requests.RequestException,),
-    retry_backoff=600,
-    max_retries=5,
-    retry_jitter=True,
-)
-def webhook_send_task(
-    self, webhook, slug, event, event_data, action, current_site, activity
-):
-    try:
-        webhook = Webhook.objects.get(id=webhook, workspace__slug=slug)
-
-        headers = {
-            "Content-Type": "application/json",
-            "User-Agent": "Autopilot",
-            "X-Plane-Delivery": str(uuid.uuid4()),
-            "X-Plane-Event": event,
-        }
-
-        # # Your secret key
-        event_data = (
-            json.loads(json.dumps(event_data, cls=DjangoJSONEncoder))
-            if event_data is not None
-            else None
-        )
+def deliver_webhook(webhook, event, event_data, action, activity, retry_count):
+    """Send a single event to the webhook and log it, raises on request failures"""
+    headers = {
+        "Content-Type": "application/json",
+        "User-Agent": "Autopilot",
+        "X-Plane-Delivery": str(uuid.uuid4()),
+        "X-Plane-Event": event,
+    }
 
-        activity = (
-            json.loads(json.dumps(activity, cls=DjangoJSONEncoder))
-            if activity is not None
-            else None
-        )
+    # # Your secret key
+    event_data = (
+        json.loads(json.dumps(event_data, cls=DjangoJSONEncoder))
+        if event_data is not None
+        else None
+    )
 
-        action = {
-            "POST": "create",
-            "PATCH": "update",
-            "PUT": "update",
-            "DELETE": "delete",
-        }.get(action, action)
+    activity = (
+        json.loads(json.dumps(activity, cls=DjangoJSONEncoder))
+        if activity is not None
+        else None
+    )
 
-        payload = {
-            "event": event,
-            "action": action,
-            "webhook_id": str(webhook.id),
-            "workspace_id": str(webhook.workspace_id),
-            "data": event_data,
-            "activity": activity,
-        }
+    action = {
+        "POST": "create",
+        "PATCH": "update",
+        "PUT": "update",
+        "DELETE": "delete",
+    }.get(action, action)
+
+    payload = {
+        "event": event,
+        "action": action,
+        "webhook_id": str(webhook.id),
+        "workspace_id": str(webhook.workspace_id),
+        "data": event_data,
+        "activity": activity,
+    }
 
-        # Use HMAC for generating signature
-        if webhook.secret_key:
-            hmac_signature = hmac.new(
-                webhook.secret_key.encode("utf-8"),
-                json.dumps(payload).encode("utf-8"),
-                hashlib.sha256,
-            )
-            signature = hmac_signature.hexdigest()
-            headers["X-Plane-Signature"] = signature
+    # Use HMAC for generating signature
+    if webhook.secret_key:
+        hmac_signature = hmac.new(
+            webhook.secret_key.encode("utf-8"),
+            json.dumps(payload).encode("utf-8"),
+            hashlib.sha256,
+        )
+        signature = hmac_signature.hexdigest()
+        headers["X-Plane-Signature"] = signature
 
+    try:
         # Send the webhook event
-        response = requests.post(webhook.url, headers=headers, json=payload, timeout=30)
-
-        # Log the webhook request
-        WebhookLog.objects.create(
-            workspace_id=str(webhook.workspace_id),
-            webhook_id=str(webhook.id),
-            event_type=str(event),
-            request_method=str(action),
-            request_headers=str(headers),
-            request_body=str(payload),
-            response_status=str(response.status_code),
-            response_headers=str(response.headers),
-            response_body=str(response.text),
-            retry_count=str(self.request.retries),
+        response = get_webhook_session().post(
+            webhook.url, headers=headers, json=payload, timeout=30
         )
-
     except requests.RequestException as e:
         # Log the failed webhook request
         WebhookLog.objects.create(
@@ -327,11 +362,51 @@ def webhook_send_task(
             response_status=500,
             response_headers="",
             response_body=str(e),
-            retry_count=str(self.request.retries),
+            retry_count=str(retry_count),
         )
+        raise
+
+    # Log the webhook request
+    WebhookLog.objects.create(
+        workspace_id=str(webhook.workspace_id),
+        webhook_id=str(webhook.id),
+        event_type=str(event),
+        request_method=str(action),
+        request_headers=str(headers),
+        request_body=str(payload),
+        response_status=str(response.status_code),
+        response_headers=str(response.headers),
+        response_body=str(response.text),
+        retry_count=str(retry_count),
+    )
+
+
+@shared_task(
+    bind=True,
+    autoretry_for=(requests.RequestException,),
+    retry_backoff=600,
+    max_retries=5,
+    retry_jitter=True,
+)
+def webhook_send_task(
+    self, webhook, slug, event, event_data, action, current_site, activity
+):
+    try:
+        webhook = Webhook.objects.get(id=webhook, workspace__slug=slug)
+        deliver_webhook(
+            webhook=webhook,
+            event=event,
+            event_data=event_data,
+            action=action,
+            activity=activity,
+            retry_count=self.request.retries,
+        )
+
+    except requests.RequestException as e:
         # Retry logic
         if self.request.retries >= self.max_retries:
             Webhook.objects.filter(pk=webhook.id).update(is_active=False)
+            invalidate_workspace_webhooks(slug)
             if webhook:
                 # send email for the deactivation of the webhook
                 send_webhook_deactivation_email(
@@ -350,6 +425,57 @@ def webhook_send_task(
         return
 
 
+@shared_task
+def webhook_send_batch_task(webhook, slug, events, current_site, retry_count=0):
+    """Deliver many events to one webhook reusing the pooled session"""
+    try:
+        webhook = Webhook.objects.get(id=webhook, workspace__slug=slug)
+    except Webhook.DoesNotExist:
+        return
+
+    for index, event in enumerate(events):
+        try:
+            deliver_webhook(webhook=webhook, retry_count=retry_count, **event)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            # The endpoint is down, the rest of the batch would wait on it too
+            if retry_count >= WEBHOOK_MAX_RETRIES:
+                Webhook.objects.filter(pk=webhook.id).update(is_active=False)
+                invalidate_workspace_webhooks(slug)
+                send_webhook_deactivation_email(
+                    webhook_id=webhook.id,
+                    receiver_id=webhook.created_by_id,
+                    reason=str(e),
+                    current_site=current_site,
+                )
+                return
+            webhook_send_batch_task.apply_async(
+                kwargs={
+                    "webhook": str(webhook.id),
+                    "slug": slug,
+                    "events": events[index:],
+                    "current_site": current_site,
+                    "retry_count": retry_count + 1,
+                },
+                countdown=WEBHOOK_RETRY_COUNTDOWN,
+            )
+            return
+        except requests.RequestException:
+            # Hand the failed event over to the retrying single event task
+            webhook_send_task.apply_async(
+                kwargs={
+                    "webhook": str(webhook.id),
+                    "slug": slug,
+                    "current_site": current_site,
+                    **event,
+                },
+                countdown=WEBHOOK_RETRY_COUNTDOWN,
+                retries=1,
+            )
+        except Exception as e:
+            log_exception(e)
+    return
+
+
 @shared_task
 def webhook_activity(
     event,
@@ -364,46 +490,87 @@ def webhook_activity(
     old_identifier,
     new_identifier,
 ):
-    try:
-        webhooks = Webhook.objects.filter(workspace__slug=slug, is_active=True)
-
-        if event == "project":
-            webhooks = webhooks.filter(project=True)
-
-        if event == "issue":
-            webhooks = webhooks.filter(issue=True)
+    # A single activity is a batch of one
+    webhook_activity_batch(
+        slug=slug,
+        current_site=current_site,
+        activities=[
+            {
+                "event": event,
+                "verb": verb,
+                "field": field,
+                "old_value": old_value,
+                "new_value": new_value,
+                "actor_id": actor_id,
+                "event_id": event_id,
+                "old_identifier": old_identifier,
+                "new_identifier": new_identifier,
+            }
+        ],
+    )
 
-        if event == "module" or event == "module_issue":
-            webhooks = webhooks.filter(module=True)
 
-        if event == "cycle" or event == "cycle_issue":
-            webhooks = webhooks.filter(cycle=True)
+@shared_task
+def webhook_activity_batch(slug, activities, current_site):
+    """
+    Fan out many activities of a workspace with a single webhook lookup,
+    every webhook receives one task carrying all of its events
+    """
+    try:
+        webhooks = get_workspace_webhooks(slug)
+        if not webhooks:
+            return
 
-        if event == "issue_comment":
-            webhooks = webhooks.filter(issue_comment=True)
+        event_data = {}
+        actors = {}
+        deliveries = defaultdict(list)
+        for activity in activities:
+            event = activity["event"]
+            flag = EVENT_WEBHOOK_FLAG.get(event)
+            targets = [
+                webhook["id"] for webhook in webhooks if flag is None or webhook[flag]
+            ]
+            if not targets:
+                continue
+
+            # Serialize every model and actor once for the whole batch
+            try:
+                data_key = (event, str(activity["event_id"]))
+                if data_key not in event_data:
+                    event_data[data_key] = get_model_data(
+                        event=event, event_id=activity["event_id"]
+                    )
+                actor_id = str(activity["actor_id"])
+                if actor_id not in actors:
+                    actors[actor_id] = get_model_data(event="user", event_id=actor_id)
+            except ObjectDoesNotExist:
+                continue
+
+            item = {
+                "event": event,
+                "event_data": event_data[data_key],
+                "action": activity["verb"],
+                "activity": {
+                    "field": activity["field"],
+                    "new_value": activity["new_value"],
+                    "old_value": activity["old_value"],
+                    "actor": actors[actor_id],
+                    "old_identifier": activity["old_identifier"],
+                    "new_identifier": activity["new_identifier"],
+                },
+            }
+            for webhook_id in targets:
+                deliveries[webhook_id].append(item)
 
-        for webhook in webhooks:
-            webhook_send_task.delay(
-                webhook=webhook.id,
+        for webhook_id, events in deliveries.items():
+            webhook_send_batch_task.delay(
+                webhook=webhook_id,
                 slug=slug,
-                event=event,
-                event_data=get_model_data(event=event, event_id=event_id),
-                action=verb,
+                events=events,
                 current_site=current_site,
-                activity={
-                    "field": field,
-                    "new_value": new_value,
-                    "old_value": old_value,
-                    "actor": get_model_data(event="user", event_id=actor_id),
-                    "old_identifier": old_identifier,
-                    "new_identifier": new_identifier,
-                },
             )
         return
     except Exception as e:
-        # Return if a does not exist error occurs
-        if isinstance(e, ObjectDoesNotExist):
-            return
         if settings.DEBUG:
             print(e)
         log_exception(e)
@@ -437,24 +604,30 @@ def model_activity(
     )
 
     # Loop through all keys in requested data and check the current value and requested value
+    activities = []
     for key in requested_data:
         # Check if key is present in current instance or not
         if key in current_instance:
             current_value = current_instance.get(key, None)
             requested_value = requested_data.get(key, None)
             if current_value != requested_value:
-                webhook_activity.delay(
-                    event=model_name,
-                    verb="updated",
-                    field=key,
-                    old_value=current_value,
-                    new_value=requested_value,
-                    actor_id=actor_id,
-                    slug=slug,
-                    current_site=origin,
-                    event_id=model_id,
-                    old_identifier=None,
-                    new_identifier=None,
+                activities.append(
+                    {
+                        "event": model_name,
+                        "verb": "updated",
+                        "field": key,
+                        "old_value": current_value,
+                        "new_value": requested_value,
+                        "actor_id": actor_id,
+                        "event_id": model_id,
+                        "old_identifier": None,
+                        "new_identifier": None,
+                    }
                 )
 
+    if activities:
+        webhook_activity_batch.delay(
+            slug=slug, activities=activities, current_site=origin
+        )
+
     return
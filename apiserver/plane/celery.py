@@ -40,6 +40,10 @@ app.conf.beat_schedule = {
         "task": "plane.bgtasks.api_logs_task.delete_api_logs",
         "schedule": crontab(hour=0, minute=0),
     },
+    "check-every-day-to-reconcile-analytics-rollups": {
+        "task": "plane.bgtasks.analytics_rollup_task.reconcile_analytics_rollups",
+        "schedule": crontab(hour=1, minute=0),
+    },
     "run-every-6-hours-for-instance-trace": {
         "task": "plane.license.bgtasks.tracer.instance_traces",
         "schedule": crontab(hour="*/6", minute=0),
@@ -0,0 +1,39 @@
+# Django imports
+from django.core.management import BaseCommand
+
+# Module imports
+from plane.db.models import Project
+from plane.utils.analytics_rollup import refresh_analytics_rollup
+
+
+class Command(BaseCommand):
+    help = "Build the analytics rollup of the projects"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--project", type=str, nargs="?", help="Limit to the project id"
+        )
+        parser.add_argument(
+            "--workspace", type=str, nargs="?", help="Limit to the workspace slug"
+        )
+
+    def handle(self, *args, **options):
+        projects = Project.objects.filter(archived_at__isnull=True)
+        if options["project"]:
+            projects = projects.filter(pk=options["project"])
+        if options["workspace"]:
+            projects = projects.filter(workspace__slug=options["workspace"])
+
+        total = 0
+        project_ids = list(projects.order_by("created_at").values_list("id", flat=True))
+        for project_id in project_ids:
+            rows = refresh_analytics_rollup(project_id)
+            total += rows
+            self.stdout.write(f"Project {project_id}: {rows} rollup rows written")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Built the analytics rollup of {len(project_ids)} projects "
+                f"writing {total} rows"
+            )
+        )
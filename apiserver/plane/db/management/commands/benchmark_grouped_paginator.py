@@ -0,0 +1,104 @@
+# Python imports
+import random
+import time
+import uuid
+
+# Django imports
+from django.core.management import BaseCommand
+
+# Module imports
+from plane.utils.paginator import GroupedOffsetPaginator, SubGroupedOffsetPaginator
+
+
+class Command(BaseCommand):
+    help = "Time the grouped paginator post processing for m2m groupings"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            type=int,
+            nargs="+",
+            default=[250, 500, 1000, 2000, 4000],
+            help="Number of cards per run",
+        )
+        parser.add_argument("--labels", type=int, default=60, help="Label count")
+        parser.add_argument(
+            "--max-labels", type=int, default=4, help="Most labels on a card"
+        )
+        parser.add_argument("--repeat", type=int, default=5, help="Runs per size")
+
+    def make_rows(self, cards, labels, max_labels):
+        # One row per card and label like the joined queryset returns them
+        rows = []
+        for _ in range(cards):
+            card_id = uuid.uuid4()
+            state_id = random.choice(labels[:5])
+            for label_id in random.sample(labels, random.randint(1, max_labels)):
+                rows.append(
+                    {"id": card_id, "labels__id": label_id, "state_id": state_id}
+                )
+        return rows
+
+    def make_paginator(self, labels, sub_group):
+        if sub_group:
+            paginator = SubGroupedOffsetPaginator(
+                queryset=None,
+                group_by_field_name="labels__id",
+                sub_group_by_field_name="state_id",
+                group_by_fields=labels,
+                sub_group_by_fields=labels[:5],
+                count_filter=None,
+            )
+            # Seed the totals so only the post processing is timed
+            paginator._sub_group_totals = [
+                {"labels__id": label, "state_id": state, "count": 1}
+                for label in labels
+                for state in labels[:5]
+            ]
+        else:
+            paginator = GroupedOffsetPaginator(
+                queryset=None,
+                group_by_field_name="labels__id",
+                group_by_fields=labels,
+                count_filter=None,
+            )
+        paginator._group_totals = [
+            {"labels__id": label, "count": 1} for label in labels
+        ]
+        return paginator
+
+    def time_run(self, rows, labels, sub_group, repeat):
+        best = None
+        for _ in range(repeat):
+            # The groupers annotate the rows, every run gets fresh copies
+            copies = [dict(row) for row in rows]
+            paginator = self.make_paginator(labels, sub_group)
+            start = time.perf_counter()
+            paginator.process_results(results=copies)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return best
+
+    def handle(self, *args, **options):
+        random.seed(0)
+        labels = [uuid.uuid4() for _ in range(options["labels"])]
+
+        for sub_group in (False, True):
+            name = "sub grouped" if sub_group else "grouped"
+            self.stdout.write(f"{name} by labels, {len(labels)} labels")
+            per_row = []
+            for cards in options["sizes"]:
+                rows = self.make_rows(cards, labels, options["max_labels"])
+                elapsed = self.time_run(rows, labels, sub_group, options["repeat"])
+                per_row.append(elapsed / len(rows))
+                self.stdout.write(
+                    f"  {cards:>6} cards {len(rows):>7} rows "
+                    f"{elapsed * 1000:>9.2f} ms {per_row[-1] * 1e6:>7.2f} us/row"
+                )
+
+            # Linear processing keeps the cost per row flat as pages grow
+            growth = per_row[-1] / per_row[0]
+            style = self.style.SUCCESS if growth < 2 else self.style.WARNING
+            self.stdout.write(
+                style(f"  cost per row grew {growth:.2f}x across the sizes")
+            )
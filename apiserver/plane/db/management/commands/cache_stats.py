@@ -0,0 +1,26 @@
+# Django imports
+from django.core.management import BaseCommand
+
+# Module imports
+from plane.utils.cache import get_cache_stats, reset_cache_stats
+
+
+class Command(BaseCommand):
+    help = "Show the hit, miss and invalidation counters of the response cache"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--reset", action="store_true", help="Reset the counters after showing"
+        )
+
+    def handle(self, *args, **options):
+        stats = get_cache_stats()
+        lookups = stats["hits"] + stats["misses"]
+        for event, value in stats.items():
+            self.stdout.write(f"{event}: {value}")
+        if lookups:
+            self.stdout.write(f"hit ratio: {stats['hits'] / lookups:.2%}")
+
+        if options["reset"]:
+            reset_cache_stats()
+            self.stdout.write(self.style.SUCCESS("Cache counters reset"))
@@ -0,0 +1,76 @@
+# Django imports
+from django.core.management import BaseCommand, CommandError
+
+# Module imports
+from plane.db.models import Issue, IssueCounter
+from plane.utils.issue_counters import (
+    COUNTER_FIELDS,
+    compute_issue_counters,
+    refresh_issue_counters,
+)
+
+
+class Command(BaseCommand):
+    help = "Rebuild or verify the denormalised issue counters"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--verify",
+            action="store_true",
+            help="Only compare the stored counters with the source tables",
+        )
+        parser.add_argument(
+            "--project", type=str, nargs="?", help="Limit to the project id"
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=1000, help="Issues per batch"
+        )
+
+    def batches(self, project_id, batch_size):
+        issue_ids = Issue.all_objects.filter(deleted_at__isnull=True)
+        if project_id:
+            issue_ids = issue_ids.filter(project_id=project_id)
+        issue_ids = list(issue_ids.order_by("id").values_list("id", flat=True))
+        for start in range(0, len(issue_ids), batch_size):
+            yield issue_ids[start : start + batch_size]
+
+    def verify(self, issue_ids):
+        """Return the ids whose stored counters are missing or stale"""
+        expected = compute_issue_counters(issue_ids)
+        stored = {
+            str(row["issue_id"]): row
+            for row in IssueCounter.objects.filter(issue_id__in=issue_ids).values(
+                "issue_id", *COUNTER_FIELDS
+            )
+        }
+        stale = []
+        for issue_id, row in expected.items():
+            counter = stored.get(issue_id)
+            # Missing counts are stored as 0 and a missing cycle as NULL
+            if counter is None or any(
+                (row[field] or 0) != (counter[field] or 0) for field in COUNTER_FIELDS
+            ):
+                stale.append(issue_id)
+        return stale
+
+    def handle(self, *args, **options):
+        total = 0
+        stale = []
+        for issue_ids in self.batches(options["project"], options["batch_size"]):
+            if options["verify"]:
+                stale.extend(self.verify(issue_ids))
+                total += len(issue_ids)
+            else:
+                total += refresh_issue_counters(issue_ids)
+
+        if not options["verify"]:
+            self.stdout.write(self.style.SUCCESS(f"Rebuilt counters of {total} issues"))
+            return
+
+        if stale:
+            for issue_id in stale[:20]:
+                self.stdout.write(f"Stale counters for issue: {issue_id}")
+            raise CommandError(
+                f"{len(stale)} of {total} issues have missing or stale counters"
+            )
+        self.stdout.write(self.style.SUCCESS(f"Counters of {total} issues are valid"))
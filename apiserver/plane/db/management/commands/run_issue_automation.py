@@ -0,0 +1,33 @@
+# Django imports
+from django.core.management import BaseCommand
+
+# Module imports
+from plane.bgtasks.issue_automation_task import archive_and_close_old_issues
+
+
+class Command(BaseCommand):
+    help = "Archive and close the stale issues of the projects with automation"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report the issues the automation would update",
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options["dry_run"]
+        counts = archive_and_close_old_issues(dry_run=dry_run)
+
+        for action in ["archived", "closed"]:
+            for project_id, count in counts[action].items():
+                if count:
+                    self.stdout.write(f"Project {project_id}: {count} {action}")
+
+        verb = "Would update" if dry_run else "Updated"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{verb} {sum(counts['archived'].values())} archived and "
+                f"{sum(counts['closed'].values())} closed issues"
+            )
+        )
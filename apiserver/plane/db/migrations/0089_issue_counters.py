@@ -0,0 +1,31 @@
+# Generated by Django 4.2.17 on 2026-10-18 01:39
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0088_delete_fileuploadsettings'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IssueCounter',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Last Modified At')),
+                ('issue', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='issue_counter', serialize=False, to='db.issue')),
+                ('link_count', models.PositiveIntegerField(default=0)),
+                ('attachment_count', models.PositiveIntegerField(default=0)),
+                ('sub_issues_count', models.PositiveIntegerField(default=0)),
+                ('cycle', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='db.cycle')),
+            ],
+            options={
+                'verbose_name': 'Issue Counter',
+                'verbose_name_plural': 'Issue Counters',
+                'db_table': 'issue_counters',
+            },
+        ),
+    ]
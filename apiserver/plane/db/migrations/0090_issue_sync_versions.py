@@ -0,0 +1,44 @@
+# Generated by Django 4.2.17 on 2026-10-18 01:42
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0089_issue_counters'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectSyncVersion',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Last Modified At')),
+                ('project', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='sync_version', serialize=False, to='db.project')),
+                ('version', models.BigIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Project Sync Version',
+                'verbose_name_plural': 'Project Sync Versions',
+                'db_table': 'project_sync_versions',
+            },
+        ),
+        migrations.CreateModel(
+            name='IssueSyncVersion',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Last Modified At')),
+                ('issue', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='sync_version', serialize=False, to='db.issue')),
+                ('version', models.BigIntegerField()),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='db.project')),
+            ],
+            options={
+                'verbose_name': 'Issue Sync Version',
+                'verbose_name_plural': 'Issue Sync Versions',
+                'db_table': 'issue_sync_versions',
+                'indexes': [models.Index(fields=['project', 'version'], name='issue_sync_version_project_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,72 @@
+# Generated by Django 4.2.17 on 2026-10-18 01:45
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently, TrigramExtension
+import django.contrib.postgres.search
+from django.db import migrations, models
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+    # The indexes are built concurrently so the tables stay writable
+    atomic = False
+
+    dependencies = [
+        ('db', '0090_issue_sync_versions'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        AddIndexConcurrently(
+            model_name='cycle',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.search.SearchVector('name', config='simple'), name='cycle_name_search_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='cycle',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('name'), name='gin_trgm_ops'), name='cycle_name_trgm_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='issue',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.search.SearchVector('name', config='simple'), name='issue_name_search_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='issue',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('name'), name='gin_trgm_ops'), name='issue_name_trgm_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='issue',
+            index=models.Index(fields=['sequence_id', 'project'], name='issue_sequence_id_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='issueview',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.search.SearchVector('name', config='simple'), name='issue_view_name_search_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='issueview',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('name'), name='gin_trgm_ops'), name='issue_view_name_trgm_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='module',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.search.SearchVector('name', config='simple'), name='module_name_search_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='module',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('name'), name='gin_trgm_ops'), name='module_name_trgm_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='page',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.search.SearchVector('name', config='simple'), name='page_name_search_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='page',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('name'), name='gin_trgm_ops'), name='page_name_trgm_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='project',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.search.SearchVector('name', config='simple'), name='project_name_search_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='project',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('name'), name='gin_trgm_ops'), name='project_name_trgm_idx'),
+        ),
+    ]
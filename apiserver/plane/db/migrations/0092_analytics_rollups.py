@@ -0,0 +1,51 @@
+# Generated by Django 4.2.17 on 2026-10-18 01:51
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0091_search_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectAnalyticsRollup',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Last Modified At')),
+                ('project', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='analytics_rollup', serialize=False, to='db.project')),
+            ],
+            options={
+                'verbose_name': 'Project Analytics Rollup',
+                'verbose_name_plural': 'Project Analytics Rollups',
+                'db_table': 'project_analytics_rollups',
+            },
+        ),
+        migrations.CreateModel(
+            name='IssueAnalyticsRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Last Modified At')),
+                ('date', models.DateField(null=True)),
+                ('state_group', models.CharField(max_length=20)),
+                ('axis', models.CharField(max_length=50)),
+                ('value', models.CharField(max_length=255, null=True)),
+                ('issue_count', models.PositiveIntegerField(default=0)),
+                ('estimate_sum', models.FloatField(null=True)),
+                ('cycle', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='db.cycle')),
+                ('module', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='db.module')),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='db.project')),
+                ('workspace', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='db.workspace')),
+            ],
+            options={
+                'verbose_name': 'Issue Analytics Rollup',
+                'verbose_name_plural': 'Issue Analytics Rollups',
+                'db_table': 'issue_analytics_rollups',
+                'indexes': [models.Index(fields=['project', 'axis'], name='analytics_rollup_project_idx'), models.Index(fields=['cycle', 'axis'], name='analytics_rollup_cycle_idx'), models.Index(fields=['module', 'axis'], name='analytics_rollup_module_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 4.2.17 on 2026-10-18 01:52
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    # The sort order index is built concurrently so the issues stay writable
+    atomic = False
+
+    dependencies = [
+        ('db', '0092_analytics_rollups'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectIssueSequence',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Last Modified At')),
+                ('project', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='issue_sequence_counter', serialize=False, to='db.project')),
+                ('last_sequence', models.PositiveBigIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Project Issue Sequence',
+                'verbose_name_plural': 'Project Issue Sequences',
+                'db_table': 'project_issue_sequences',
+            },
+        ),
+        AddIndexConcurrently(
+            model_name='issue',
+            index=models.Index(fields=['project', 'state', 'sort_order'], name='issue_state_sort_order_idx'),
+        ),
+    ]
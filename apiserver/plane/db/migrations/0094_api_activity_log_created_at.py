@@ -0,0 +1,20 @@
+# Generated by Django 4.2.17 on 2026-10-18 02:00
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Built concurrently so the API keeps logging while the index is created
+    atomic = False
+
+    dependencies = [
+        ('db', '0093_project_issue_sequences'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='apiactivitylog',
+            index=models.Index(fields=['created_at'], name='api_activity_log_created_idx'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 4.2.17 on 2026-10-18 02:04
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Built concurrently so notifications keep being logged meanwhile
+    atomic = False
+
+    dependencies = [
+        ('db', '0094_api_activity_log_created_at'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='emailnotificationlog',
+            index=models.Index(condition=models.Q(('processed_at__isnull', True)), fields=['receiver', 'created_at'], name='email_log_pending_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 4.2.17 on 2026-10-18 02:15
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0095_email_notification_pending_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='page',
+            name='description_revision',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='pageversion',
+            name='base',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='deltas', to='db.pageversion'),
+        ),
+        migrations.AddField(
+            model_name='pageversion',
+            name='description_delta',
+            field=models.JSONField(null=True),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.17 on 2026-10-18 02:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0096_page_description_revision'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='projectsyncversion',
+            name='purged_version',
+            field=models.BigIntegerField(default=0),
+        ),
+    ]
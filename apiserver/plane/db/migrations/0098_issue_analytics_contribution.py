@@ -0,0 +1,30 @@
+# Generated by Django 4.2.17 on 2026-10-18 02:48
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0097_project_sync_purged_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IssueAnalyticsContribution',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Last Modified At')),
+                ('issue', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='analytics_contribution', serialize=False, to='db.issue')),
+                ('buckets', models.JSONField(default=list)),
+                ('estimate', models.FloatField(null=True)),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='db.project')),
+            ],
+            options={
+                'verbose_name': 'Issue Analytics Contribution',
+                'verbose_name_plural': 'Issue Analytics Contributions',
+                'db_table': 'issue_analytics_contributions',
+            },
+        ),
+    ]
@@ -1,4 +1,9 @@
-from .analytic import AnalyticView
+from .analytic import (
+    AnalyticView,
+    IssueAnalyticsContribution,
+    IssueAnalyticsRollup,
+    ProjectAnalyticsRollup,
+)
 from .api import APIActivityLog, APIToken
 from .asset import FileAsset
 from .base import BaseModel
@@ -33,6 +38,7 @@ from .issue import (
     IssueBlocker,
     IssueComment,
     IssueAttachment,
+    IssueCounter,
     IssueLabel,
     IssueLink,
     IssueMention,
@@ -40,6 +46,7 @@ from .issue import (
     IssueReaction,
     IssueRelation,
     IssueSequence,
+    ProjectIssueSequence,
     IssueSubscriber,
     IssueVote,
 )
@@ -87,3 +94,5 @@ from .recent_visit import UserRecentVisit
 from .label import Label
 
 from .device import Device, DeviceSession
+
+from .issue_sync import IssueSyncVersion, ProjectSyncVersion
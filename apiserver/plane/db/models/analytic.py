@@ -2,6 +2,7 @@
 from django.db import models
 
 from .base import BaseModel
+from ..mixins import TimeAuditModel
 
 
 class AnalyticView(BaseModel):
@@ -22,3 +23,93 @@ class AnalyticView(BaseModel):
     def __str__(self):
         """Return name of the analytic view"""
         return f"{self.name} <{self.workspace.name}>"
+
+
+class ProjectAnalyticsRollup(TimeAuditModel):
+    """Marks the projects whose analytics rollup has been built"""
+
+    project = models.OneToOneField(
+        "db.Project",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="analytics_rollup",
+    )
+
+    class Meta:
+        verbose_name = "Project Analytics Rollup"
+        verbose_name_plural = "Project Analytics Rollups"
+        db_table = "project_analytics_rollups"
+
+    def __str__(self):
+        return f"{self.project_id} <{self.updated_at}>"
+
+
+class IssueAnalyticsRollup(TimeAuditModel):
+    """
+    Issue counts and estimate sums of a project, a cycle or a module grouped
+    by state group and by one chart axis. The totals are split by the day the
+    issues were completed on.
+    """
+
+    workspace = models.ForeignKey(
+        "db.Workspace", on_delete=models.CASCADE, related_name="+"
+    )
+    project = models.ForeignKey(
+        "db.Project", on_delete=models.CASCADE, related_name="+"
+    )
+    cycle = models.ForeignKey(
+        "db.Cycle", on_delete=models.CASCADE, null=True, related_name="+"
+    )
+    module = models.ForeignKey(
+        "db.Module", on_delete=models.CASCADE, null=True, related_name="+"
+    )
+    date = models.DateField(null=True)
+    state_group = models.CharField(max_length=20)
+    axis = models.CharField(max_length=50)
+    value = models.CharField(max_length=255, null=True)
+    issue_count = models.PositiveIntegerField(default=0)
+    estimate_sum = models.FloatField(null=True)
+
+    class Meta:
+        verbose_name = "Issue Analytics Rollup"
+        verbose_name_plural = "Issue Analytics Rollups"
+        db_table = "issue_analytics_rollups"
+        indexes = [
+            models.Index(
+                fields=["project", "axis"], name="analytics_rollup_project_idx"
+            ),
+            models.Index(fields=["cycle", "axis"], name="analytics_rollup_cycle_idx"),
+            models.Index(
+                fields=["module", "axis"], name="analytics_rollup_module_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.project_id} <{self.axis}: {self.value}>"
+
+
+class IssueAnalyticsContribution(TimeAuditModel):
+    """
+    The rollup buckets an issue was last counted in and the estimate it added
+    to them, so a change to the issue can be taken out of its old buckets.
+    """
+
+    issue = models.OneToOneField(
+        "db.Issue",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="analytics_contribution",
+    )
+    project = models.ForeignKey(
+        "db.Project", on_delete=models.CASCADE, related_name="+"
+    )
+    buckets = models.JSONField(default=list)
+    estimate = models.FloatField(null=True)
+
+    class Meta:
+        verbose_name = "Issue Analytics Contribution"
+        verbose_name_plural = "Issue Analytics Contributions"
+        db_table = "issue_analytics_contributions"
+
+    def __str__(self):
+        return f"{self.issue_id} <{len(self.buckets)}>"
@@ -74,6 +74,9 @@ class APIActivityLog(BaseModel):
         verbose_name_plural = "API Activity Logs"
         db_table = "api_activity_logs"
         ordering = ("-created_at",)
+        indexes = [
+            models.Index(fields=["created_at"], name="api_activity_log_created_idx")
+        ]
 
     def __str__(self):
         return str(self.token_identifier)
@@ -1,10 +1,13 @@
 # Python imports
+from functools import partial
 from uuid import uuid4
 
 # Django import
 from django.conf import settings
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import models, transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 # Module import
 from .base import BaseModel
@@ -102,3 +105,13 @@ class FileAsset(BaseModel):
             return f"/api/assets/v2/workspaces/{self.workspace.slug}/projects/{self.project_id}/{self.id}/"
 
         return None
+
+
+@receiver([post_save, post_delete], sender=FileAsset)
+def bump_file_asset_project_revision(sender, instance, **kwargs):
+    # Module imports
+    from plane.utils.cache import bump_project_revision
+
+    # Issue attachments count on published boards
+    if instance.project_id is not None:
+        transaction.on_commit(partial(bump_project_revision, instance.project_id))
@@ -1,12 +1,16 @@
 # Python imports
 import pytz
+from functools import partial
 
 # Django imports
 from django.conf import settings
-from django.db import models
+from django.db import models, transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 # Module imports
 from .project import ProjectBaseModel
+from plane.utils.search import search_indexes
 
 
 def get_default_filters():
@@ -79,6 +83,7 @@ class Cycle(ProjectBaseModel):
         verbose_name = "Cycle"
         verbose_name_plural = "Cycles"
         db_table = "cycles"
+        indexes = search_indexes("cycle")
         ordering = ("-created_at",)
 
     def save(self, *args, **kwargs):
@@ -156,3 +161,11 @@ class CycleUserProperties(ProjectBaseModel):
 
     def __str__(self):
         return f"{self.cycle.name} {self.user.email}"
+
+
+@receiver([post_save, post_delete], sender=CycleIssue)
+def bump_cycle_issue_project_revision(sender, instance, **kwargs):
+    # Module imports
+    from plane.utils.cache import bump_project_revision
+
+    transaction.on_commit(partial(bump_project_revision, instance.project_id))
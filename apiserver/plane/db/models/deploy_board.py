@@ -2,7 +2,9 @@
 from uuid import uuid4
 
 # Django imports
-from django.db import models
+from django.db import models, transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 # Module imports
 from .workspace import WorkspaceBaseModel
@@ -55,3 +57,16 @@ class DeployBoard(WorkspaceBaseModel):
         verbose_name_plural = "Deploy Boards"
         db_table = "deploy_boards"
         ordering = ("-created_at",)
+
+
+@receiver([post_save, post_delete], sender=DeployBoard)
+def invalidate_deploy_board(sender, instance, **kwargs):
+    # Module imports
+    from plane.space.utils.board_cache import invalidate_public_board
+    from plane.utils.cache import bump_project_revision
+
+    def invalidate():
+        invalidate_public_board(instance.anchor)
+        bump_project_revision(instance.entity_identifier)
+
+    transaction.on_commit(invalidate)
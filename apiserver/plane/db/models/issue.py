@@ -1,4 +1,5 @@
 # Python import
+from functools import partial
 from uuid import uuid4
 
 # Django imports
@@ -9,12 +10,15 @@ from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models, transaction
 from django.utils import timezone
 from django.db.models import Q
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django import apps
 
 # Module imports
 from plane.utils.html_processor import strip_tags
-from plane.db.mixins import SoftDeletionManager
+from plane.db.mixins import SoftDeletionManager, TimeAuditModel
 from plane.utils.exception_logger import log_exception
+from plane.utils.search import search_indexes
 from .project import ProjectBaseModel
 
 
@@ -176,6 +180,17 @@ class Issue(ProjectBaseModel):
         verbose_name = "Issue"
         verbose_name_plural = "Issues"
         db_table = "issues"
+        indexes = [
+            *search_indexes("issue"),
+            models.Index(
+                fields=["sequence_id", "project"], name="issue_sequence_id_idx"
+            ),
+            # Serves the largest sort order of a state with a single index probe
+            models.Index(
+                fields=["project", "state", "sort_order"],
+                name="issue_state_sort_order_idx",
+            ),
+        ]
         ordering = ("-created_at",)
 
     def save(self, *args, **kwargs):
@@ -208,12 +223,6 @@ class Issue(ProjectBaseModel):
 
         if self._state.adding:
             with transaction.atomic():
-                last_sequence = (
-                    IssueSequence.objects.filter(project=self.project)
-                    .select_for_update()
-                    .aggregate(largest=models.Max("sequence"))["largest"]
-                )
-                self.sequence_id = last_sequence + 1 if last_sequence else 1
                 # Strip the html tags using html parser
                 self.description_stripped = (
                     None
@@ -226,6 +235,8 @@ class Issue(ProjectBaseModel):
                 if largest_sort_order is not None:
                     self.sort_order = largest_sort_order + 10000
 
+                # Allocated last so the counter row stays locked only for the inserts
+                self.sequence_id = ProjectIssueSequence.reserve(self.project_id)
                 super(Issue, self).save(*args, **kwargs)
 
                 IssueSequence.objects.create(
@@ -375,6 +386,31 @@ class IssueLink(ProjectBaseModel):
         return f"{self.issue.name} {self.url}"
 
 
+class IssueCounter(TimeAuditModel):
+    """Denormalised cycle and counts of an issue read by the issue lists"""
+
+    issue = models.OneToOneField(
+        "db.Issue",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="issue_counter",
+    )
+    cycle = models.ForeignKey(
+        "db.Cycle", on_delete=models.SET_NULL, null=True, related_name="+"
+    )
+    link_count = models.PositiveIntegerField(default=0)
+    attachment_count = models.PositiveIntegerField(default=0)
+    sub_issues_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name = "Issue Counter"
+        verbose_name_plural = "Issue Counters"
+        db_table = "issue_counters"
+
+    def __str__(self):
+        return str(self.issue_id)
+
+
 def get_upload_path(instance, filename):
     return f"{instance.workspace.id}/{uuid4().hex}-{filename}"
 
@@ -548,6 +584,50 @@ class IssueSequence(ProjectBaseModel):
         ordering = ("-created_at",)
 
 
+class ProjectIssueSequence(TimeAuditModel):
+    """The last issue sequence handed out in a project"""
+
+    project = models.OneToOneField(
+        "db.Project",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="issue_sequence_counter",
+    )
+    last_sequence = models.PositiveBigIntegerField(default=0)
+
+    class Meta:
+        verbose_name = "Project Issue Sequence"
+        verbose_name_plural = "Project Issue Sequences"
+        db_table = "project_issue_sequences"
+
+    def __str__(self):
+        return f"{self.project_id} <{self.last_sequence}>"
+
+    @classmethod
+    def reserve(cls, project_id, count=1):
+        """
+        Reserve a block of `count` sequences and return the first one. Only
+        the counter row of the project is locked, until the surrounding
+        transaction commits.
+        """
+        with transaction.atomic():
+            # Projects without a counter continue after their largest sequence
+            cls.objects.get_or_create(
+                project_id=project_id,
+                defaults={
+                    "last_sequence": lambda: IssueSequence.all_objects.filter(
+                        project_id=project_id
+                    ).aggregate(largest=models.Max("sequence"))["largest"]
+                    or 0
+                },
+            )
+            counter = cls.objects.select_for_update().get(pk=project_id)
+            first_sequence = counter.last_sequence + 1
+            counter.last_sequence += count
+            counter.save(update_fields=["last_sequence", "updated_at"])
+        return first_sequence
+
+
 class IssueSubscriber(ProjectBaseModel):
     issue = models.ForeignKey(
         Issue, on_delete=models.CASCADE, related_name="issue_subscribers"
@@ -757,3 +837,18 @@ class IssueVersion(ProjectBaseModel):
         except Exception as e:
             log_exception(e)
             return False
+
+
+# Everything published boards show of an issue refreshes their cached responses
+@receiver([post_save, post_delete], sender=Issue)
+@receiver([post_save, post_delete], sender=IssueAssignee)
+@receiver([post_save, post_delete], sender=IssueLabel)
+@receiver([post_save, post_delete], sender=IssueLink)
+@receiver([post_save, post_delete], sender=IssueComment)
+@receiver([post_save, post_delete], sender=IssueReaction)
+@receiver([post_save, post_delete], sender=IssueVote)
+def bump_issue_project_revision(sender, instance, **kwargs):
+    # Module imports
+    from plane.utils.cache import bump_project_revision
+
+    transaction.on_commit(partial(bump_project_revision, instance.project_id))
@@ -0,0 +1,55 @@
+# Django imports
+from django.db import models
+
+# Module imports
+from ..mixins import TimeAuditModel
+
+
+class ProjectSyncVersion(TimeAuditModel):
+    """The latest change version handed out for the issues of a project"""
+
+    project = models.OneToOneField(
+        "db.Project",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="sync_version",
+    )
+    version = models.BigIntegerField(default=0)
+    # Latest version whose issue was hard deleted together with its tombstone
+    purged_version = models.BigIntegerField(default=0)
+
+    class Meta:
+        verbose_name = "Project Sync Version"
+        verbose_name_plural = "Project Sync Versions"
+        db_table = "project_sync_versions"
+
+    def __str__(self):
+        return f"{self.project_id} <{self.version}>"
+
+
+class IssueSyncVersion(TimeAuditModel):
+    """The project version at which an issue last changed"""
+
+    issue = models.OneToOneField(
+        "db.Issue",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="sync_version",
+    )
+    project = models.ForeignKey(
+        "db.Project", on_delete=models.CASCADE, related_name="+"
+    )
+    version = models.BigIntegerField()
+
+    class Meta:
+        verbose_name = "Issue Sync Version"
+        verbose_name_plural = "Issue Sync Versions"
+        db_table = "issue_sync_versions"
+        indexes = [
+            models.Index(
+                fields=["project", "version"], name="issue_sync_version_project_idx"
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.issue_id} <{self.version}>"
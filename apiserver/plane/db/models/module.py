@@ -1,10 +1,16 @@
+# Python imports
+from functools import partial
+
 # Django imports
 from django.conf import settings
-from django.db import models
+from django.db import models, transaction
 from django.db.models import Q
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 # Module imports
 from .project import ProjectBaseModel
+from plane.utils.search import search_indexes
 
 
 def get_default_filters():
@@ -103,6 +109,7 @@ class Module(ProjectBaseModel):
         verbose_name = "Module"
         verbose_name_plural = "Modules"
         db_table = "modules"
+        indexes = search_indexes("module")
         ordering = ("-created_at",)
 
     def save(self, *args, **kwargs):
@@ -215,3 +222,11 @@ class ModuleUserProperties(ProjectBaseModel):
 
     def __str__(self):
         return f"{self.module.name} {self.user.email}"
+
+
+@receiver([post_save, post_delete], sender=ModuleIssue)
+def bump_module_issue_project_revision(sender, instance, **kwargs):
+    # Module imports
+    from plane.utils.cache import bump_project_revision
+
+    transaction.on_commit(partial(bump_project_revision, instance.project_id))
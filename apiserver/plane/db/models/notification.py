@@ -123,3 +123,11 @@ class EmailNotificationLog(BaseModel):
         verbose_name_plural = "Email Notification Logs"
         db_table = "email_notification_logs"
         ordering = ("-created_at",)
+        indexes = [
+            # Pending rows in the order the digests are stacked
+            models.Index(
+                fields=["receiver", "created_at"],
+                condition=models.Q(processed_at__isnull=True),
+                name="email_log_pending_idx",
+            )
+        ]
@@ -7,7 +7,9 @@ from django.utils import timezone
 from django.db import models
 
 # Module imports
+from plane.utils.html_delta import apply_html_delta
 from plane.utils.html_processor import strip_tags
+from plane.utils.search import search_indexes
 
 from .base import BaseModel
 
@@ -50,11 +52,14 @@ class Page(BaseModel):
     projects = models.ManyToManyField(
         "db.Project", related_name="pages", through="db.ProjectPage"
     )
+    # Bumped by every change of the description html
+    description_revision = models.PositiveIntegerField(default=0)
 
     class Meta:
         verbose_name = "Page"
         verbose_name_plural = "Pages"
         db_table = "pages"
+        indexes = search_indexes("page")
         ordering = ("-created_at",)
 
     def __str__(self):
@@ -172,6 +177,11 @@ class PageVersion(BaseModel):
     description_html = models.TextField(blank=True, default="<p></p>")
     description_stripped = models.TextField(blank=True, null=True)
     description_json = models.JSONField(default=dict, blank=True)
+    # Versions with a base snapshot keep only the html delta against it
+    base = models.ForeignKey(
+        "self", on_delete=models.CASCADE, null=True, related_name="deltas"
+    )
+    description_delta = models.JSONField(null=True)
 
     class Meta:
         verbose_name = "Page Version"
@@ -187,3 +197,11 @@ class PageVersion(BaseModel):
             else strip_tags(self.description_html)
         )
         super(PageVersion, self).save(*args, **kwargs)
+
+    def resolve_description_html(self):
+        """Rebuild the html of a delta version from its snapshot"""
+        if self.base_id is not None:
+            self.description_html = apply_html_delta(
+                self.base.description_html, self.description_delta
+            )
+        return self.description_html
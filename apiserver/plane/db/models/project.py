@@ -7,9 +7,12 @@ from django.conf import settings
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
 from django.db.models import Q
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 # Module imports
 from plane.db.mixins import AuditModel
+from plane.utils.search import search_indexes
 
 # Module imports
 from .base import BaseModel
@@ -155,6 +158,7 @@ class Project(BaseModel):
         verbose_name = "Project"
         verbose_name_plural = "Projects"
         db_table = "projects"
+        indexes = search_indexes("project")
         ordering = ("-created_at",)
 
     def save(self, *args, **kwargs):
@@ -243,6 +247,14 @@ class ProjectMember(ProjectBaseModel):
         return f"{self.member.email} <{self.project.name}>"
 
 
+@receiver([post_save, post_delete], sender=ProjectMember)
+def invalidate_project_member_roles(sender, instance, **kwargs):
+    # Module imports
+    from plane.utils.membership import invalidate_memberships
+
+    invalidate_memberships(instance.member_id)
+
+
 # TODO: Remove workspace relation later
 class ProjectIdentifier(AuditModel):
     workspace = models.ForeignKey(
@@ -5,6 +5,7 @@ from django.db import models
 # Module import
 from .workspace import WorkspaceBaseModel
 from plane.utils.issue_filters import issue_filters
+from plane.utils.search import search_indexes
 
 
 def get_default_filters():
@@ -72,6 +73,7 @@ class IssueView(WorkspaceBaseModel):
         verbose_name = "Issue View"
         verbose_name_plural = "Issue Views"
         db_table = "issue_views"
+        indexes = search_indexes("issue_view")
         ordering = ("-created_at",)
 
     def save(self, *args, **kwargs):
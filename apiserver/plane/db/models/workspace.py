@@ -5,6 +5,8 @@ import pytz
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 # Module imports
 from .base import BaseModel
@@ -213,6 +215,14 @@ class WorkspaceMember(BaseModel):
         return f"{self.member.email} <{self.workspace.name}>"
 
 
+@receiver([post_save, post_delete], sender=WorkspaceMember)
+def invalidate_workspace_member_roles(sender, instance, **kwargs):
+    # Module imports
+    from plane.utils.membership import invalidate_memberships
+
+    invalidate_memberships(instance.member_id)
+
+
 class WorkspaceMemberInvite(BaseModel):
     workspace = models.ForeignKey(
         "db.Workspace", on_delete=models.CASCADE, related_name="workspace_member_invite"
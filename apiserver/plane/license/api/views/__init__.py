@@ -12,6 +12,7 @@ from .configuration import (
     
 from .admin import (
     InstanceAdminEndpoint,
+    InstanceCacheStatsEndpoint,
     InstanceAdminSignInEndpoint,
     InstanceAdminSignUpEndpoint,
     InstanceAdminUserMeEndpoint,
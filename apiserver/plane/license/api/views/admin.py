@@ -26,7 +26,8 @@ from plane.license.api.serializers import (
 )
 from plane.license.models import Instance, InstanceAdmin
 from plane.db.models import User, Profile
-from plane.utils.cache import cache_response, invalidate_cache
+from plane.settings.redis import redis_pool_stats
+from plane.utils.cache import cache_response, get_cache_stats, invalidate_cache
 from plane.authentication.utils.login import user_login
 from plane.authentication.utils.host import base_host, user_ip
 from plane.authentication.adapter.error import (
@@ -84,6 +85,18 @@ class InstanceAdminEndpoint(BaseAPIView):
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
+class InstanceCacheStatsEndpoint(BaseAPIView):
+    permission_classes = [InstanceAdminPermission]
+
+    def get(self, request):
+        # The response cache counters are shared by every process, the pool
+        # is the one of the process serving the request
+        return Response(
+            {"response_cache": get_cache_stats(), "redis_pool": redis_pool_stats()},
+            status=status.HTTP_200_OK,
+        )
+
+
 class InstanceAdminSignUpEndpoint(View):
     permission_classes = [AllowAny]
 
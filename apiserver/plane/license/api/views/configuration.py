@@ -21,7 +21,10 @@ from plane.license.models import InstanceConfiguration
 from plane.license.api.serializers import InstanceConfigurationSerializer
 from plane.license.utils.encryption import encrypt_data
 from plane.utils.cache import cache_response, invalidate_cache
-from plane.license.utils.instance_value import get_email_configuration
+from plane.license.utils.instance_value import (
+    get_email_configuration,
+    invalidate_configuration,
+)
 
 
 class InstanceConfigurationEndpoint(BaseAPIView):
@@ -52,6 +55,8 @@ class InstanceConfigurationEndpoint(BaseAPIView):
         InstanceConfiguration.objects.bulk_update(
             bulk_configurations, ["value"], batch_size=100
         )
+        # bulk_update skips the save signals
+        invalidate_configuration()
 
         serializer = InstanceConfigurationSerializer(configurations, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
@@ -4,9 +4,11 @@ import uuid
 import re
 
 # Django imports
-from django.db import models
+from django.db import models, transaction
 from django.conf import settings
 from django.core.exceptions import ValidationError
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 # Module imports
 from plane.db.models import BaseModel
@@ -84,6 +86,14 @@ class InstanceConfiguration(BaseModel):
         ordering = ("-created_at",)
 
 
+@receiver([post_save, post_delete], sender=InstanceConfiguration)
+def invalidate_instance_configuration(sender, instance, **kwargs):
+    # Module imports
+    from plane.license.utils.instance_value import invalidate_configuration
+
+    transaction.on_commit(invalidate_configuration)
+
+
 class ChangeLog(BaseModel):
     """Change Log model to store the release changelogs made in the application."""
 
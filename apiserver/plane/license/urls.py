@@ -3,6 +3,7 @@ from django.urls import path
 from plane.license.api.views import (
     EmailCredentialCheckEndpoint,
     InstanceAdminEndpoint,
+    InstanceCacheStatsEndpoint,
     InstanceAdminSignInEndpoint,
     InstanceAdminSignUpEndpoint,
     InstanceConfigurationEndpoint,
@@ -52,6 +53,11 @@ urlpatterns = [
         SignUpScreenVisitedEndpoint.as_view(),
         name="instance-sign-up",
     ),
+    path(
+        "cache-stats/",
+        InstanceCacheStatsEndpoint.as_view(),
+        name="instance-cache-stats",
+    ),
     path(
         "email-credentials-check/",
         EmailCredentialCheckEndpoint.as_view(),
@@ -1,11 +1,14 @@
 import base64
 import hashlib
+from functools import lru_cache
 from django.conf import settings
 from cryptography.fernet import Fernet
 
 from plane.utils.exception_logger import log_exception
 
 
+# The derivation runs 100k hashing rounds, so derive each key once per process
+@lru_cache(maxsize=4)
 def derive_key(secret_key):
     # Use a key derivation function to get a suitable encryption key
     dk = hashlib.pbkdf2_hmac("sha256", secret_key.encode(), b"salt", 100000)
@@ -1,5 +1,10 @@
 # Python imports
 import os
+import time
+from collections import namedtuple
+
+# Third party imports
+from redis import RedisError
 
 # Django imports
 from django.conf import settings
@@ -7,6 +12,81 @@ from django.conf import settings
 # Module imports
 from plane.license.models import InstanceConfiguration
 from plane.license.utils.encryption import decrypt_data
+from plane.settings.redis import redis_instance
+from plane.utils.exception_logger import log_exception
+
+# Redis counter bumped on every configuration change, processes reload their
+# copy when it moves
+CONFIGURATION_VERSION_KEY = "instance_configuration_version"
+
+# Seconds a process trusts its copy before checking the version again, and
+# before reloading it anyway in case a change was never announced
+CONFIGURATION_VERSION_CHECK_INTERVAL = 5
+CONFIGURATION_MAX_AGE = 5 * 60
+
+ConfigurationState = namedtuple(
+    "ConfigurationState", ["values", "version", "loaded_at", "checked_at"]
+)
+
+_state = None
+
+
+def configuration_version():
+    try:
+        return redis_instance().get(CONFIGURATION_VERSION_KEY)
+    except RedisError:
+        # Without redis the copy is only refreshed by its max age
+        return None
+
+
+def load_configuration():
+    """Read and decrypt the whole configuration table"""
+    return {
+        item["key"]: (
+            decrypt_data(item["value"]) if item["is_encrypted"] else item["value"]
+        )
+        for item in InstanceConfiguration.objects.values(
+            "key", "value", "is_encrypted"
+        )
+    }
+
+
+def instance_configuration():
+    """
+    The decrypted configuration of the instance, loaded once per process and
+    reloaded when the version in redis changes.
+    """
+    global _state
+    state = _state
+    now = time.monotonic()
+    if (
+        state is not None
+        and now - state.checked_at < CONFIGURATION_VERSION_CHECK_INTERVAL
+    ):
+        return state.values
+
+    # Read the version before the table, a change in between reloads again
+    version = configuration_version()
+    if (
+        state is None
+        or state.version != version
+        or now - state.loaded_at > CONFIGURATION_MAX_AGE
+    ):
+        state = ConfigurationState(load_configuration(), version, now, now)
+    else:
+        state = state._replace(checked_at=now)
+    _state = state
+    return state.values
+
+
+def invalidate_configuration():
+    """Drop the copy of this process and make every other process reload"""
+    global _state
+    _state = None
+    try:
+        redis_instance().incr(CONFIGURATION_VERSION_KEY)
+    except RedisError as e:
+        log_exception(e)
 
 
 # Helper function to return value from the passed key
@@ -14,21 +94,11 @@ def get_configuration_value(keys):
     environment_list = []
     if settings.SKIP_ENV_VAR:
         # Get the configurations
-        instance_configuration = InstanceConfiguration.objects.values(
-            "key", "value", "is_encrypted"
-        )
-
+        configuration = instance_configuration()
         for key in keys:
-            for item in instance_configuration:
-                if key.get("key") == item.get("key"):
-                    if item.get("is_encrypted", False):
-                        environment_list.append(decrypt_data(item.get("value")))
-                    else:
-                        environment_list.append(item.get("value"))
-
-                    break
-            else:
-                environment_list.append(key.get("default"))
+            environment_list.append(
+                configuration.get(key.get("key"), key.get("default"))
+            )
     else:
         # Get the configuration from os
         for key in keys:
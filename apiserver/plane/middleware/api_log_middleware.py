@@ -1,4 +1,112 @@
+# Python imports
+import atexit
+import os
+import queue
+import random
+import threading
+import time
+
+# Django imports
+from django.conf import settings
+from django.db import close_old_connections
+
+# Third party imports
+from crum import get_current_user
+
+# Module imports
 from plane.db.models import APIActivityLog
+from plane.utils.exception_logger import log_exception
+
+# Logs written per insert and seconds a partial batch waits for more logs
+API_LOG_BATCH_SIZE = 200
+API_LOG_FLUSH_INTERVAL = 2
+# Logs held in memory before new ones are dropped
+API_LOG_QUEUE_SIZE = 10000
+
+
+def truncate_body(body):
+    """Decode the first API_LOG_BODY_LIMIT characters of a body"""
+    if not body or settings.API_LOG_BODY_LIMIT <= 0:
+        return None
+    # UTF-8 uses at most four bytes a character
+    body = body[: settings.API_LOG_BODY_LIMIT * 4].decode("utf-8", errors="replace")
+    return body[: settings.API_LOG_BODY_LIMIT]
+
+
+class APIActivityLogWriter:
+    """
+    Collects the API activity logs of the process in memory and writes them
+    with bulk inserts from a background thread, off the request path.
+    """
+
+    def __init__(self):
+        self.queue = queue.Queue(maxsize=API_LOG_QUEUE_SIZE)
+        self.lock = threading.Lock()
+        self.thread = None
+        self.pid = None
+
+    def put(self, log):
+        self.start()
+        try:
+            self.queue.put_nowait(log)
+        except queue.Full:
+            # The database is behind, losing logs beats blocking requests
+            pass
+
+    def start(self):
+        # Threads do not survive a fork, every worker process starts its own
+        if self.thread is not None and self.pid == os.getpid():
+            return
+        with self.lock:
+            if self.thread is not None and self.pid == os.getpid():
+                return
+            self.queue = queue.Queue(maxsize=API_LOG_QUEUE_SIZE)
+            self.thread = threading.Thread(
+                target=self.run, name="api-activity-log-writer", daemon=True
+            )
+            self.pid = os.getpid()
+            self.thread.start()
+
+    def next_batch(self):
+        batch = [self.queue.get()]
+        deadline = time.monotonic() + API_LOG_FLUSH_INTERVAL
+        while len(batch) < API_LOG_BATCH_SIZE:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(self.queue.get(timeout=timeout))
+            except queue.Empty:
+                break
+        return batch
+
+    def run(self):
+        while True:
+            self.write(self.next_batch())
+
+    def write(self, batch):
+        try:
+            APIActivityLog.objects.bulk_create(batch, batch_size=API_LOG_BATCH_SIZE)
+        except Exception as e:
+            log_exception(e)
+        finally:
+            # Drop the connection of the thread once it is past its age or broken
+            close_old_connections()
+
+    def flush(self):
+        """Write the logs still queued, used when the process exits"""
+        batch = []
+        while True:
+            try:
+                batch.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        if batch:
+            self.write(batch)
+
+
+api_log_writer = APIActivityLogWriter()
+atexit.register(api_log_writer.flush)
 
 
 class APITokenLogMiddleware:
@@ -16,20 +124,36 @@ class APITokenLogMiddleware:
         api_key = request.headers.get(api_key_header)
         # If the API key is present, log the request
         if api_key:
+            # Successful requests are sampled, failures are always kept
+            if response.status_code < 400 and random.random() >= (
+                settings.API_LOG_SAMPLE_RATE
+            ):
+                return None
+
             try:
-                APIActivityLog.objects.create(
-                    token_identifier=api_key,
-                    path=request.path,
-                    method=request.method,
-                    query_params=request.META.get("QUERY_STRING", ""),
-                    headers=str(request.headers),
-                    body=(request_body.decode("utf-8") if request_body else None),
-                    response_body=(
-                        response.content.decode("utf-8") if response.content else None
-                    ),
-                    response_code=response.status_code,
-                    ip_address=request.META.get("REMOTE_ADDR", None),
-                    user_agent=request.META.get("HTTP_USER_AGENT", None),
+                user = get_current_user()
+                api_log_writer.put(
+                    APIActivityLog(
+                        token_identifier=api_key,
+                        path=request.path,
+                        method=request.method,
+                        query_params=request.META.get("QUERY_STRING", ""),
+                        headers=str(request.headers),
+                        body=truncate_body(request_body),
+                        response_body=(
+                            None
+                            if response.streaming
+                            else truncate_body(response.content)
+                        ),
+                        response_code=response.status_code,
+                        ip_address=request.META.get("REMOTE_ADDR", None),
+                        user_agent=request.META.get("HTTP_USER_AGENT", None),
+                        created_by_id=(
+                            user.id
+                            if user is not None and not user.is_anonymous
+                            else None
+                        ),
+                    )
                 )
 
             except Exception as e:
@@ -336,6 +336,13 @@ APP_BASE_URL = os.environ.get("APP_BASE_URL")
 
 HARD_DELETE_AFTER_DAYS = int(os.environ.get("HARD_DELETE_AFTER_DAYS", 60))
 
+# API activity logs
+# Characters of the request and response bodies kept per log, 0 keeps none
+API_LOG_BODY_LIMIT = int(os.environ.get("API_LOG_BODY_LIMIT", 10000))
+# Share of the successful requests logged, failed requests are always logged
+API_LOG_SAMPLE_RATE = float(os.environ.get("API_LOG_SAMPLE_RATE", 1))
+API_LOG_RETENTION_DAYS = int(os.environ.get("API_LOG_RETENTION_DAYS", 30))
+
 # Instance Changelog URL
 INSTANCE_CHANGELOG_URL = os.environ.get("INSTANCE_CHANGELOG_URL", "")
 
@@ -1,20 +1,128 @@
+import os
+import threading
+import time
+from collections import Counter
+
 import redis
 from django.conf import settings
 from urllib.parse import urlparse
 
+# Connections each process keeps to redis and seconds a command waits for one
+REDIS_MAX_CONNECTIONS = int(os.environ.get("REDIS_MAX_CONNECTIONS", 50))
+REDIS_POOL_TIMEOUT = int(os.environ.get("REDIS_POOL_TIMEOUT", 5))
+REDIS_SOCKET_TIMEOUT = int(os.environ.get("REDIS_SOCKET_TIMEOUT", 5))
+
+_pool = None
+_pool_lock = threading.Lock()
+
+# Process local counters of the pool, each process has its own pool
+_stats = Counter()
+_stats_lock = threading.Lock()
+
+
+def _record(event, amount=1):
+    with _stats_lock:
+        _stats[event] += amount
+
+
+class InstrumentedConnectionPool(redis.BlockingConnectionPool):
+    """
+    Blocking pool that counts its checkouts, the ones that had to wait for a
+    connection to be released and the ones that gave up after the timeout
+    """
+
+    def get_connection(self, command_name, *keys, **options):
+        _record("checkouts")
+        # Every connection is checked out, the command waits for a release
+        waiting = self.pool.empty()
+        started = time.monotonic()
+        try:
+            return super().get_connection(command_name, *keys, **options)
+        except redis.ConnectionError as e:
+            # Raised by the pool itself when no connection is released in time
+            if str(e) == "No connection available.":
+                _record("timeouts")
+            else:
+                _record("connection_errors")
+            raise
+        finally:
+            if waiting:
+                _record("waits")
+                _record("wait_ms", int((time.monotonic() - started) * 1000))
+
+
+def redis_pool():
+    """
+    The connection pool of the process. A pool created before a fork of the
+    celery or gunicorn workers drops the inherited connections in the child
+    on its first checkout, so every worker ends up with its own sockets.
+    """
+    global _pool
+    if _pool is not None:
+        return _pool
+
+    with _pool_lock:
+        if _pool is None:
+            options = {
+                "max_connections": REDIS_MAX_CONNECTIONS,
+                "timeout": REDIS_POOL_TIMEOUT,
+                "socket_timeout": REDIS_SOCKET_TIMEOUT,
+                "socket_connect_timeout": REDIS_SOCKET_TIMEOUT,
+                "health_check_interval": 30,
+            }
+            if settings.REDIS_SSL:
+                url = urlparse(settings.REDIS_URL)
+                _pool = InstrumentedConnectionPool(
+                    connection_class=redis.SSLConnection,
+                    host=url.hostname,
+                    port=url.port,
+                    password=url.password,
+                    ssl_cert_reqs=None,
+                    **options,
+                )
+            else:
+                _pool = InstrumentedConnectionPool.from_url(
+                    settings.REDIS_URL, db=0, **options
+                )
+    return _pool
+
 
 def redis_instance():
-    # connect to redis
-    if settings.REDIS_SSL:
-        url = urlparse(settings.REDIS_URL)
-        ri = redis.Redis(
-            host=url.hostname,
-            port=url.port,
-            password=url.password,
-            ssl=True,
-            ssl_cert_reqs=None,
-        )
-    else:
-        ri = redis.Redis.from_url(settings.REDIS_URL, db=0)
-
-    return ri
+    # clients are cheap, the connections come from the pool of the process
+    return redis.Redis(connection_pool=redis_pool())
+
+
+def redis_pool_stats():
+    """Return the size, the connections and the checkout counters of the pool"""
+    pool = redis_pool()
+    # The queue holds the idle connections and a placeholder per unopened slot
+    idle = sum(1 for connection in list(pool.pool.queue) if connection is not None)
+    with _stats_lock:
+        return {
+            "max_connections": pool.max_connections,
+            "open_connections": len(pool._connections),
+            "in_use_connections": len(pool._connections) - idle,
+            "idle_connections": idle,
+            "checkouts": _stats["checkouts"],
+            "waits": _stats["waits"],
+            "wait_ms": _stats["wait_ms"],
+            "timeouts": _stats["timeouts"],
+            "connection_errors": _stats["connection_errors"],
+        }
+
+
+def redis_get_many(keys):
+    """Fetch the values of the keys in one round trip, missing keys map to None"""
+    if not keys:
+        return {}
+    return dict(zip(keys, redis_instance().mget(keys)))
+
+
+def redis_set_many(mapping, ex=None):
+    """Set the keys in one pipelined round trip"""
+    if not mapping:
+        return
+    with redis_instance().pipeline(transaction=False) as pipe:
+        for key, value in mapping.items():
+            pipe.set(key, value, ex=ex)
+        pipe.execute()
@@ -1,5 +1,6 @@
 # Python imports
 import os
+import threading
 
 # Third party imports
 import boto3
@@ -11,6 +12,45 @@ from plane.utils.exception_logger import log_exception
 from storages.backends.s3boto3 import S3Boto3Storage
 from django.conf import settings
 
+# Connections each pooled client keeps open to the object store
+S3_MAX_POOL_CONNECTIONS = int(os.environ.get("AWS_S3_MAX_POOL_CONNECTIONS", 50))
+
+_s3_clients = {}
+_s3_clients_lock = threading.Lock()
+
+
+def get_s3_client(
+    aws_access_key_id=None,
+    aws_secret_access_key=None,
+    region_name=None,
+    endpoint_url=None,
+):
+    """
+    The S3 client of the process for the given credentials and endpoint.
+    Clients are thread safe, so one is built per configuration and shared.
+    """
+    key = (aws_access_key_id, aws_secret_access_key, region_name, endpoint_url)
+    client = _s3_clients.get(key)
+    if client is not None:
+        return client
+
+    with _s3_clients_lock:
+        client = _s3_clients.get(key)
+        if client is None:
+            client = boto3.client(
+                "s3",
+                aws_access_key_id=aws_access_key_id,
+                aws_secret_access_key=aws_secret_access_key,
+                region_name=region_name,
+                endpoint_url=endpoint_url,
+                config=boto3.session.Config(
+                    signature_version="s3v4",
+                    max_pool_connections=S3_MAX_POOL_CONNECTIONS,
+                ),
+            )
+            _s3_clients[key] = client
+    return client
+
 
 class S3Storage(S3Boto3Storage):
     def url(self, name, parameters=None, expire=None, http_method=None):
@@ -32,26 +72,13 @@ class S3Storage(S3Boto3Storage):
             "AWS_S3_ENDPOINT_URL"
         ) or os.environ.get("MINIO_ENDPOINT_URL")
 
-        if os.environ.get("USE_MINIO") == "1":
-            # Create an S3 client for MinIO
-            self.s3_client = boto3.client(
-                "s3",
-                aws_access_key_id=self.aws_access_key_id,
-                aws_secret_access_key=self.aws_secret_access_key,
-                region_name=self.aws_region,
-                endpoint_url=self.aws_s3_endpoint_url,
-                config=boto3.session.Config(signature_version="s3v4"),
-            )
-        else:
-            # Create an S3 client
-            self.s3_client = boto3.client(
-                "s3",
-                aws_access_key_id=self.aws_access_key_id,
-                aws_secret_access_key=self.aws_secret_access_key,
-                region_name=self.aws_region,
-                endpoint_url=self.aws_s3_endpoint_url,
-                config=boto3.session.Config(signature_version="s3v4"),
-            )
+        # Reuse the client of the process instead of building one per request
+        self.s3_client = get_s3_client(
+            aws_access_key_id=self.aws_access_key_id,
+            aws_secret_access_key=self.aws_secret_access_key,
+            region_name=self.aws_region,
+            endpoint_url=self.aws_s3_endpoint_url,
+        )
 
     def generate_presigned_post(
         self, object_name, file_type, file_size, expiration=3600
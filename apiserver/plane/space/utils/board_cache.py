@@ -0,0 +1,101 @@
+# Python imports
+import hashlib
+from functools import wraps
+from urllib.parse import urlencode
+
+# Django imports
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.http import parse_etags, quote_etag
+
+# Third party imports
+from rest_framework import status
+from rest_framework.response import Response
+
+# Module imports
+from plane.db.models import DeployBoard
+from plane.utils.cache import get_generations, project_revision_key
+
+# Seconds a published board resolution and a board response stay cached, the
+# project revision invalidates the responses long before on every change
+PUBLIC_BOARD_TIMEOUT = 10 * 60
+
+
+def public_board_key(anchor):
+    return f"public_board:{anchor}"
+
+
+def resolve_public_board(anchor):
+    """The project id and workspace slug of a published project board"""
+    board = cache.get(public_board_key(anchor))
+    if board is not None:
+        return board
+
+    deploy_board = (
+        DeployBoard.objects.filter(anchor=anchor, entity_name="project")
+        .select_related("workspace")
+        .first()
+    )
+    if deploy_board is None:
+        return None
+    board = {
+        "project_id": str(deploy_board.entity_identifier),
+        "slug": deploy_board.workspace.slug,
+    }
+    cache.set(public_board_key(anchor), board, PUBLIC_BOARD_TIMEOUT)
+    return board
+
+
+def invalidate_public_board(anchor):
+    cache.delete(public_board_key(anchor))
+
+
+def etag_matches(request, etag):
+    # The gzip middleware weakens the etags it compresses
+    tags = parse_etags(request.headers.get("If-None-Match", ""))
+    return "*" in tags or etag in [tag.removeprefix("W/") for tag in tags]
+
+
+def cache_public_board(timeout=PUBLIC_BOARD_TIMEOUT):
+    """
+    Share the responses of a published board between all visitors. The key
+    folds in the anchor, the query parameters and the revision of the project,
+    so a hit or a 304 needs no database query. Every write shown on the board
+    bumps the revision.
+    """
+
+    def decorator(view_func):
+        @wraps(view_func)
+        def _wrapped_view(instance, request, anchor, *args, **kwargs):
+            board = resolve_public_board(anchor)
+            if board is None:
+                return view_func(instance, request, anchor, *args, **kwargs)
+
+            (revision,) = get_generations([project_revision_key(board["project_id"])])
+            params = urlencode(sorted(request.GET.lists()), doseq=True)
+            digest = hashlib.sha256(f"{anchor}:{params}:{revision}".encode())
+            etag = quote_etag(digest.hexdigest()[:32])
+            headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+            # The expiry of the cached response bounds how long a change that
+            # skipped the revision is served, a 304 needs it to still exist
+            key = f"public_board_response:{etag}"
+            cached_result = cache.get(key)
+            if cached_result is not None:
+                if etag_matches(request, etag):
+                    return Response(
+                        status=status.HTTP_304_NOT_MODIFIED, headers=headers
+                    )
+                return Response(cached_result, headers=headers)
+
+            response = view_func(instance, request, anchor, *args, **kwargs)
+            if response.status_code == 200:
+                if not settings.DEBUG:
+                    cache.set(key, response.data, timeout)
+                for header, value in headers.items():
+                    response[header] = value
+            return response
+
+        return _wrapped_view
+
+    return decorator
@@ -18,7 +18,6 @@ from django.db.models import (
     JSONField,
     Value,
     OuterRef,
-    Func,
     CharField,
     Subquery,
 )
@@ -39,9 +38,11 @@ from plane.space.utils.grouper import (
     issue_on_results,
     issue_queryset_grouper,
 )
+from plane.space.utils.board_cache import cache_public_board, resolve_public_board
 
 
 from plane.utils.order_queryset import order_issue_queryset
+from plane.utils.issue_counters import issue_counter_annotations
 from plane.utils.paginator import GroupedOffsetPaginator, SubGroupedOffsetPaginator
 from plane.app.serializers import (
     CommentReactionSerializer,
@@ -52,14 +53,12 @@ from plane.app.serializers import (
 from plane.db.models import (
     Issue,
     IssueComment,
-    IssueLink,
     IssueReaction,
     ProjectMember,
     CommentReaction,
     DeployBoard,
     IssueVote,
     ProjectPublicMember,
-    FileAsset,
     CycleIssue,
 )
 from plane.bgtasks.issue_activities_task import issue_activity
@@ -69,62 +68,27 @@ from plane.utils.issue_filters import issue_filters
 class ProjectIssuesPublicEndpoint(BaseAPIView):
     permission_classes = [AllowAny]
 
+    @cache_public_board()
     def get(self, request, anchor):
         filters = issue_filters(request.query_params, "GET")
         order_by_param = request.GET.get("order_by", "-created_at")
 
-        deploy_board = DeployBoard.objects.filter(
-            anchor=anchor, entity_name="project"
-        ).first()
-        if not deploy_board:
+        board = resolve_public_board(anchor)
+        if not board:
             return Response(
                 {"error": "Project is not published"}, status=status.HTTP_404_NOT_FOUND
             )
 
-        project_id = deploy_board.entity_identifier
-        slug = deploy_board.workspace.slug
+        project_id = board["project_id"]
+        slug = board["slug"]
 
+        # The results are built from values, reactions and votes are
+        # aggregated there rather than prefetched
         issue_queryset = (
             Issue.issue_objects.filter(workspace__slug=slug, project_id=project_id)
             .select_related("workspace", "project", "state", "parent")
             .prefetch_related("assignees", "labels", "issue_module__module")
-            .prefetch_related(
-                Prefetch(
-                    "issue_reactions",
-                    queryset=IssueReaction.objects.select_related("actor"),
-                )
-            )
-            .prefetch_related(
-                Prefetch("votes", queryset=IssueVote.objects.select_related("actor"))
-            )
-            .annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(
-                        issue=OuterRef("id"), deleted_at__isnull=True
-                    ).values("cycle_id")[:1]
-                )
-            )
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            .annotate(**issue_counter_annotations())
         ).distinct()
 
         issue_queryset = issue_queryset.filter(**filters)
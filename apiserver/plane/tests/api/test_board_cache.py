@@ -0,0 +1,82 @@
+# Python imports
+from unittest import mock
+
+# Django imports
+from django.core.cache import cache
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+# Third party import
+from rest_framework import status
+from rest_framework.response import Response
+
+# Module imports
+from plane.space.utils.board_cache import cache_public_board
+
+BOARD = {"project_id": "8a5b3c9e-5c1d-4a4b-9f0e-1d2c3b4a5f60", "slug": "plane"}
+
+
+class BoardView:
+    def __init__(self):
+        self.calls = 0
+
+    @cache_public_board()
+    def get(self, request, anchor):
+        self.calls += 1
+        return Response({"issues": [], "calls": self.calls})
+
+
+@override_settings(
+    DEBUG=False,
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+)
+class PublicBoardCacheTest(SimpleTestCase):
+    def setUp(self):
+        # A published board whose project revision stays put unless patched
+        patches = {"resolve_public_board": BOARD, "get_generations": [1]}
+        for target, value in patches.items():
+            patcher = mock.patch(
+                f"plane.space.utils.board_cache.{target}", return_value=value
+            )
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        cache.clear()
+        self.view = BoardView()
+        self.factory = RequestFactory()
+
+    def get(self, etag=None, **params):
+        headers = {"HTTP_IF_NONE_MATCH": etag} if etag else {}
+        return self.view.get(self.factory.get("/", params, **headers), "anchor")
+
+    def test_visitors_share_the_cached_response(self):
+        first = self.get()
+        second = self.get()
+        self.assertEqual(first.data, second.data)
+        self.assertEqual(self.view.calls, 1)
+        self.assertEqual(first["ETag"], second["ETag"])
+
+    def test_query_parameters_get_their_own_response(self):
+        self.assertNotEqual(self.get()["ETag"], self.get(layout="kanban")["ETag"])
+        self.assertEqual(self.view.calls, 2)
+
+    def test_matching_etag_is_not_modified(self):
+        etag = self.get()["ETag"]
+        response = self.get(etag=f"W/{etag}")
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(self.view.calls, 1)
+
+    def test_project_revision_changes_the_etag(self):
+        etag = self.get()["ETag"]
+        with mock.patch(
+            "plane.space.utils.board_cache.get_generations", return_value=[2]
+        ):
+            response = self.get(etag=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(self.view.calls, 2)
+
+    def test_expired_response_is_served_again(self):
+        etag = self.get()["ETag"]
+        cache.clear()
+        response = self.get(etag=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.view.calls, 2)
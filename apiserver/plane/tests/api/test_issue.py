@@ -1 +1,201 @@
-# TODO: Write Test for Issue Endpoints
+# Python imports
+from unittest import mock
+
+# Django imports
+from django.urls import reverse
+
+# Third party import
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+# Module imports
+from plane.db.models import (
+    Issue,
+    IssueAnalyticsRollup,
+    IssueAssignee,
+    IssueSyncVersion,
+    Project,
+    ProjectMember,
+    State,
+    User,
+    Workspace,
+    WorkspaceMember,
+)
+from plane.utils.analytics_rollup import (
+    ROLLUP_BUCKET_FIELDS,
+    ROLLUP_TOTAL,
+    apply_analytics_rollup_deltas,
+    refresh_analytics_rollup,
+)
+from plane.utils.issue_sync import record_issue_changes, record_purged_issues
+
+
+class IssueBaseTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create(email="user@plane.so", username="user")
+        self.workspace = Workspace.objects.create(
+            name="Plane", slug="plane", owner=self.user
+        )
+        WorkspaceMember.objects.create(
+            workspace=self.workspace, member=self.user, role=20
+        )
+        self.project = Project.objects.create(
+            name="Plane", identifier="PLN", workspace=self.workspace
+        )
+        ProjectMember.objects.create(
+            project=self.project, workspace=self.workspace, member=self.user, role=20
+        )
+
+        self.client = APIClient(HTTP_USER_AGENT="plane/test", REMOTE_ADDR="10.10.10.10")
+        self.client.force_authenticate(user=self.user)
+
+    def create_issues(self, count):
+        return [
+            Issue.objects.create(
+                name=f"Issue {index}", project=self.project, workspace=self.workspace
+            )
+            for index in range(count)
+        ]
+
+    def sync(self, cursor, expected_status=status.HTTP_200_OK):
+        url = reverse(
+            "project-issues-sync",
+            kwargs={"slug": self.workspace.slug, "project_id": self.project.id},
+        )
+        response = self.client.get(url, {"cursor": cursor})
+        self.assertEqual(response.status_code, expected_status)
+        return response.data
+
+
+class IssueSyncTest(IssueBaseTest):
+    def test_restricted_member_only_syncs_assigned_issues(self):
+        ProjectMember.objects.filter(member=self.user).update(role=8)
+        assigned, other = self.create_issues(2)
+        assignee = IssueAssignee.objects.create(
+            issue=assigned,
+            assignee=self.user,
+            project=self.project,
+            workspace=self.workspace,
+        )
+
+        changes = self.sync(0)
+        self.assertEqual(
+            [issue["id"] for issue in changes["results"]], [assigned.id]
+        )
+        self.assertNotIn(str(other.id), changes["deleted"])
+
+        # Unassigned issues are dropped from the local copy of the member
+        IssueAssignee.objects.filter(pk=assignee.pk).delete()
+        record_issue_changes(self.project.id, [assigned.id])
+        changes = self.sync(changes["cursor"])
+        self.assertEqual(changes["results"], [])
+        self.assertEqual(changes["deleted"], [str(assigned.id)])
+
+    def test_cursor_older_than_purged_tombstones_is_gone(self):
+        purged, _ = self.create_issues(2)
+        cursor = self.sync(0)["cursor"]
+
+        Issue.objects.filter(pk=purged.id).delete()
+        record_issue_changes(self.project.id, [purged.id])
+        latest = self.sync(cursor)["cursor"]
+        record_purged_issues(Issue.all_objects.filter(pk=purged.id))
+        Issue.all_objects.filter(pk=purged.id).delete()
+
+        self.sync(cursor, expected_status=status.HTTP_410_GONE)
+        self.assertEqual(self.sync(latest)["deleted"], [])
+
+
+class IssueAnalyticsRollupTest(IssueBaseTest):
+    def rollup(self):
+        return set(
+            IssueAnalyticsRollup.objects.filter(project=self.project).values_list(
+                *ROLLUP_BUCKET_FIELDS, "issue_count"
+            )
+        )
+
+    def test_deltas_match_a_full_refresh(self):
+        State.objects.create(
+            name="Todo",
+            group="unstarted",
+            default=True,
+            project=self.project,
+            workspace=self.workspace,
+        )
+        issues = self.create_issues(3)
+        refresh_analytics_rollup(self.project.id)
+
+        Issue.objects.filter(pk=issues[0].id).update(priority="high")
+        IssueAssignee.objects.create(
+            issue=issues[1],
+            assignee=self.user,
+            project=self.project,
+            workspace=self.workspace,
+        )
+        Issue.objects.filter(pk=issues[2].id).delete()
+        apply_analytics_rollup_deltas(self.project.id, [issue.id for issue in issues])
+
+        rows = IssueAnalyticsRollup.objects.filter(project=self.project)
+        self.assertEqual(rows.get(axis=ROLLUP_TOTAL).issue_count, 2)
+        self.assertEqual(rows.get(axis="priority", value="high").issue_count, 1)
+        self.assertEqual(
+            rows.get(axis="assignees__id", value=str(self.user.id)).issue_count, 1
+        )
+        # The deltas leave the rollup a full rebuild would write
+        incremental = self.rollup()
+        refresh_analytics_rollup(self.project.id)
+        self.assertEqual(self.rollup(), incremental)
+
+
+@mock.patch("plane.app.views.issue.base.schedule_analytics_rollup")
+class BulkDeleteIssuesTest(IssueBaseTest):
+
+    def test_bulk_delete_records_tombstones(self, _):
+        deleted, kept = self.create_issues(2), self.create_issues(1)
+        cursor = self.sync(0)["cursor"]
+
+        url = reverse(
+            "project-issues-bulk",
+            kwargs={"slug": self.workspace.slug, "project_id": self.project.id},
+        )
+        response = self.client.delete(
+            url, {"issue_ids": [str(issue.id) for issue in deleted]}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["message"], "2 issues were deleted")
+
+        # The deleted issues moved past the cursor of the client
+        self.assertEqual(
+            IssueSyncVersion.objects.filter(
+                issue_id__in=[issue.id for issue in deleted], version__gt=int(cursor)
+            ).count(),
+            2,
+        )
+        changes = self.sync(cursor)
+        self.assertEqual(
+            sorted(changes["deleted"]), sorted(str(issue.id) for issue in deleted)
+        )
+        self.assertEqual(changes["results"], [])
+        self.assertTrue(Issue.objects.filter(pk=kept[0].id).exists())
+
+
+@mock.patch("plane.api.views.issue.bulk_issue_activity")
+class IssueBulkAPITest(IssueBaseTest):
+    def test_duplicate_external_ids_conflict(self, _):
+        url = reverse(
+            "issue-bulk",
+            kwargs={"slug": self.workspace.slug, "project_id": self.project.id},
+        )
+        item = {"name": "Imported", "external_source": "jira", "external_id": "1"}
+        response = self.client.post(url, {"issues": [item, item]}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_207_MULTI_STATUS)
+
+        created, duplicate = response.data["results"]
+        self.assertEqual(created["status"], status.HTTP_201_CREATED)
+        self.assertEqual(duplicate["status"], status.HTTP_409_CONFLICT)
+        self.assertIsNone(duplicate["id"])
+        self.assertEqual(
+            Issue.objects.filter(
+                project=self.project, external_source="jira", external_id="1"
+            ).count(),
+            1,
+        )
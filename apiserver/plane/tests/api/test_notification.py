@@ -0,0 +1,73 @@
+# Python imports
+from unittest import mock
+
+# Django imports
+from django.urls import reverse
+from django.utils import timezone
+
+# Third party import
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+# Module imports
+from plane.db.models import Notification, User, Workspace, WorkspaceMember
+
+
+@mock.patch("plane.app.views.notification.base.invalidate_notification_counters")
+class BulkNotificationStateTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create(email="user@plane.so", username="user")
+        self.workspace = Workspace.objects.create(
+            name="Plane", slug="plane", owner=self.user
+        )
+        WorkspaceMember.objects.create(
+            workspace=self.workspace, member=self.user, role=20
+        )
+        self.notifications = [
+            Notification.objects.create(
+                workspace=self.workspace,
+                receiver=self.user,
+                entity_name="issue",
+                title=f"Notification {index}",
+                sender="in_app:issue_activities:updated",
+            )
+            for index in range(3)
+        ]
+
+        self.client = APIClient(HTTP_USER_AGENT="plane/test", REMOTE_ADDR="10.10.10.10")
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse("bulk-notifications", kwargs={"slug": self.workspace.slug})
+
+    def test_marks_the_selected_notifications_read(self, invalidate):
+        selected = [str(notification.id) for notification in self.notifications[:2]]
+        response = self.client.post(
+            self.url, {"action": "read", "notification_ids": selected}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {"updated": 2})
+        self.assertEqual(
+            Notification.objects.filter(read_at__isnull=False).count(), 2
+        )
+        invalidate.assert_called_once_with(self.user.id, self.workspace.slug)
+
+    def test_skips_notifications_already_in_the_state(self, invalidate):
+        Notification.objects.filter(pk=self.notifications[0].id).update(
+            read_at=timezone.now()
+        )
+        response = self.client.post(
+            self.url,
+            {
+                "action": "read",
+                "notification_ids": [str(self.notifications[0].id)],
+            },
+            format="json",
+        )
+        self.assertEqual(response.data, {"updated": 0})
+        invalidate.assert_not_called()
+
+    def test_rejects_unknown_actions(self, invalidate):
+        response = self.client.post(self.url, {"action": "delete"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(
+            Notification.objects.filter(read_at__isnull=False).exists()
+        )
@@ -0,0 +1,64 @@
+# Django imports
+from django.test import SimpleTestCase
+
+# Module imports
+from plane.db.models import PageVersion
+from plane.utils.html_delta import apply_html_delta, html_delta, tokenize_html
+
+BASE_HTML = (
+    "<h1>Release notes</h1>"
+    "<p>The board loads <strong>faster</strong>.</p>"
+    "<ul><li>Keyset cursors</li><li>Issue counters</li></ul>"
+)
+
+
+class HtmlDeltaTest(SimpleTestCase):
+    def assertRoundTrip(self, base_html, html):
+        delta = html_delta(base_html, html)
+        self.assertEqual(apply_html_delta(base_html, delta), html or "")
+        return delta
+
+    def test_tokens_split_after_tags(self):
+        self.assertEqual(
+            tokenize_html("<p>Hello <em>world</em></p>"),
+            ["<p>", "Hello <em>", "world</em>", "</p>"],
+        )
+        self.assertEqual(tokenize_html(None), [])
+
+    def test_unchanged_html_copies_the_base(self):
+        delta = self.assertRoundTrip(BASE_HTML, BASE_HTML)
+        self.assertEqual(delta, [["=", 0, len(tokenize_html(BASE_HTML))]])
+
+    def test_edits_round_trip(self):
+        edits = [
+            BASE_HTML.replace("faster", "much faster"),
+            BASE_HTML.replace("<li>Issue counters</li>", ""),
+            BASE_HTML + "<p>Thanks to everyone who reported bugs.</p>",
+            "<p>Intro</p>" + BASE_HTML,
+            "<p>Rewritten from scratch</p>",
+            "",
+        ]
+        for html in edits:
+            with self.subTest(html=html):
+                self.assertRoundTrip(BASE_HTML, html)
+
+    def test_round_trip_from_empty_base(self):
+        delta = self.assertRoundTrip("", BASE_HTML)
+        self.assertEqual(delta, [["+", BASE_HTML]])
+
+    def test_small_edit_copies_most_of_the_base(self):
+        delta = self.assertRoundTrip(BASE_HTML, BASE_HTML.replace("notes", "log"))
+        inserted = "".join(operation[1] for operation in delta if operation[0] == "+")
+        # Only the token holding the edit is stored
+        self.assertEqual(inserted, "Release log</h1>")
+
+    def test_version_resolves_from_its_snapshot(self):
+        html = BASE_HTML.replace("Keyset cursors", "Opaque cursors")
+        snapshot = PageVersion(description_html=BASE_HTML)
+        version = PageVersion(
+            base=snapshot,
+            description_html="",
+            description_delta=html_delta(BASE_HTML, html),
+        )
+        self.assertEqual(version.resolve_description_html(), html)
+        self.assertEqual(snapshot.resolve_description_html(), BASE_HTML)
@@ -0,0 +1,57 @@
+# Django imports
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+# Module imports
+from plane.utils.paginator import (
+    CURSOR_POSITION_MAX_LENGTH,
+    STORED_POSITION_PREFIX,
+    Cursor,
+)
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class KeysetCursorTest(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def grouped_position(self, groups):
+        return {
+            "groups": [
+                [f"group-{index}", "2024-05-01T10:00:00+00:00", f"issue-{index}"]
+                for index in range(groups)
+            ],
+            "hits": 120,
+            "max_hits": 3,
+        }
+
+    def test_offset_cursor_round_trips(self):
+        cursor = Cursor.from_string("50:2:1")
+        self.assertEqual((cursor.value, cursor.offset, cursor.is_prev), (50, 2, True))
+        self.assertIsNone(cursor.position)
+
+    def test_short_position_is_sent_inline(self):
+        position = self.grouped_position(1)
+        value = str(Cursor(50, 1, False, True, position=position))
+        self.assertFalse(value.split(":")[3].startswith(STORED_POSITION_PREFIX))
+        self.assertEqual(Cursor.from_string(value).position, position)
+
+    def test_many_groups_keep_the_cursor_short(self):
+        position = self.grouped_position(200)
+        value = str(Cursor(50, 1, False, True, position=position))
+        self.assertLess(len(value), CURSOR_POSITION_MAX_LENGTH)
+        self.assertTrue(value.split(":")[3].startswith(STORED_POSITION_PREFIX))
+        self.assertEqual(Cursor.from_string(value).position, position)
+
+    def test_expired_position_is_invalid(self):
+        value = str(Cursor(50, 1, False, True, position=self.grouped_position(200)))
+        cache.clear()
+        with self.assertRaises(ValueError):
+            Cursor.from_string(value)
+
+    def test_malformed_cursor_is_invalid(self):
+        for value in ["50", "50:a:0", "50:1:0:not-base64!"]:
+            with self.subTest(value=value), self.assertRaises(ValueError):
+                Cursor.from_string(value)
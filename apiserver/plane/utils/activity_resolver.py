@@ -0,0 +1,98 @@
+# Python imports
+import json
+import uuid
+from collections import defaultdict
+
+# Module imports
+from plane.db.models import Cycle, EstimatePoint, Issue, Label, Module, State, User
+
+
+class ActivityResolver:
+    """
+    Resolves the labels, users, states, cycles, modules, estimate points and
+    issues referenced by an activity batch. Every id is collected up front and
+    each model is then loaded with a single query, so the trackers cost a
+    constant number of queries however many ids changed.
+    """
+
+    # Related models loaded along with the objects
+    SELECT_RELATED = {Issue: ("project",)}
+
+    def __init__(self):
+        self._pending = defaultdict(set)
+        self._objects = defaultdict(dict)
+
+    def add(self, model, *pks):
+        """Queue primary keys to be loaded with the next lookup of the model"""
+        for pk in pks:
+            # Ignore anything that is not an id, the lookups then miss
+            try:
+                self._pending[model].add(str(uuid.UUID(str(pk))))
+            except ValueError:
+                continue
+        return self
+
+    def collect(self, *payloads):
+        """Queue every reference found in the requested data / current instance"""
+        for data in payloads:
+            if isinstance(data, str):
+                data = json.loads(data)
+            if not isinstance(data, dict):
+                continue
+
+            self.add(Label, *(data.get("label_ids") or []))
+            self.add(User, *(data.get("assignee_ids") or []))
+            self.add(State, data.get("state_id"), data.get("closed_to"))
+            self.add(EstimatePoint, data.get("estimate_point"))
+            self.add(Issue, data.get("parent_id"), data.get("related_issue"))
+            self.add(Module, data.get("module_id"))
+            self.add(Cycle, data.get("cycle_id"))
+
+            issues = data.get("issues")
+            if isinstance(issues, list):
+                self.add(Issue, *issues)
+
+            for record in data.get("updated_cycle_issues") or []:
+                self.add(Cycle, record.get("old_cycle_id"), record.get("new_cycle_id"))
+                self.add(Issue, record.get("issue_id"))
+
+            created_records = data.get("created_cycle_issues")
+            if isinstance(created_records, str):
+                created_records = json.loads(created_records)
+            for record in created_records or []:
+                self.add(Cycle, record.get("fields", {}).get("cycle"))
+                self.add(Issue, record.get("fields", {}).get("issue"))
+        return self
+
+    def _load(self, model):
+        pending = self._pending.pop(model, set()) - self._objects[model].keys()
+        if not pending:
+            return
+
+        queryset = model.objects.filter(pk__in=pending)
+        if model in self.SELECT_RELATED:
+            queryset = queryset.select_related(*self.SELECT_RELATED[model])
+
+        for obj in queryset:
+            self._objects[model][str(obj.pk)] = obj
+        # Remember the misses so that they are not queried again
+        for pk in pending:
+            self._objects[model].setdefault(pk, None)
+
+    def first(self, model, pk):
+        """Return the object or None, like `filter(pk=pk).first()`"""
+        try:
+            pk = str(uuid.UUID(str(pk)))
+        except ValueError:
+            return None
+        if pk not in self._objects[model]:
+            self._pending[model].add(pk)
+            self._load(model)
+        return self._objects[model][pk]
+
+    def get(self, model, pk):
+        """Return the object or raise `DoesNotExist`, like `get(pk=pk)`"""
+        obj = self.first(model, pk)
+        if obj is None:
+            raise model.DoesNotExist(f"{model.__name__} matching query does not exist.")
+        return obj
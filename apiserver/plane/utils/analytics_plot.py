@@ -16,7 +16,13 @@ from django.db.models.functions import (
 from django.utils import timezone
 
 # Module imports
-from plane.db.models import Issue, Project
+from plane.db.models import Issue, IssueAnalyticsRollup, Project
+from plane.utils.analytics_rollup import (
+    ROLLUP_AXES,
+    ROLLUP_ESTIMATE,
+    ROLLUP_TOTAL,
+    rollup_completion_distribution,
+)
 
 
 def annotate_with_monthly_dimension(queryset, field_name, attribute):
@@ -92,7 +98,10 @@ def build_graph_plot(queryset, x_axis, y_axis, segment=None):
             else queryset.values("dimension", "estimate")
         )
 
-    result_values = list(queryset)
+    return group_plot(list(queryset), temp_axis)
+
+
+def group_plot(result_values, temp_axis):
     grouped_data = {
         str(key): list(items)
         for key, items in groupby(result_values, key=lambda x: x[str("dimension")])
@@ -101,7 +110,92 @@ def build_graph_plot(queryset, x_axis, y_axis, segment=None):
     return sort_data(grouped_data, temp_axis)
 
 
-def burndown_plot(queryset, slug, project_id, plot_type, cycle_id=None, module_id=None):
+def build_rollup_graph_plot(project_ids, x_axis, y_axis, segment=None):
+    """
+    The graph plot of the projects read from the analytics rollup, None when
+    the axes are not kept in it.
+    """
+    if x_axis in ROLLUP_AXES and segment in [None, False, "", "state__group"]:
+        axis = x_axis
+        group = {"dimension": F("value")}
+        if segment:
+            group["segment"] = F("state_group")
+    elif x_axis == "state__group" and not segment:
+        axis = ROLLUP_TOTAL
+        group = {"dimension": F("state_group")}
+    elif x_axis == "state__group" and segment in ROLLUP_AXES:
+        axis = segment
+        group = {"dimension": F("state_group"), "segment": F("value")}
+    else:
+        return None
+
+    queryset = IssueAnalyticsRollup.objects.filter(
+        project_id__in=project_ids,
+        cycle__isnull=True,
+        module__isnull=True,
+        axis=axis,
+    )
+    if axis == x_axis:
+        queryset = queryset.exclude(value__isnull=True)
+
+    metric, source = (
+        ("count", "issue_count")
+        if y_axis == "issue_count"
+        else ("estimate", "estimate_sum")
+    )
+    queryset = (
+        queryset.values(**group)
+        .annotate(rollup_total=Sum(source))
+        .order_by("dimension")
+    )
+    result_values = [
+        {**{key: row[key] for key in group}, metric: row["rollup_total"]}
+        for row in queryset
+    ]
+    return group_plot(result_values, x_axis)
+
+
+def completion_distribution(
+    slug, project_id, cycle_id=None, module_id=None, live=False
+):
+    """
+    Issues and estimates of a cycle or module per completion day, read from
+    the analytics rollup unless `live` asks for the current issues.
+    """
+    if not live:
+        distribution = rollup_completion_distribution(
+            project_id, cycle_id, module_id
+        )
+        if distribution is not None:
+            return distribution
+
+    # Not rolled up yet or asked live, aggregate over the issues
+    issues = Issue.issue_objects.filter(workspace__slug=slug, project_id=project_id)
+    if cycle_id:
+        issues = issues.filter(
+            issue_cycle__cycle_id=cycle_id, issue_cycle__deleted_at__isnull=True
+        )
+    if module_id:
+        issues = issues.filter(
+            issue_module__module_id=module_id, issue_module__deleted_at__isnull=True
+        )
+    return list(
+        issues.annotate(date=TruncDate("completed_at"))
+        .values("date")
+        .annotate(total_completed=Count("id"), estimate=Sum(ROLLUP_ESTIMATE))
+        .order_by("date")
+    )
+
+
+def burndown_plot(
+    queryset,
+    slug,
+    project_id,
+    plot_type,
+    cycle_id=None,
+    module_id=None,
+    distribution=None,
+):
     # Total Issues in Cycle or Module
     total_issues = queryset.total_issues
     # check whether the estimate is a point or not
@@ -111,29 +205,13 @@ def burndown_plot(queryset, slug, project_id, plot_type, cycle_id=None, module_i
         estimate__isnull=False,
         estimate__type="points",
     ).exists()
-    if estimate_type and plot_type == "points" and cycle_id:
-        issue_estimates = Issue.issue_objects.filter(
-            workspace__slug=slug,
-            project_id=project_id,
-            issue_cycle__cycle_id=cycle_id,
-            issue_cycle__deleted_at__isnull=True,
-            estimate_point__isnull=False,
-        ).values_list("estimate_point__value", flat=True)
-
-        issue_estimates = [float(value) for value in issue_estimates]
-        total_estimate_points = sum(issue_estimates)
-
-    if estimate_type and plot_type == "points" and module_id:
-        issue_estimates = Issue.issue_objects.filter(
-            workspace__slug=slug,
-            project_id=project_id,
-            issue_module__module_id=module_id,
-            issue_module__deleted_at__isnull=True,
-            estimate_point__isnull=False,
-        ).values_list("estimate_point__value", flat=True)
-
-        issue_estimates = [float(value) for value in issue_estimates]
-        total_estimate_points = sum(issue_estimates)
+
+    if distribution is None:
+        distribution = completion_distribution(slug, project_id, cycle_id, module_id)
+
+    total_estimate_points = 0
+    if estimate_type and plot_type == "points":
+        total_estimate_points = sum(item["estimate"] or 0 for item in distribution)
 
     if cycle_id:
         if queryset.end_date and queryset.start_date:
@@ -147,35 +225,6 @@ def burndown_plot(queryset, slug, project_id, plot_type, cycle_id=None, module_i
 
         chart_data = {str(date): 0 for date in date_range}
 
-        if plot_type == "points":
-            completed_issues_estimate_point_distribution = (
-                Issue.issue_objects.filter(
-                    workspace__slug=slug,
-                    project_id=project_id,
-                    issue_cycle__cycle_id=cycle_id,
-                    issue_cycle__deleted_at__isnull=True,
-                    estimate_point__isnull=False,
-                )
-                .annotate(date=TruncDate("completed_at"))
-                .values("date")
-                .values("date", "estimate_point__value")
-                .order_by("date")
-            )
-        else:
-            completed_issues_distribution = (
-                Issue.issue_objects.filter(
-                    workspace__slug=slug,
-                    project_id=project_id,
-                    issue_cycle__cycle_id=cycle_id,
-                    issue_cycle__deleted_at__isnull=True,
-                )
-                .annotate(date=TruncDate("completed_at"))
-                .values("date")
-                .annotate(total_completed=Count("id"))
-                .values("date", "total_completed")
-                .order_by("date")
-            )
-
     if module_id:
         # Get all dates between the two dates
         date_range = [
@@ -185,62 +234,20 @@ def burndown_plot(queryset, slug, project_id, plot_type, cycle_id=None, module_i
 
         chart_data = {str(date): 0 for date in date_range}
 
-        if plot_type == "points":
-            completed_issues_estimate_point_distribution = (
-                Issue.issue_objects.filter(
-                    workspace__slug=slug,
-                    project_id=project_id,
-                    issue_module__module_id=module_id,
-                    issue_module__deleted_at__isnull=True,
-                    estimate_point__isnull=False,
-                )
-                .annotate(date=TruncDate("completed_at"))
-                .values("date")
-                .values("date", "estimate_point__value")
-                .order_by("date")
-            )
-        else:
-            completed_issues_distribution = (
-                Issue.issue_objects.filter(
-                    workspace__slug=slug,
-                    project_id=project_id,
-                    issue_module__module_id=module_id,
-                    issue_module__deleted_at__isnull=True,
-                )
-                .annotate(date=TruncDate("completed_at"))
-                .values("date")
-                .annotate(total_completed=Count("id"))
-                .values("date", "total_completed")
-                .order_by("date")
-            )
-
     if plot_type == "points":
-        for date in date_range:
-            cumulative_pending_issues = total_estimate_points
-            total_completed = 0
-            total_completed = sum(
-                float(item["estimate_point__value"])
-                for item in completed_issues_estimate_point_distribution
-                if item["date"] is not None and item["date"] <= date
-            )
-            cumulative_pending_issues -= total_completed
-            if date > timezone.now().date():
-                chart_data[str(date)] = None
-            else:
-                chart_data[str(date)] = cumulative_pending_issues
+        total, completed_key = total_estimate_points, "estimate"
     else:
-        for date in date_range:
-            cumulative_pending_issues = total_issues
-            total_completed = 0
-            total_completed = sum(
-                item["total_completed"]
-                for item in completed_issues_distribution
-                if item["date"] is not None and item["date"] <= date
-            )
-            cumulative_pending_issues -= total_completed
-            if date > timezone.now().date():
-                chart_data[str(date)] = None
-            else:
-                chart_data[str(date)] = cumulative_pending_issues
+        total, completed_key = total_issues, "total_completed"
+
+    for date in date_range:
+        total_completed = sum(
+            item[completed_key] or 0
+            for item in distribution
+            if item["date"] is not None and item["date"] <= date
+        )
+        if date > timezone.now().date():
+            chart_data[str(date)] = None
+        else:
+            chart_data[str(date)] = total - total_completed
 
     return chart_data
@@ -0,0 +1,401 @@
+# Python imports
+from collections import defaultdict
+
+# Django imports
+from django.db import transaction
+from django.db.models import (
+    Case,
+    CharField,
+    F,
+    FloatField,
+    Q,
+    Sum,
+    Value,
+    When,
+)
+from django.db.models.functions import (
+    Cast,
+    Concat,
+    ExtractMonth,
+    ExtractYear,
+    TruncDate,
+)
+
+# Module imports
+from plane.db.models import (
+    CycleIssue,
+    Issue,
+    IssueAnalyticsContribution,
+    IssueAnalyticsRollup,
+    IssueAssignee,
+    IssueLabel,
+    ModuleIssue,
+    Project,
+    ProjectAnalyticsRollup,
+)
+
+# Axis of the rows holding the totals split by completion day
+ROLLUP_TOTAL = "total"
+
+# Estimate values that are not numbers are left out of the sums
+ROLLUP_ESTIMATE = Case(
+    When(
+        estimate_point__value__regex=r"^-?\d+(\.\d+)?$",
+        then=Cast("estimate_point__value", FloatField()),
+    ),
+    default=None,
+    output_field=FloatField(),
+)
+
+
+def monthly_dimension(field_name):
+    # Same year-month format as the live graph plot
+    return Concat(
+        ExtractYear(field_name),
+        Value("-"),
+        ExtractMonth(field_name),
+        output_field=CharField(),
+    )
+
+
+# Chart axes kept in the rollup read from the issue and their expression
+ROLLUP_FIELD_AXES = {
+    "state_id": F("state_id"),
+    "priority": F("priority"),
+    "estimate_point__value": F("estimate_point__value"),
+    "created_at": monthly_dimension("created_at"),
+    "start_date": monthly_dimension("start_date"),
+    "target_date": monthly_dimension("target_date"),
+    "completed_at": monthly_dimension("completed_at"),
+}
+
+# Chart axes kept in the rollup read from a relation of the issue
+ROLLUP_RELATION_AXES = {
+    "labels__id": (IssueLabel, "label_id"),
+    "assignees__id": (IssueAssignee, "assignee_id"),
+    "issue_cycle__cycle_id": (CycleIssue, "cycle_id"),
+    "issue_module__module_id": (ModuleIssue, "module_id"),
+}
+
+ROLLUP_AXES = [*ROLLUP_FIELD_AXES, *ROLLUP_RELATION_AXES]
+
+# Columns identifying a rollup row within its project
+ROLLUP_BUCKET_FIELDS = ["cycle_id", "module_id", "date", "state_group", "axis", "value"]
+
+
+def rollup_bucket(row):
+    """The bucket of a rollup row with its columns as strings"""
+    return tuple(
+        None if row.get(field) is None else str(row[field])
+        for field in ROLLUP_BUCKET_FIELDS
+    )
+
+
+def issue_rollup_contributions(project_id, issue_ids=None):
+    """
+    The rollup buckets each issue of the project counts in and the estimate
+    it adds to them, keyed by issue id. Issues left out of the analytics,
+    deleted, archived or drafts, do not contribute.
+    """
+    issues = Issue.issue_objects.filter(project_id=project_id)
+    if issue_ids is not None:
+        issues = issues.filter(pk__in=issue_ids)
+
+    related = {}
+    for axis, (model, field) in ROLLUP_RELATION_AXES.items():
+        related[axis] = defaultdict(list)
+        for issue_id, value in model.objects.filter(
+            issue_id__in=issues.values("id")
+        ).values_list("issue_id", field):
+            related[axis][issue_id].append(value)
+
+    axes = {
+        f"axis_{index}": value
+        for index, value in enumerate(ROLLUP_FIELD_AXES.values())
+    }
+    contributions = {}
+    for row in issues.order_by().values(
+        "id",
+        state_group=F("state__group"),
+        estimate=ROLLUP_ESTIMATE,
+        completed_on=TruncDate("completed_at"),
+        **axes,
+    ):
+        issue_id, state_group = row["id"], row["state_group"]
+        # Totals of the project, of its cycles and of its modules per day
+        buckets = [
+            dict(date=row["completed_on"], axis=ROLLUP_TOTAL),
+            *(
+                dict(cycle_id=cycle_id, date=row["completed_on"], axis=ROLLUP_TOTAL)
+                for cycle_id in related["issue_cycle__cycle_id"][issue_id]
+            ),
+            *(
+                dict(module_id=module_id, date=row["completed_on"], axis=ROLLUP_TOTAL)
+                for module_id in related["issue_module__module_id"][issue_id]
+            ),
+        ]
+        # Project wide distribution over every chart axis
+        for index, axis in enumerate(ROLLUP_FIELD_AXES):
+            buckets.append(dict(axis=axis, value=row[f"axis_{index}"]))
+        for axis in ROLLUP_RELATION_AXES:
+            for value in related[axis][issue_id] or [None]:
+                buckets.append(dict(axis=axis, value=value))
+
+        contributions[str(issue_id)] = {
+            "buckets": [
+                list(rollup_bucket(dict(bucket, state_group=state_group)))
+                for bucket in buckets
+            ],
+            "estimate": row["estimate"],
+        }
+    return contributions
+
+
+def add_rollup_contribution(totals, contribution, sign=1):
+    """Add or take out the contribution of an issue from the bucket totals"""
+    estimate = contribution["estimate"]
+    for bucket in map(tuple, contribution["buckets"]):
+        issue_count, estimate_sum = totals.get(bucket, (0, None))
+        if estimate is not None:
+            estimate_sum = (estimate_sum or 0) + sign * estimate
+        totals[bucket] = (issue_count + sign, estimate_sum)
+
+
+def save_rollup_contributions(project_id, contributions):
+    IssueAnalyticsContribution.objects.bulk_create(
+        [
+            IssueAnalyticsContribution(
+                issue_id=issue_id,
+                project_id=project_id,
+                buckets=contribution["buckets"],
+                estimate=contribution["estimate"],
+            )
+            for issue_id, contribution in contributions.items()
+        ],
+        batch_size=1000,
+        update_conflicts=True,
+        unique_fields=["issue"],
+        update_fields=["buckets", "estimate", "updated_at"],
+    )
+
+
+def refresh_analytics_rollup(project_id):
+    """
+    Rebuild the rollup rows of the project from its issues and return the
+    number of rows written. The marker row stays locked until commit so
+    refreshes and deltas of a project run one after another.
+
+    Issue changes are applied as deltas by the activity pipeline, the full
+    rebuild backfills new projects and reconciles drift, for instance from
+    changes that skipped the pipeline. It stores the contribution of every
+    issue again and diffs the summed buckets against the stored rows, so
+    only the buckets that drifted are written.
+    """
+    project = Project.objects.filter(pk=project_id).values("workspace_id").first()
+    if project is None:
+        return 0
+
+    with transaction.atomic():
+        ProjectAnalyticsRollup.objects.get_or_create(project_id=project_id)
+        marker = ProjectAnalyticsRollup.objects.select_for_update().get(
+            pk=project_id
+        )
+
+        contributions = issue_rollup_contributions(project_id)
+        totals = {}
+        for contribution in contributions.values():
+            add_rollup_contribution(totals, contribution)
+
+        stored = {
+            rollup_bucket(row): row
+            for row in IssueAnalyticsRollup.objects.filter(
+                project_id=project_id
+            ).values("id", "issue_count", "estimate_sum", *ROLLUP_BUCKET_FIELDS)
+        }
+        created, updated = [], []
+        for bucket, (issue_count, estimate_sum) in totals.items():
+            current = stored.pop(bucket, None)
+            if current is None:
+                created.append(
+                    IssueAnalyticsRollup(
+                        workspace_id=project["workspace_id"],
+                        project_id=project_id,
+                        **dict(zip(ROLLUP_BUCKET_FIELDS, bucket)),
+                        issue_count=issue_count,
+                        estimate_sum=estimate_sum,
+                    )
+                )
+            elif (current["issue_count"], current["estimate_sum"]) != (
+                issue_count,
+                estimate_sum,
+            ):
+                updated.append(
+                    IssueAnalyticsRollup(
+                        id=current["id"],
+                        issue_count=issue_count,
+                        estimate_sum=estimate_sum,
+                    )
+                )
+
+        # Buckets left without issues
+        IssueAnalyticsRollup.objects.filter(
+            pk__in=[row["id"] for row in stored.values()]
+        ).delete()
+        IssueAnalyticsRollup.objects.bulk_update(
+            updated, ["issue_count", "estimate_sum"], batch_size=1000
+        )
+        IssueAnalyticsRollup.objects.bulk_create(created, batch_size=1000)
+
+        IssueAnalyticsContribution.objects.filter(project_id=project_id).exclude(
+            issue_id__in=list(contributions)
+        ).delete()
+        save_rollup_contributions(project_id, contributions)
+        marker.save(update_fields=["updated_at"])
+    return len(stored) + len(updated) + len(created)
+
+
+def apply_analytics_rollup_deltas(project_id, issue_ids):
+    """
+    Move the changed issues of the project from the buckets they were last
+    counted in to the buckets they count in now and return the number of
+    rows written. Projects that have not been rolled up are left to the
+    backfill.
+    """
+    issue_ids = {str(issue_id) for issue_id in issue_ids if issue_id}
+    if not issue_ids:
+        return 0
+
+    with transaction.atomic():
+        marker = (
+            ProjectAnalyticsRollup.objects.select_for_update()
+            .filter(pk=project_id)
+            .select_related("project")
+            .first()
+        )
+        if marker is None:
+            return 0
+
+        previous = {
+            str(row.pop("issue_id")): row
+            for row in IssueAnalyticsContribution.objects.filter(
+                issue_id__in=issue_ids
+            ).values("issue_id", "buckets", "estimate")
+        }
+        contributions = issue_rollup_contributions(project_id, issue_ids)
+        deltas = {}
+        for contribution in previous.values():
+            add_rollup_contribution(deltas, contribution, sign=-1)
+        for contribution in contributions.values():
+            add_rollup_contribution(deltas, contribution)
+        # An issue left in its buckets nets out to nothing
+        deltas = {
+            bucket: delta for bucket, delta in deltas.items() if delta[0] or delta[1]
+        }
+
+        stored = {}
+        buckets = list(deltas)
+        for index in range(0, len(buckets), 200):
+            query = Q()
+            for bucket in buckets[index : index + 200]:
+                query |= Q(**dict(zip(ROLLUP_BUCKET_FIELDS, bucket)))
+            for row in IssueAnalyticsRollup.objects.filter(
+                query, project_id=project_id
+            ).values("id", "issue_count", "estimate_sum", *ROLLUP_BUCKET_FIELDS):
+                stored[rollup_bucket(row)] = row
+
+        created, updated, removed = [], [], []
+        for bucket, (issue_count, estimate_sum) in deltas.items():
+            current = stored.get(bucket)
+            if current is None:
+                # A missing bucket can only gain issues, the reconcile job
+                # repairs a rollup that drifted below zero
+                if issue_count > 0:
+                    created.append(
+                        IssueAnalyticsRollup(
+                            workspace_id=marker.project.workspace_id,
+                            project_id=project_id,
+                            **dict(zip(ROLLUP_BUCKET_FIELDS, bucket)),
+                            issue_count=issue_count,
+                            estimate_sum=estimate_sum,
+                        )
+                    )
+                continue
+
+            issue_count += current["issue_count"]
+            if issue_count <= 0:
+                removed.append(current["id"])
+                continue
+            if estimate_sum is None:
+                estimate_sum = current["estimate_sum"]
+            else:
+                estimate_sum += current["estimate_sum"] or 0
+            updated.append(
+                IssueAnalyticsRollup(
+                    id=current["id"],
+                    issue_count=issue_count,
+                    estimate_sum=estimate_sum,
+                )
+            )
+
+        IssueAnalyticsRollup.objects.filter(pk__in=removed).delete()
+        IssueAnalyticsRollup.objects.bulk_update(
+            updated, ["issue_count", "estimate_sum"], batch_size=1000
+        )
+        IssueAnalyticsRollup.objects.bulk_create(created, batch_size=1000)
+
+        IssueAnalyticsContribution.objects.filter(
+            issue_id__in=set(previous) - set(contributions)
+        ).delete()
+        save_rollup_contributions(project_id, contributions)
+        marker.save(update_fields=["updated_at"])
+    return len(removed) + len(updated) + len(created)
+
+
+def rollup_project_ids(slug, filters):
+    """
+    The projects the rollup answers the analytics filters for, None when the
+    filters go beyond projects or a project has not been rolled up yet.
+    """
+    if set(filters) - {"project__in"}:
+        return None
+
+    projects = Project.objects.filter(workspace__slug=slug, archived_at__isnull=True)
+    if "project__in" in filters:
+        projects = projects.filter(pk__in=filters["project__in"])
+    project_ids = list(projects.values_list("id", flat=True))
+
+    built = ProjectAnalyticsRollup.objects.filter(project_id__in=project_ids).count()
+    return project_ids if built == len(project_ids) else None
+
+
+def rollup_total_issues(project_ids):
+    return (
+        IssueAnalyticsRollup.objects.filter(
+            project_id__in=project_ids,
+            cycle__isnull=True,
+            module__isnull=True,
+            axis=ROLLUP_TOTAL,
+        ).aggregate(total=Sum("issue_count"))["total"]
+        or 0
+    )
+
+
+def rollup_completion_distribution(project_id, cycle_id=None, module_id=None):
+    """
+    Issue counts and estimate sums of a project, cycle or module per
+    completion day, None when the project has not been rolled up yet.
+    """
+    if not ProjectAnalyticsRollup.objects.filter(project_id=project_id).exists():
+        return None
+
+    return list(
+        IssueAnalyticsRollup.objects.filter(
+            project_id=project_id,
+            cycle_id=cycle_id,
+            module_id=module_id,
+            axis=ROLLUP_TOTAL,
+        )
+        .values("date")
+        .annotate(total_completed=Sum("issue_count"), estimate=Sum("estimate_sum"))
+        .order_by("date")
+    )
@@ -1,4 +1,5 @@
 # Python imports
+import time
 from functools import wraps
 
 # Django imports
@@ -8,6 +9,36 @@ from django.core.cache import cache
 # Third party imports
 from rest_framework.response import Response
 
+# Module imports
+from plane.settings.redis import redis_instance
+
+# Prefix of the generation counters folded into every cached response key
+GENERATION_PREFIX = "cache_generation"
+
+# Redis hash holding the hit, miss and invalidation counters of every process
+CACHE_STATS_KEY = "cache_stats"
+CACHE_STATS_EVENTS = ["hits", "misses", "invalidations"]
+
+# Seconds a generation counter lives, longer than any response cached under it
+# so an idle counter is dropped only once its responses have expired too
+GENERATION_TIMEOUT = 60 * 60 * 24 * 2
+
+
+def _record(event):
+    redis_instance().hincrby(CACHE_STATS_KEY, event, 1)
+
+
+def get_cache_stats():
+    """Return the response cache hit, miss and invalidation counters"""
+    values = redis_instance().hmget(CACHE_STATS_KEY, CACHE_STATS_EVENTS)
+    return {
+        event: int(value or 0) for event, value in zip(CACHE_STATS_EVENTS, values)
+    }
+
+
+def reset_cache_stats():
+    redis_instance().delete(CACHE_STATS_KEY)
+
 
 def generate_cache_key(custom_path, auth_header=None):
     """Generate a cache key with the given params"""
@@ -18,6 +49,57 @@ def generate_cache_key(custom_path, auth_header=None):
     return key_data
 
 
+def normalize_cache_path(custom_path):
+    """Strip the query string, the api prefix and the slashes of a path"""
+    path = custom_path.split("?", 1)[0].strip("/")
+    if path.startswith("api/"):
+        path = path[len("api/") :]
+    return path
+
+
+def generation_keys(custom_path, auth_header=None):
+    """Return the generation counter keys that scope a cached path"""
+    path_key = f"{GENERATION_PREFIX}:path:{normalize_cache_path(custom_path)}"
+    if auth_header:
+        return [path_key, f"{path_key}:user:{auth_header}"]
+    return [path_key]
+
+
+def _new_generation():
+    # Seed counters from the clock so an evicted counter never reuses a value
+    return time.time_ns() // 1000
+
+
+def get_generations(keys):
+    """Fetch the current generations, seeding the ones that do not exist yet"""
+    generations = cache.get_many(keys)
+    for key in keys:
+        if key not in generations:
+            seed = _new_generation()
+            cache.add(key, seed, timeout=GENERATION_TIMEOUT)
+            generations[key] = cache.get(key, seed)
+    return [generations[key] for key in keys]
+
+
+def bump_generation(key):
+    """Invalidate every response cached under the generation key in O(1)"""
+    try:
+        cache.incr(key)
+    except ValueError:
+        # The counter does not exist, a fresh seed is newer than any old value
+        cache.add(key, _new_generation(), timeout=GENERATION_TIMEOUT)
+    _record("invalidations")
+
+
+def project_revision_key(project_id):
+    """Generation counter bumped whenever the issues of the project change"""
+    return f"{GENERATION_PREFIX}:project_issues:{project_id}"
+
+
+def bump_project_revision(project_id):
+    bump_generation(project_revision_key(project_id))
+
+
 def cache_response(timeout=60 * 60, path=None, user=True):
     """decorator to create cache per user"""
 
@@ -33,11 +115,17 @@ def cache_response(timeout=60 * 60, path=None, user=True):
                 else None
             )
             custom_path = path if path is not None else request.get_full_path()
-            key = generate_cache_key(custom_path, auth_header)
+            # Fold the path and user generations into the key
+            generations = get_generations(generation_keys(custom_path, auth_header))
+            key = generate_cache_key(
+                ":".join([custom_path, *map(str, generations)]), auth_header
+            )
             cached_result = cache.get(key)
 
             if cached_result is not None:
+                _record("hits")
                 return Response(cached_result["data"], status=cached_result["status"])
+            _record("misses")
             response = view_func(instance, request, *args, **kwargs)
             if response.status_code == 200 and not settings.DEBUG:
                 cache.set(
@@ -56,6 +144,12 @@ def cache_response(timeout=60 * 60, path=None, user=True):
 def invalidate_cache_directly(
     path=None, url_params=False, user=True, request=None, multiple=False
 ):
+    """
+    Invalidate the cached responses of a path by bumping its generation.
+    With `user` only the entries of the requesting user are invalidated,
+    otherwise the entries of every user are. Query string variants are always
+    covered, so `multiple` is kept only for backwards compatibility.
+    """
     if url_params and path:
         path_with_values = path
         # Assuming `kwargs` could be passed directly if needed, otherwise, skip this part
@@ -71,12 +165,7 @@ def invalidate_cache_directly(
         if user
         else None
     )
-    key = generate_cache_key(custom_path, auth_header)
-
-    if multiple:
-        cache.delete_many(keys=cache.keys(f"*{key}*"))
-    else:
-        cache.delete(key)
+    bump_generation(generation_keys(custom_path, auth_header)[-1])
 
 
 def invalidate_cache(path=None, url_params=False, user=True, multiple=False):
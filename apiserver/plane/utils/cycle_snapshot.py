@@ -0,0 +1,236 @@
+# Django imports
+from django.core.cache import cache
+from django.db import models
+from django.db.models import Case, Count, F, Q, Sum, Value, When
+from django.db.models.functions import Concat
+from django.utils import timezone
+
+# Module imports
+from plane.db.models import (
+    Issue,
+    Project,
+    ProjectAnalyticsRollup,
+    ProjectSyncVersion,
+)
+from plane.utils.analytics_plot import burndown_plot, completion_distribution
+from plane.utils.analytics_rollup import ROLLUP_ESTIMATE
+
+STATE_GROUPS = ["backlog", "unstarted", "started", "cancelled", "completed"]
+
+# Seconds a snapshot of a cycle revision is kept
+SNAPSHOT_CACHE_TIMEOUT = 60 * 60
+
+ASSIGNEE_AVATAR_URL = Case(
+    # If `avatar_asset` exists, use it to generate the asset URL
+    When(
+        assignees__avatar_asset__isnull=False,
+        then=Concat(
+            Value("/api/assets/v2/static/"), "assignees__avatar_asset", Value("/")
+        ),
+    ),
+    # If `avatar_asset` is None, fall back to using `avatar` field directly
+    When(assignees__avatar_asset__isnull=True, then="assignees__avatar"),
+    default=Value(None),
+    output_field=models.CharField(),
+)
+
+
+def distribution_aggregates():
+    """Issue counts and estimate sums of a distribution in one pass"""
+    completed = Q(completed_at__isnull=False)
+    pending = Q(completed_at__isnull=True)
+    return {
+        "total_issues": Count("id"),
+        "completed_issues": Count("id", filter=completed),
+        "pending_issues": Count("id", filter=pending),
+        "total_estimates": Sum(ROLLUP_ESTIMATE),
+        "completed_estimates": Sum(ROLLUP_ESTIMATE, filter=completed),
+        "pending_estimates": Sum(ROLLUP_ESTIMATE, filter=pending),
+    }
+
+
+def split_distribution(rows, keys):
+    """Split the grouped rows into the issue and the estimate distributions"""
+    issues, estimates = [], []
+    for row in rows:
+        item = {key: row[key] for key in keys}
+        issues.append(
+            {
+                **item,
+                "total_issues": row["total_issues"],
+                "completed_issues": row["completed_issues"],
+                "pending_issues": row["pending_issues"],
+            }
+        )
+        estimates.append(
+            {
+                **item,
+                "total_estimates": row["total_estimates"],
+                "completed_estimates": row["completed_estimates"],
+                "pending_estimates": row["pending_estimates"],
+            }
+        )
+    return issues, estimates
+
+
+def compute_cycle_snapshot(cycle, live=False):
+    issues = Issue.issue_objects.filter(
+        project_id=cycle.project_id,
+        issue_cycle__cycle_id=cycle.id,
+        issue_cycle__deleted_at__isnull=True,
+    )
+    estimate_type = Project.objects.filter(
+        pk=cycle.project_id, estimate__isnull=False, estimate__type="points"
+    ).exists()
+
+    snapshot = {}
+    # Issue counts and estimate points of every state group
+    state_groups = {
+        row["state_group"]: row
+        for row in issues.order_by()
+        .values(state_group=F("state__group"))
+        .annotate(
+            issues=Count("id"),
+            estimates=Sum(
+                ROLLUP_ESTIMATE, filter=Q(estimate_point__estimate__type="points")
+            ),
+        )
+    }
+    for group in STATE_GROUPS:
+        row = state_groups.get(group, {})
+        snapshot[f"{group}_issues"] = row.get("issues", 0)
+        snapshot[f"{group}_estimate_points"] = row.get("estimates") or 0
+    snapshot["total_issues"] = sum(row["issues"] for row in state_groups.values())
+    snapshot["total_estimate_points"] = sum(
+        row["estimates"] or 0 for row in state_groups.values()
+    )
+
+    assignee_rows = [
+        dict(
+            row,
+            assignee_id=str(row["assignee_id"]) if row["assignee_id"] else None,
+            avatar=None,
+        )
+        for row in issues.annotate(
+            display_name=F("assignees__display_name"),
+            assignee_id=F("assignees__id"),
+            avatar_url=ASSIGNEE_AVATAR_URL,
+        )
+        .values("display_name", "assignee_id", "avatar_url")
+        .annotate(**distribution_aggregates())
+        .order_by("display_name")
+    ]
+    assignees, assignee_estimates = split_distribution(
+        assignee_rows, ["display_name", "assignee_id", "avatar", "avatar_url"]
+    )
+
+    label_rows = [
+        dict(row, label_id=str(row["label_id"]) if row["label_id"] else None)
+        for row in issues.annotate(
+            label_name=F("labels__name"),
+            color=F("labels__color"),
+            label_id=F("labels__id"),
+        )
+        .values("label_name", "color", "label_id")
+        .annotate(**distribution_aggregates())
+        .order_by("label_name")
+    ]
+    labels, label_estimates = split_distribution(
+        label_rows, ["label_name", "color", "label_id"]
+    )
+
+    # Both charts are drawn from the same completion distribution
+    cycle.total_issues = snapshot["total_issues"]
+    distribution = completion_distribution(
+        cycle.workspace.slug, cycle.project_id, cycle_id=cycle.id, live=live
+    )
+
+    snapshot["distribution"] = {
+        "labels": labels,
+        "assignees": assignees,
+        "completion_chart": burndown_plot(
+            queryset=cycle,
+            slug=cycle.workspace.slug,
+            project_id=cycle.project_id,
+            plot_type="issues",
+            cycle_id=cycle.id,
+            distribution=distribution,
+        ),
+    }
+    snapshot["estimate_distribution"] = (
+        {
+            "labels": label_estimates,
+            "assignees": assignee_estimates,
+            "completion_chart": burndown_plot(
+                queryset=cycle,
+                slug=cycle.workspace.slug,
+                project_id=cycle.project_id,
+                plot_type="points",
+                cycle_id=cycle.id,
+                distribution=distribution,
+            ),
+        }
+        if estimate_type
+        else {}
+    )
+    return snapshot
+
+
+def snapshot_cache_key(cycle):
+    """
+    The key of the cycle revision, None when the changes of the project issues
+    are not versioned yet. Issue changes bump the project sync version, edits
+    of the cycle its updated_at and the charts change with the day. The charts
+    lag the issues until the rollup is rebuilt, so its refresh time is part of
+    the key too.
+    """
+    version = (
+        ProjectSyncVersion.objects.filter(project_id=cycle.project_id)
+        .values_list("version", flat=True)
+        .first()
+    )
+    if version is None:
+        return None
+    rolled_up_at = (
+        ProjectAnalyticsRollup.objects.filter(project_id=cycle.project_id)
+        .values_list("updated_at", flat=True)
+        .first()
+    )
+    rollup = rolled_up_at.timestamp() if rolled_up_at else None
+    return (
+        f"cycle_snapshot:{cycle.id}:{version}:{rollup}:"
+        f"{cycle.updated_at.timestamp()}:{timezone.now().date()}"
+    )
+
+
+def build_cycle_snapshot(cycle, use_cache=True):
+    """
+    Counts, estimate points, label and assignee distributions and completion
+    charts of the cycle, cached per cycle revision with `use_cache`. Without
+    it the charts are drawn from the current issues instead of the rollup,
+    as the snapshots stored on closed cycles are never recomputed.
+    """
+    key = snapshot_cache_key(cycle) if use_cache else None
+    if key is not None:
+        snapshot = cache.get(key)
+        if snapshot is not None:
+            return snapshot
+
+    snapshot = compute_cycle_snapshot(cycle, live=not use_cache)
+    if key is not None:
+        cache.set(key, snapshot, SNAPSHOT_CACHE_TIMEOUT)
+    return snapshot
+
+
+def progress_snapshot(snapshot):
+    """The part of the snapshot stored on a cycle when it is closed"""
+    return {
+        "total_issues": snapshot["total_issues"],
+        "completed_issues": snapshot["completed_issues"],
+        "cancelled_issues": snapshot["cancelled_issues"],
+        "started_issues": snapshot["started_issues"],
+        "unstarted_issues": snapshot["unstarted_issues"],
+        "backlog_issues": snapshot["backlog_issues"],
+        "distribution": snapshot["distribution"],
+        "estimate_distribution": snapshot["estimate_distribution"],
+    }
@@ -0,0 +1,39 @@
+# Python imports
+import re
+from difflib import SequenceMatcher
+
+# Splits the html after every tag so edits map to a few changed tokens
+TOKEN_PATTERN = re.compile(r"(?<=>)")
+
+
+def tokenize_html(html):
+    return [token for token in TOKEN_PATTERN.split(html or "") if token]
+
+
+def html_delta(base_html, html):
+    """
+    Encode the html as a list of operations against the base html, either
+    ["=", start, end] to copy base tokens or ["+", text] to insert text.
+    """
+    base_tokens = tokenize_html(base_html)
+    tokens = tokenize_html(html)
+    delta = []
+    matcher = SequenceMatcher(None, base_tokens, tokens, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            delta.append(["=", i1, i2])
+        elif tag in ("replace", "insert"):
+            delta.append(["+", "".join(tokens[j1:j2])])
+    return delta
+
+
+def apply_html_delta(base_html, delta):
+    """Rebuild the html encoded by html_delta from the same base html"""
+    base_tokens = tokenize_html(base_html)
+    parts = []
+    for operation in delta:
+        if operation[0] == "=":
+            parts.extend(base_tokens[operation[1] : operation[2]])
+        else:
+            parts.append(operation[1])
+    return "".join(parts)
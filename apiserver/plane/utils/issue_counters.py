@@ -0,0 +1,97 @@
+# Django imports
+from django.db.models import Case, F, Func, IntegerField, OuterRef, Subquery, When
+
+# Module imports
+from plane.db.models import CycleIssue, FileAsset, Issue, IssueCounter, IssueLink
+from plane.utils.cache import bump_project_revision
+
+# Counter columns kept in the side table
+COUNTER_FIELDS = ["cycle_id", "link_count", "attachment_count", "sub_issues_count"]
+
+
+def issue_counter_subqueries():
+    """The correlated subqueries the counters are computed from"""
+    return {
+        "cycle_id": Subquery(
+            CycleIssue.objects.filter(
+                issue=OuterRef("id"), deleted_at__isnull=True
+            ).values("cycle_id")[:1]
+        ),
+        "link_count": IssueLink.objects.filter(issue=OuterRef("id"))
+        .order_by()
+        .annotate(count=Func(F("id"), function="Count", output_field=IntegerField()))
+        .values("count"),
+        "attachment_count": FileAsset.objects.filter(
+            issue_id=OuterRef("id"),
+            entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
+        )
+        .order_by()
+        .annotate(count=Func(F("id"), function="Count", output_field=IntegerField()))
+        .values("count"),
+        "sub_issues_count": Issue.issue_objects.filter(parent=OuterRef("id"))
+        .order_by()
+        .annotate(count=Func(F("id"), function="Count", output_field=IntegerField()))
+        .values("count"),
+    }
+
+
+def issue_counter_annotations():
+    """
+    Read the counters from the side table, issues without a counter row yet
+    fall back to the subqueries so the values are always available.
+    """
+    return {
+        field: Case(
+            When(issue_counter__isnull=False, then=F(f"issue_counter__{field}")),
+            default=subquery,
+            output_field=IssueCounter._meta.get_field(field),
+        )
+        for field, subquery in issue_counter_subqueries().items()
+    }
+
+
+def compute_issue_counters(issue_ids):
+    """Compute the counters of the issues from the source tables"""
+    return {
+        str(row["id"]): row
+        for row in Issue.all_objects.filter(pk__in=issue_ids)
+        .annotate(**issue_counter_subqueries())
+        .values("id", "project_id", *COUNTER_FIELDS)
+    }
+
+
+def refresh_issue_counters(issue_ids):
+    """Recompute and store the counters of the issues"""
+    issue_ids = {str(issue_id) for issue_id in issue_ids if issue_id}
+    if not issue_ids:
+        return 0
+
+    rows = compute_issue_counters(issue_ids)
+    IssueCounter.objects.bulk_create(
+        [
+            IssueCounter(
+                issue_id=row["id"],
+                cycle_id=row["cycle_id"],
+                link_count=row["link_count"] or 0,
+                attachment_count=row["attachment_count"] or 0,
+                sub_issues_count=row["sub_issues_count"] or 0,
+            )
+            for row in rows.values()
+        ],
+        update_conflicts=True,
+        unique_fields=["issue"],
+        update_fields=[*COUNTER_FIELDS, "updated_at"],
+    )
+    # The counters are shown on the published boards of the projects
+    for project_id in {row["project_id"] for row in rows.values()}:
+        bump_project_revision(project_id)
+    return len(rows)
+
+
+def refresh_issue_counters_with_parents(issue_ids):
+    """Recompute the counters of the issues and of their parents"""
+    issue_ids = {str(issue_id) for issue_id in issue_ids if issue_id}
+    parent_ids = Issue.all_objects.filter(
+        pk__in=issue_ids, parent__isnull=False
+    ).values_list("parent_id", flat=True)
+    return refresh_issue_counters(issue_ids | {str(pk) for pk in parent_ids})
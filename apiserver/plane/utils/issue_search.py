@@ -5,16 +5,42 @@ import re
 from django.db.models import Q
 
 # Module imports
+from plane.db.models import Issue, Project
+from plane.utils.search import search
 
+# Identifier lookups such as PROJ-123
+IDENTIFIER_PATTERN = re.compile(r"^\s*([^\W_]+)-(\d+)\s*$")
+
+
+def issue_identifier_filter(query, workspace_slug=None):
+    """Match issues by PROJ-123 identifiers or by sequence id"""
+    identifier = IDENTIFIER_PATTERN.match(query)
+    if identifier:
+        projects = Project.objects.filter(identifier__iexact=identifier.group(1))
+        if workspace_slug:
+            projects = projects.filter(workspace__slug=workspace_slug)
+        # Resolved up front so the issue lookup stays an index condition
+        return Q(
+            project_id__in=list(projects.values_list("id", flat=True)),
+            sequence_id=int(identifier.group(2)),
+        )
 
-def search_issues(query, queryset):
-    fields = ["name", "sequence_id", "project__identifier"]
     q = Q()
-    for field in fields:
-        if field == "sequence_id" and len(query) <= 20:
-            sequences = re.findall(r"\b\d+\b", query)
-            for sequence_id in sequences:
-                q |= Q(**{"sequence_id": sequence_id})
-        else:
-            q |= Q(**{f"{field}__icontains": query})
-    return queryset.filter(q).distinct()
+    if len(query) <= 20:
+        # Match whole integers only (exclude decimal numbers)
+        sequences = re.findall(r"\b\d+\b", query)
+        if sequences:
+            q |= Q(sequence_id__in=[int(sequence_id) for sequence_id in sequences])
+    return q
+
+
+def search_issues(query, queryset, workspace_slug=None):
+    candidates = Issue.issue_objects.all()
+    if workspace_slug:
+        candidates = candidates.filter(workspace__slug=workspace_slug)
+    return search(
+        queryset,
+        candidates,
+        query,
+        extra=issue_identifier_filter(query, workspace_slug),
+    ).distinct()
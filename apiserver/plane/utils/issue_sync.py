@@ -0,0 +1,67 @@
+# Django imports
+from django.db import transaction
+from django.db.models import Max
+
+# Module imports
+from plane.db.models import Issue, IssueSyncVersion, ProjectSyncVersion
+
+
+def record_issue_changes(project_id, issue_ids):
+    """
+    Hand out the next project versions to the changed issues. The project row
+    stays locked until commit, so versions become visible in increasing order
+    and a client resuming from a version never skips a change. The first call
+    for a project versions all of its issues.
+    """
+    issue_ids = {str(issue_id) for issue_id in issue_ids if issue_id}
+    with transaction.atomic():
+        _, created = ProjectSyncVersion.objects.get_or_create(project_id=project_id)
+        counter = ProjectSyncVersion.objects.select_for_update().get(pk=project_id)
+
+        issues = Issue.all_objects.filter(project_id=project_id)
+        if created:
+            issues = issues.filter(deleted_at__isnull=True)
+        elif issue_ids:
+            issues = issues.filter(pk__in=issue_ids)
+        else:
+            return counter.version
+
+        issue_ids = list(issues.order_by("created_at").values_list("id", flat=True))
+        if not issue_ids:
+            return counter.version
+
+        start = counter.version
+        counter.version = start + len(issue_ids)
+        counter.save(update_fields=["version", "updated_at"])
+
+        IssueSyncVersion.objects.bulk_create(
+            [
+                IssueSyncVersion(
+                    issue_id=issue_id, project_id=project_id, version=start + index
+                )
+                for index, issue_id in enumerate(issue_ids, start=1)
+            ],
+            update_conflicts=True,
+            unique_fields=["issue"],
+            update_fields=["project", "version", "updated_at"],
+            batch_size=1000,
+        )
+        return counter.version
+
+
+def record_purged_issues(issues):
+    """
+    Raise the purge horizon of the projects before their issues are hard
+    deleted. The tombstones go with the issues, so a client whose cursor is
+    older than the horizon may have missed a deletion and has to sync again.
+    """
+    horizons = (
+        IssueSyncVersion.objects.filter(issue__in=issues)
+        .order_by()
+        .values("project_id")
+        .annotate(version=Max("version"))
+    )
+    for horizon in horizons:
+        ProjectSyncVersion.objects.filter(
+            pk=horizon["project_id"], purged_version__lt=horizon["version"]
+        ).update(purged_version=horizon["version"])
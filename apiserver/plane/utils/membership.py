@@ -0,0 +1,82 @@
+# Django imports
+from django.core.cache import cache
+
+# Module imports
+from plane.db.models import ProjectMember, WorkspaceMember
+
+# Seconds the roles of a user are shared between requests, member changes
+# invalidate them sooner
+MEMBERSHIP_CACHE_TIMEOUT = 60
+
+
+def membership_cache_key(user_id):
+    return f"memberships:{user_id}"
+
+
+def load_memberships(user_id):
+    """
+    The active workspace and project roles of the user keyed by workspace
+    slug, read with one query per member table.
+    """
+    memberships = {}
+    for slug, role in WorkspaceMember.objects.filter(
+        member_id=user_id, is_active=True
+    ).values_list("workspace__slug", "role"):
+        memberships[slug] = {"role": role, "projects": {}, "identifiers": {}}
+
+    for slug, project_id, identifier, role in ProjectMember.objects.filter(
+        member_id=user_id, is_active=True
+    ).values_list("workspace__slug", "project_id", "project__identifier", "role"):
+        workspace = memberships.setdefault(
+            slug, {"role": None, "projects": {}, "identifiers": {}}
+        )
+        workspace["projects"][str(project_id)] = role
+        workspace["identifiers"][identifier] = role
+    return memberships
+
+
+def get_memberships(request):
+    """
+    The roles of the requesting user, loaded once per request and shared
+    between the requests of the user through the cache.
+    """
+    # Keep them on the django request, the rest framework request wraps it
+    http_request = getattr(request, "_request", request)
+    memberships = getattr(http_request, "_memberships", None)
+    if memberships is None:
+        key = membership_cache_key(request.user.id)
+        memberships = cache.get(key)
+        if memberships is None:
+            memberships = load_memberships(request.user.id)
+            cache.set(key, memberships, MEMBERSHIP_CACHE_TIMEOUT)
+        http_request._memberships = memberships
+    return memberships
+
+
+def workspace_role(request, slug):
+    """The active workspace role of the user, None for non members"""
+    if request.user.is_anonymous:
+        return None
+    return get_memberships(request).get(slug, {}).get("role")
+
+
+def project_role(request, slug, project_id=None, identifier=None):
+    """The active project role of the user, None for non members"""
+    if request.user.is_anonymous:
+        return None
+    workspace = get_memberships(request).get(slug, {})
+    if identifier is not None:
+        return workspace.get("identifiers", {}).get(identifier)
+    return workspace.get("projects", {}).get(str(project_id))
+
+
+def is_project_member(request, slug):
+    """Whether the user is an active member of any project of the workspace"""
+    if request.user.is_anonymous:
+        return False
+    return bool(get_memberships(request).get(slug, {}).get("projects"))
+
+
+def invalidate_memberships(*user_ids):
+    """Drop the shared roles of the users after their memberships changed"""
+    cache.delete_many([membership_cache_key(user_id) for user_id in user_ids])
@@ -0,0 +1,151 @@
+# Python imports
+import asyncio
+import json
+import time
+from collections import Counter
+
+# Django imports
+from asgiref.sync import sync_to_async
+from django.db.models import Count, Q
+
+# Module imports
+from plane.db.models import Notification
+from plane.settings.redis import redis_instance
+
+# Seconds the counters live before they are recounted from the notifications,
+# bounding the drift of the incremental updates
+NOTIFICATION_COUNTERS_TIMEOUT = 60 * 60
+
+UNREAD = "unread"
+MENTION = "mention"
+
+# Seconds between the counter reads of an event stream, between its
+# heartbeats and before it closes for the client to reconnect
+STREAM_POLL_INTERVAL = 2
+STREAM_HEARTBEAT_INTERVAL = 15
+STREAM_DURATION = 5 * 60
+
+# Increments only counters that exist, missing ones are recounted on read
+INCREMENT_EXISTING = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    redis.call('HINCRBY', KEYS[1], ARGV[1], ARGV[2])
+end
+"""
+
+
+def notification_counters_key(user_id, slug):
+    return f"notification_counters:{user_id}:{slug}"
+
+
+def counter_field(notification):
+    """The counter the notification adds to, None when it is not counted"""
+    if notification.read_at or notification.archived_at or notification.snoozed_till:
+        return None
+    return MENTION if "mentioned" in (notification.sender or "").lower() else UNREAD
+
+
+def compute_notification_counters(user_id, slug):
+    mentioned = Q(sender__icontains="mentioned")
+    return Notification.objects.filter(
+        workspace__slug=slug,
+        receiver_id=user_id,
+        read_at__isnull=True,
+        archived_at__isnull=True,
+        snoozed_till__isnull=True,
+    ).aggregate(
+        unread=Count("id", filter=~mentioned), mention=Count("id", filter=mentioned)
+    )
+
+
+def get_notification_counters(user_id, slug):
+    """The unread and mention counters of the user in the workspace"""
+    key = notification_counters_key(user_id, slug)
+    ri = redis_instance()
+    values = ri.hgetall(key)
+    if values:
+        return {
+            field.decode(): max(int(value), 0) for field, value in values.items()
+        }
+
+    counters = compute_notification_counters(user_id, slug)
+    with ri.pipeline() as pipe:
+        pipe.hset(key, mapping=counters)
+        pipe.expire(key, NOTIFICATION_COUNTERS_TIMEOUT)
+        pipe.execute()
+    return counters
+
+
+def adjust_notification_counters(deltas):
+    """Apply the {(user_id, slug, field): delta} changes in one round trip"""
+    deltas = {key: delta for key, delta in deltas.items() if delta and key[2]}
+    if not deltas:
+        return
+
+    ri = redis_instance()
+    increment = ri.register_script(INCREMENT_EXISTING)
+    with ri.pipeline(transaction=False) as pipe:
+        for (user_id, slug, field), delta in deltas.items():
+            increment(
+                keys=[notification_counters_key(user_id, slug)],
+                args=[field, delta],
+                client=pipe,
+            )
+        pipe.execute()
+
+
+def track_created_notifications(notifications, slug):
+    """Count the notifications created in the workspace"""
+    adjust_notification_counters(
+        Counter(
+            (str(notification.receiver_id), slug, counter_field(notification))
+            for notification in notifications
+        )
+    )
+
+
+def track_notification_change(notification, previous_field, slug):
+    """Move the notification between the counters after its state changed"""
+    field = counter_field(notification)
+    if field == previous_field:
+        return
+    user_id = str(notification.receiver_id)
+    adjust_notification_counters(
+        {(user_id, slug, previous_field): -1, (user_id, slug, field): 1}
+    )
+
+
+def invalidate_notification_counters(user_id, slug):
+    """Recount the counters of the user on the next read"""
+    redis_instance().delete(notification_counters_key(user_id, slug))
+
+
+def unread_notifications_response(counters):
+    return {
+        "total_unread_notifications_count": int(counters[UNREAD]),
+        "mention_unread_notifications_count": int(counters[MENTION]),
+    }
+
+
+async def notification_counter_events(user_id, slug):
+    """
+    Server sent events with the counters of the user, pushed whenever they
+    change. The counters are read from redis, so an open stream costs no
+    database queries until they expire.
+    """
+    read_counters = sync_to_async(get_notification_counters, thread_sensitive=False)
+    # Reconnect a second after the stream closes
+    yield "retry: 1000\n\n"
+
+    started = last_sent = time.monotonic()
+    previous = None
+    while time.monotonic() - started < STREAM_DURATION:
+        counters = await read_counters(user_id, slug)
+        now = time.monotonic()
+        if counters != previous:
+            data = json.dumps(unread_notifications_response(counters))
+            yield f"event: counters\ndata: {data}\n\n"
+            previous, last_sent = counters, now
+        elif now - last_sent >= STREAM_HEARTBEAT_INTERVAL:
+            yield ": heartbeat\n\n"
+            last_sent = now
+        await asyncio.sleep(STREAM_POLL_INTERVAL)
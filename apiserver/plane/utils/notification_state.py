@@ -0,0 +1,51 @@
+# Django imports
+from django.db.models import Q
+from django.utils import timezone
+
+# Module imports
+from plane.db.models import Notification
+
+# Notifications changed per UPDATE, keeping each statement and its locks short
+NOTIFICATION_UPDATE_BATCH_SIZE = 5000
+
+# The field each action sets and whether it sets it to the current time
+NOTIFICATION_ACTIONS = {
+    "read": ("read_at", True),
+    "unread": ("read_at", False),
+    "archive": ("archived_at", True),
+    "unarchive": ("archived_at", False),
+    "snooze": ("snoozed_till", False),
+}
+
+
+def transition_notifications(notifications, action, snoozed_till=None):
+    """
+    Apply the action to the notifications with set based UPDATEs and return
+    the number of notifications it changed. Notifications already in the
+    target state are left untouched.
+    """
+    field, timestamp = NOTIFICATION_ACTIONS[action]
+    now = timezone.now()
+    if timestamp:
+        value = now
+        pending = Q(**{f"{field}__isnull": True})
+    elif action == "snooze" and snoozed_till is not None:
+        value = snoozed_till
+        pending = Q(snoozed_till__isnull=True) | ~Q(snoozed_till=snoozed_till)
+    else:
+        value = None
+        pending = Q(**{f"{field}__isnull": False})
+
+    # Updated rows drop out of the pending filter, so every batch moves on
+    pending_ids = notifications.filter(pending).order_by().values_list("pk", flat=True)
+    updated = 0
+    while True:
+        batch = list(pending_ids[:NOTIFICATION_UPDATE_BATCH_SIZE])
+        if not batch:
+            break
+        updated += Notification.objects.filter(pk__in=batch).update(
+            **{field: value, "updated_at": now}
+        )
+        if len(batch) < NOTIFICATION_UPDATE_BATCH_SIZE:
+            break
+    return updated
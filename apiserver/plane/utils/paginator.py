@@ -1,10 +1,19 @@
 # Python imports
+import base64
+import hashlib
+import json
 import math
+import uuid
 from collections import defaultdict
 from collections.abc import Sequence
+from datetime import date, datetime
+from decimal import Decimal
+from functools import reduce
+from operator import and_, or_
 
 # Django imports
-from django.db.models import Count, F, Window
+from django.core.cache import cache
+from django.db.models import Count, F, Q, Window
 from django.db.models.functions import RowNumber
 
 # Third party imports
@@ -13,24 +22,77 @@ from rest_framework.response import Response
 
 # Module imports
 
+# Longest position token sent in a cursor, the grouped cursors carry one entry
+# per group and longer tokens are kept server side behind an opaque key
+CURSOR_POSITION_MAX_LENGTH = 512
+CURSOR_POSITION_TIMEOUT = 60 * 60
+# Never part of a url safe base64 token
+STORED_POSITION_PREFIX = "~"
+
+
+def _position_default(value):
+    # Keep full precision for datetimes so equality seeks stay exact
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (uuid.UUID, Decimal)):
+        return str(value)
+    raise TypeError(f"Cannot encode {type(value).__name__} in a cursor")
+
+
+def stored_position_key(key):
+    return f"cursor_position:{key}"
+
+
+def encode_position(position):
+    """Encode a keyset position into a url safe token"""
+    payload = json.dumps(position, default=_position_default, separators=(",", ":"))
+    token = base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+    if len(token) <= CURSOR_POSITION_MAX_LENGTH:
+        return token
+
+    key = hashlib.sha256(token.encode()).hexdigest()[:32]
+    cache.set(stored_position_key(key), token, CURSOR_POSITION_TIMEOUT)
+    return f"{STORED_POSITION_PREFIX}{key}"
+
+
+def decode_position(token):
+    """Decode a keyset position token created by `encode_position`"""
+    if token.startswith(STORED_POSITION_PREFIX):
+        key = token[len(STORED_POSITION_PREFIX) :]
+        token = cache.get(stored_position_key(key))
+        if token is None:
+            raise ValueError("Cursor position expired")
+    padding = "=" * (-len(token) % 4)
+    try:
+        return json.loads(base64.urlsafe_b64decode(token + padding))
+    except (TypeError, ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor position: {e}")
+
 
 class Cursor:
     # The cursor value
-    def __init__(self, value, offset=0, is_prev=False, has_results=None):
+    def __init__(
+        self, value, offset=0, is_prev=False, has_results=None, position=None
+    ):
         self.value = value
         self.offset = int(offset)
         self.is_prev = bool(is_prev)
         self.has_results = has_results
+        # Keyset position of the last row served, only set in keyset mode
+        self.position = position
 
     # Return the cursor value in string format
     def __str__(self):
-        return f"{self.value}:{self.offset}:{int(self.is_prev)}"
+        cursor = f"{self.value}:{self.offset}:{int(self.is_prev)}"
+        if self.position is not None:
+            cursor = f"{cursor}:{encode_position(self.position)}"
+        return cursor
 
     # Return the cursor value
     def __eq__(self, other):
         return all(
             getattr(self, attr) == getattr(other, attr)
-            for attr in ("value", "offset", "is_prev", "has_results")
+            for attr in ("value", "offset", "is_prev", "has_results", "position")
         )
 
     # Return the representation of the cursor
@@ -46,11 +108,14 @@ class Cursor:
         """Return the cursor value from string format"""
         try:
             bits = value.split(":")
-            if len(bits) != 3:
-                raise ValueError("Cursor must be in the format 'value:offset:is_prev'")
+            if len(bits) not in (3, 4):
+                raise ValueError(
+                    "Cursor must be in the format 'value:offset:is_prev[:position]'"
+                )
 
             value = float(bits[0]) if "." in bits[0] else int(bits[0])
-            return cls(value, int(bits[1]), bool(int(bits[2])))
+            position = decode_position(bits[3]) if len(bits) == 4 else None
+            return cls(value, int(bits[1]), bool(int(bits[2])), position=position)
         except (TypeError, ValueError) as e:
             raise ValueError(f"Invalid cursor format: {e}")
 
@@ -93,6 +158,11 @@ class OffsetPaginator:
     with cursor controls
     http://example.com/api/users/?cursor=10.0.0&per_page=10
     cursor=limit,offset=page,
+
+    With `keyset` enabled the next cursor also carries the
+    (order key, created_at, id) of the last row served and the
+    total count, so the following page seeks with a WHERE clause
+    instead of an OFFSET and skips the count queries.
     """
 
     def __init__(
@@ -102,6 +172,7 @@ class OffsetPaginator:
         max_limit=MAX_LIMIT,
         max_offset=None,
         on_results=None,
+        keyset=False,
     ):
         # Key tuple and remove `-` if descending order by
         self.key = (
@@ -115,6 +186,202 @@ class OffsetPaginator:
         self.max_limit = max_limit
         self.max_offset = max_offset
         self.on_results = on_results
+        self.keyset = keyset
+
+    def get_keyset_ordering(self):
+        # Order key, then created_at and id so every row has a unique position
+        ordering = []
+        if self.key:
+            ordering.append(
+                F(*self.key).desc(nulls_last=True)
+                if self.desc
+                else F(*self.key).asc(nulls_last=True)
+            )
+        ordering.extend([F("created_at").desc(), F("id").desc()])
+        return ordering
+
+    def get_position_fields(self):
+        # The fields stored in the cursor for the last row of a page
+        return (["keyset_key"] if self.key else []) + ["created_at", "id"]
+
+    def get_seek_filter(self, position):
+        # Filter for the rows strictly after the position in the keyset ordering
+        if self.key:
+            key_value, created_at, pk = position
+        else:
+            key_value, (created_at, pk) = None, position
+
+        after = Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk)
+        if not self.key:
+            return after
+
+        # Nulls are ordered last in both directions
+        if key_value is None:
+            return Q(keyset_key__isnull=True) & after
+        return (
+            Q(**{"keyset_key__lt" if self.desc else "keyset_key__gt": key_value})
+            | Q(keyset_key__isnull=True)
+            | (Q(keyset_key=key_value) & after)
+        )
+
+    def get_keyset_queryset(self):
+        # Expose the order key under a fixed name to read and filter on it
+        if self.key:
+            return self.queryset.annotate(keyset_key=F(*self.key))
+        return self.queryset
+
+    def get_offset(self, cursor):
+        offset = cursor.offset * cursor.value
+        if self.max_offset is not None and offset >= self.max_offset:
+            raise BadPaginationError("Pagination offset too large")
+        if offset < 0:
+            raise BadPaginationError("Pagination offset cannot be negative")
+        return offset
+
+    def get_keyset_result(self, limit, cursor):
+        page = cursor.offset
+        position = cursor.position or {}
+
+        queryset = self.get_keyset_queryset().order_by(*self.get_keyset_ordering())
+
+        # The total is counted on the first page and then carried by the cursor
+        count = position.get("hits")
+        if count is None:
+            count = queryset.count()
+
+        if position.get("last") is not None:
+            offset = 0
+            queryset = queryset.filter(self.get_seek_filter(position["last"]))
+        else:
+            # Cursors without a position (first page, previous pages) use offsets
+            offset = self.get_offset(cursor)
+
+        page_queryset = queryset[offset : offset + limit + 1]
+        positions = list(page_queryset.values_list(*self.get_position_fields()))
+        has_next = len(positions) > limit
+
+        next_cursor = Cursor(
+            limit,
+            page + 1,
+            False,
+            has_next,
+            position=(
+                {"last": list(positions[limit - 1]), "hits": count}
+                if has_next
+                else None
+            ),
+        )
+        prev_cursor = Cursor(limit, page - 1, True, page > 0)
+
+        results = page_queryset[:limit]
+        if self.on_results:
+            results = self.on_results(results)
+
+        return CursorResult(
+            results=results,
+            next=next_cursor,
+            prev=prev_cursor,
+            hits=count,
+            max_hits=math.ceil(count / limit),
+        )
+
+    def get_group_filter(self, group_names, group_values):
+        # Match a single group, the `None` group holds the rows without a value
+        return reduce(
+            and_,
+            (
+                (
+                    Q(**{f"{name}__isnull": True})
+                    if value is None
+                    else Q(**{name: value})
+                )
+                for name, value in zip(group_names, group_values)
+            ),
+        )
+
+    def get_grouped_keyset_result(self, limit, cursor, group_by_fields, count_filter):
+        # Keyset pagination for the grouped paginators, the cursor keeps the
+        # position of the last row served for every group that has more rows
+        page = cursor.offset
+        position = cursor.position or {}
+        group_names = [f"keyset_group_{index}" for index in range(len(group_by_fields))]
+        width = len(group_names)
+
+        queryset = self.get_keyset_queryset().annotate(
+            **{name: F(field) for name, field in zip(group_names, group_by_fields)}
+        )
+        ordering = self.get_keyset_ordering()
+
+        # The totals are computed on the first page and then carried by the cursor
+        count = position.get("hits")
+        max_hits = position.get("max_hits")
+        if count is None:
+            count = queryset.count()
+            largest_group = (
+                queryset.values(group_by_fields[0])
+                .annotate(count=Count("id", filter=count_filter, distinct=True))
+                .order_by("-count")
+                .first()
+            )
+            max_hits = math.ceil(largest_group["count"] / limit) if largest_group else 0
+
+        groups = position.get("groups")
+        if groups is not None:
+            offset = 0
+            queryset = queryset.filter(
+                reduce(
+                    or_,
+                    (
+                        self.get_group_filter(group_names, entry[:width])
+                        & self.get_seek_filter(entry[width:])
+                        for entry in groups
+                    ),
+                    Q(pk__in=[]),
+                )
+            )
+        else:
+            offset = self.get_offset(cursor)
+        stop = offset + limit
+
+        queryset = queryset.annotate(
+            row_number=Window(
+                expression=RowNumber(),
+                partition_by=[F(name) for name in group_names],
+                order_by=ordering,
+            )
+        )
+        results = queryset.filter(
+            row_number__gt=offset, row_number__lte=stop
+        ).order_by(*ordering)
+
+        # Fetch the last row served and the one after it for every group
+        boundaries = defaultdict(dict)
+        for row in queryset.filter(row_number__in=[stop, stop + 1]).values_list(
+            *group_names, *self.get_position_fields(), "row_number"
+        ):
+            boundaries[row[:width]][row[-1]] = list(row[:-1])
+        next_groups = [rows[stop] for rows in boundaries.values() if stop + 1 in rows]
+
+        next_cursor = Cursor(
+            limit,
+            page + 1,
+            False,
+            bool(next_groups),
+            position=(
+                {"groups": next_groups, "hits": count, "max_hits": max_hits}
+                if next_groups
+                else None
+            ),
+        )
+        prev_cursor = Cursor(limit, page - 1, True, page > 0)
+
+        return CursorResult(
+            results=results,
+            next=next_cursor,
+            prev=prev_cursor,
+            hits=count,
+            max_hits=max_hits,
+        )
 
     def get_result(self, limit=1000, cursor=None):
         # offset is page #
@@ -125,6 +392,9 @@ class OffsetPaginator:
         # Get the min from limit and max limit
         limit = min(limit, self.max_limit)
 
+        if self.keyset:
+            return self.get_keyset_result(limit=limit, cursor=cursor)
+
         # queryset
         queryset = self.queryset
         if self.key:
@@ -208,6 +478,9 @@ class GroupedOffsetPaginator(OffsetPaginator):
         self.group_by_fields = group_by_fields
         # Set the count filter - this are extra filters that need to be passed to calculate the counts with the filters
         self.count_filter = count_filter
+        # Group totals, queried once and shared by the cursor and the groupers
+        self._group_totals = None
+        self._total_dict = None
 
     def get_result(self, limit=50, cursor=None):
         # offset is page #
@@ -217,6 +490,14 @@ class GroupedOffsetPaginator(OffsetPaginator):
 
         limit = min(limit, self.max_limit)
 
+        if self.keyset:
+            return self.get_grouped_keyset_result(
+                limit=limit,
+                cursor=cursor,
+                group_by_fields=[self.group_by_field_name],
+                count_filter=self.count_filter,
+            )
+
         # Adjust the initial offset and stop based on the cursor and limit
         queryset = self.queryset
 
@@ -272,17 +553,11 @@ class GroupedOffsetPaginator(OffsetPaginator):
         # Count the queryset
         count = queryset.count()
 
-        # Optionally, calculate the total count and max_hits if needed
-        # This might require adjustments based on specific use cases
-        if results:
-            max_hits = math.ceil(
-                queryset.values(self.group_by_field_name)
-                .annotate(count=Count("id", filter=self.count_filter, distinct=True))
-                .order_by("-count")[0]["count"]
-                / limit
-            )
-        else:
-            max_hits = 0
+        # The largest group decides the number of pages
+        max_hits = math.ceil(
+            max((group["count"] for group in self.get_group_totals()), default=0)
+            / limit
+        )
         return CursorResult(
             results=results,
             next=next_cursor,
@@ -299,15 +574,23 @@ class GroupedOffsetPaginator(OffsetPaginator):
             .order_by()
         )
 
+    def get_group_totals(self):
+        # Query the group totals once per request
+        if self._group_totals is None:
+            self._group_totals = list(self.__get_total_queryset())
+        return self._group_totals
+
     def __get_total_dict(self):
         # Convert the total into dictionary of keys as group name and value as the total
-        total_group_dict = {}
-        for group in self.__get_total_queryset():
-            total_group_dict[str(group.get(self.group_by_field_name))] = (
-                total_group_dict.get(str(group.get(self.group_by_field_name)), 0)
-                + (1 if group.get("count") == 0 else group.get("count"))
-            )
-        return total_group_dict
+        if self._total_dict is None:
+            total_group_dict = {}
+            for group in self.get_group_totals():
+                total_group_dict[str(group.get(self.group_by_field_name))] = (
+                    total_group_dict.get(str(group.get(self.group_by_field_name)), 0)
+                    + (1 if group.get("count") == 0 else group.get("count"))
+                )
+            self._total_dict = total_group_dict
+        return self._total_dict
 
     def __get_field_dict(self):
         # Create a field dictionary
@@ -320,41 +603,34 @@ class GroupedOffsetPaginator(OffsetPaginator):
             for field in self.group_by_fields
         }
 
-    def __result_already_added(self, result, group):
-        # Check if the result is already added then add it
-        for existing_issue in group:
-            if existing_issue["id"] == result["id"]:
-                return True
-        return False
-
     def __query_multi_grouper(self, results):
         # Grouping for m2m values
         total_group_dict = self.__get_total_dict()
 
         # Preparing a dict to keep track of group IDs associated with each entity ID
         result_group_mapping = defaultdict(set)
+        # The first row of every entity, in the order they are served
+        first_results = {}
         # Preparing a dict to group result by group ID
         grouped_by_field_name = defaultdict(list)
 
         # Iterate over results to fill the above dictionaries
         for result in results:
-            result_id = result["id"]
+            result_id = str(result["id"])
             group_id = result[self.group_by_field_name]
-            result_group_mapping[str(result_id)].add(str(group_id))
+            result_group_mapping[result_id].add(str(group_id))
+            first_results.setdefault(result_id, result)
 
-        # Adding group_ids key to each issue and grouping by group_name
-        for result in results:
-            result_id = result["id"]
-            group_ids = list(result_group_mapping[str(result_id)])
+        # Adding group_ids key to each issue and grouping by group_name, every
+        # entity is visited once so the grouping stays linear in the rows
+        for result_id, result in first_results.items():
+            group_ids = list(result_group_mapping[result_id])
             result[self.FIELD_MAPPER.get(self.group_by_field_name)] = (
                 [] if "None" in group_ids else group_ids
             )
             # If a result belongs to multiple groups, add it to each group
             for group_id in group_ids:
-                if not self.__result_already_added(
-                    result, grouped_by_field_name[group_id]
-                ):
-                    grouped_by_field_name[group_id].append(result)
+                grouped_by_field_name[group_id].append(result)
 
         # Convert grouped_by_field_name back to a list for each group
         processed_results = {
@@ -420,6 +696,10 @@ class SubGroupedOffsetPaginator(OffsetPaginator):
 
         # Set the count filter - this are extra filters that need to be passed to calculate the counts with the filters
         self.count_filter = count_filter
+        # Group and sub group totals, queried once per request
+        self._group_totals = None
+        self._sub_group_totals = None
+        self._total_dict = None
 
     def get_result(self, limit=30, cursor=None):
         # offset is page #
@@ -430,6 +710,17 @@ class SubGroupedOffsetPaginator(OffsetPaginator):
         # get the minimum value
         limit = min(limit, self.max_limit)
 
+        if self.keyset:
+            return self.get_grouped_keyset_result(
+                limit=limit,
+                cursor=cursor,
+                group_by_fields=[
+                    self.group_by_field_name,
+                    self.sub_group_by_field_name,
+                ],
+                count_filter=self.count_filter,
+            )
+
         # Adjust the initial offset and stop based on the cursor and limit
         queryset = self.queryset
 
@@ -490,17 +781,11 @@ class SubGroupedOffsetPaginator(OffsetPaginator):
         # Count the queryset
         count = queryset.count()
 
-        # Optionally, calculate the total count and max_hits if needed
-        # This might require adjustments based on specific use cases
-        if results:
-            max_hits = math.ceil(
-                queryset.values(self.group_by_field_name)
-                .annotate(count=Count("id", filter=self.count_filter, distinct=True))
-                .order_by("-count")[0]["count"]
-                / limit
-            )
-        else:
-            max_hits = 0
+        # The largest group decides the number of pages
+        max_hits = math.ceil(
+            max((group["count"] for group in self.get_group_totals()), default=0)
+            / limit
+        )
         return CursorResult(
             results=results,
             next=next_cursor,
@@ -527,18 +812,35 @@ class SubGroupedOffsetPaginator(OffsetPaginator):
             .values(self.group_by_field_name, self.sub_group_by_field_name, "count")
         )
 
+    def get_group_totals(self):
+        # Query the group totals once per request
+        if self._group_totals is None:
+            self._group_totals = list(self.__get_group_total_queryset())
+        return self._group_totals
+
+    def get_sub_group_totals(self):
+        # Query the sub group totals once per request
+        if self._sub_group_totals is None:
+            self._sub_group_totals = list(self.__get_subgroup_total_queryset())
+        return self._sub_group_totals
+
     def __get_total_dict(self):
+        if self._total_dict is None:
+            self._total_dict = self.__build_total_dict()
+        return self._total_dict
+
+    def __build_total_dict(self):
         # Use the above to convert to dictionary of 2D objects
         total_group_dict = {}
         total_sub_group_dict = {}
-        for group in self.__get_group_total_queryset():
+        for group in self.get_group_totals():
             total_group_dict[str(group.get(self.group_by_field_name))] = (
                 total_group_dict.get(str(group.get(self.group_by_field_name)), 0)
                 + (1 if group.get("count") == 0 else group.get("count"))
             )
 
         # Sub group total values
-        for item in self.__get_subgroup_total_queryset():
+        for item in self.get_sub_group_totals():
             group = str(item[self.group_by_field_name])
             subgroup = str(item[self.sub_group_by_field_name])
             count = item["count"]
@@ -663,6 +965,9 @@ class BasePaginator:
     # cursor query parameter name
     cursor_name = "cursor"
 
+    # query parameter to opt into keyset (seek) cursors
+    cursor_mode_name = "cursor_mode"
+
     # get the per page parameter from request
     def get_per_page(self, request, default_per_page=1000, max_per_page=1000):
         try:
@@ -708,6 +1013,10 @@ class BasePaginator:
             raise ParseError(detail="Invalid cursor parameter.")
 
         if not paginator:
+            # Keyset cursors are opt in as clients build offset cursors themselves
+            if request.GET.get(self.cursor_mode_name) == "keyset":
+                paginator_kwargs["keyset"] = True
+
             if group_by_field_name:
                 paginator_kwargs["group_by_field_name"] = group_by_field_name
                 paginator_kwargs["group_by_fields"] = group_by_fields
@@ -0,0 +1,94 @@
+# Python imports
+import re
+
+# Django imports
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    TrigramSimilarity,
+)
+from django.db.models import Q
+from django.db.models.functions import Upper
+
+# Text search configuration of the indexes, words are kept as typed so any
+# language and partial words can be matched
+SEARCH_CONFIG = "simple"
+
+# Maximum number of ranked candidates handed over to the permission filters
+SEARCH_CANDIDATE_LIMIT = 500
+
+
+def search_indexes(prefix, field="name"):
+    """
+    The full text and trigram indexes backing `search_candidates`, the
+    expressions match the ones the queries filter on.
+    """
+    return [
+        GinIndex(
+            SearchVector(field, config=SEARCH_CONFIG),
+            name=f"{prefix}_{field}_search_idx",
+        ),
+        # icontains compares UPPER(field) so the trigrams are built on it
+        GinIndex(
+            OpClass(Upper(field), name="gin_trgm_ops"),
+            name=f"{prefix}_{field}_trgm_idx",
+        ),
+    ]
+
+
+def prefix_search_query(query):
+    """Match every word of the query as a prefix"""
+    terms = re.findall(r"\w+", query)
+    if not terms:
+        return None
+    return SearchQuery(
+        " & ".join(f"{term}:*" for term in terms),
+        config=SEARCH_CONFIG,
+        search_type="raw",
+    )
+
+
+def search_rank(query, field="name"):
+    """Rank by full text relevance and trigram similarity"""
+    rank = TrigramSimilarity(field, query)
+    search_query = prefix_search_query(query)
+    if search_query is not None:
+        rank = rank + SearchRank(
+            SearchVector(field, config=SEARCH_CONFIG), search_query
+        )
+    return rank
+
+
+def search_candidates(queryset, query, field="name", extra=None):
+    """
+    Return the ids of the best matching rows of the queryset. Only the
+    indexed columns are filtered here, callers apply the permission joins on
+    the capped candidates.
+    """
+    match = Q(**{f"{field}__icontains": query})
+    search_query = prefix_search_query(query)
+    if search_query is not None:
+        queryset = queryset.annotate(
+            search_vector=SearchVector(field, config=SEARCH_CONFIG)
+        )
+        match |= Q(search_vector=search_query)
+    if extra is not None:
+        match |= extra
+
+    return (
+        queryset.filter(match)
+        .annotate(search_rank=search_rank(query, field))
+        .order_by("-search_rank")
+        .values_list("id", flat=True)[:SEARCH_CANDIDATE_LIMIT]
+    )
+
+
+def search(queryset, candidates, query, field="name", extra=None):
+    """Filter the queryset to the ranked candidates, best matches first"""
+    return (
+        queryset.filter(pk__in=search_candidates(candidates, query, field, extra))
+        .annotate(search_rank=search_rank(query, field))
+        .order_by("-search_rank")
+    )